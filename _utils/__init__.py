@@ -1,3 +1,9 @@
-from _utils.typing import *
-from _utils.validate import *
-from _utils.keyword import *
\ No newline at end of file
+from _utils.lazy import lazy_exports
+
+# modules are imported on first access, `_utils.validate` loads `varname` only to format validation errors
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "_utils.typing": ("RealNumber", "ListLike", "PathLike", "Version"),
+    "_utils.validate": ("VALIDATION_MODES", "VALIDATION_MODE_ENV", "LogWarning", "get_validation_mode", "set_validation_mode",
+                        "val_instance", "val_subclass", "defval_instance", "defval_subclass"),
+    "_utils.keyword": ("kwlist", "softkwlist", "iskeyword", "issofkeyword")
+})
@@ -0,0 +1,48 @@
+"""
+Module that stores the lazy exports of packages.
+
+Package `__init__` modules declare the names they export by submodule, a submodule is imported on the first access to
+one of its names (module `__getattr__`, PEP 562), so importing a package doesn't import its dependencies until they are used.
+
+    __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+        "bot.bot": ("Bot",),
+        "bot.datastream": ("DataStream", "TickChunk")
+    })
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable
+
+
+def lazy_exports(package: str, exports: dict[str, Iterable[str]]) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """
+    Generate the module `__getattr__` and `__dir__` functions and the `__all__` list of a package exporting names lazily.
+
+    Args:
+        package (str): name of the package, `__name__` of its `__init__` module.
+        exports (dict[str, Iterable[str]]): names exported by the package, by name of the submodule defining them.
+
+    Returns:
+        tuple[Callable[[str], object], Callable[[], list[str]], list[str]]: `__getattr__`, `__dir__` and `__all__`.
+    """
+
+    _namespace = sys.modules[package].__dict__
+    _modules = {_name: _module for _module, _names in exports.items() for _name in _names}
+
+    def __getattr__(name: str) -> object:
+        try:
+            _module = _modules[name]
+        except KeyError:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+
+        _value = getattr(importlib.import_module(_module), name)
+        # later accesses are plain module attribute lookups
+        _namespace[name] = _value
+
+        return _value
+
+    def __dir__() -> list[str]:
+        return sorted(set(_namespace) | set(_modules))
+
+    return __getattr__, __dir__, list(_modules)
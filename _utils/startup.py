@@ -0,0 +1,84 @@
+"""
+Module that stores the import time benchmark of the packages.
+
+Every run imports the modules in a new interpreter, the benchmark fails (exit status 1) if the median import time
+exceeds the startup budget:
+
+    python -m _utils.startup
+    python -m _utils.startup --budget 0.02 --runs 20 strategy bot brokers backtest
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+# modules imported by the benchmark
+STARTUP_MODULES = ("strategy", "bot", "brokers", "backtest")
+
+# maximum median import time in seconds
+STARTUP_BUDGET = 0.05
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SCRIPT = "import time; _start = time.perf_counter(); {statement}; print(time.perf_counter() - _start)"
+
+
+def statement_time(statement: str, runs: int = 10) -> list[float]:
+    """
+    Time a statement, e.g. `from bot import Bot`, in new interpreters.
+
+    Args:
+        statement (str): timed statement.
+        runs (int, optional): number of interpreters. Defaults to 10.
+
+    Returns:
+        list[float]: time of every run in seconds.
+    """
+
+    _script = _SCRIPT.format(statement=statement)
+
+    return [float(subprocess.run([sys.executable, "-c", _script], cwd=_ROOT, check=True, capture_output=True, text=True).stdout)
+            for _ in range(runs)]
+
+
+def import_time(modules: tuple[str] = STARTUP_MODULES, runs: int = 10) -> list[float]:
+    """
+    Time the import of modules in new interpreters.
+
+    Args:
+        modules (tuple[str], optional): imported modules. Defaults to `STARTUP_MODULES`.
+        runs (int, optional): number of interpreters. Defaults to 10.
+
+    Returns:
+        list[float]: import time of every run in seconds.
+    """
+
+    return statement_time(f"import {', '.join(modules)}", runs)
+
+
+def main(argv: list[str] | None = None) -> int:
+    _parser = argparse.ArgumentParser(prog="python -m _utils.startup", description="import time benchmark of the packages.")
+    _parser.add_argument("modules", nargs="*", default=STARTUP_MODULES, help="imported modules.")
+    _parser.add_argument("--budget", type=float, default=STARTUP_BUDGET, help="maximum median import time in seconds.")
+    _parser.add_argument("--runs", type=int, default=10, help="number of interpreters.")
+    _args = _parser.parse_args(argv)
+
+    _times = import_time(tuple(_args.modules), _args.runs)
+    _median = statistics.median(_times)
+
+    print(f"import {', '.join(_args.modules)}: median {_median * 1e3:.2f} ms, min {min(_times) * 1e3:.2f} ms, "
+          f"max {max(_times) * 1e3:.2f} ms over {len(_times)} runs, budget {_args.budget * 1e3:.2f} ms.")
+
+    if _median > _args.budget:
+        print(f"startup budget exceeded by {(_median - _args.budget) * 1e3:.2f} ms.", file=sys.stderr)
+
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
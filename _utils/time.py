@@ -1,6 +1,178 @@
 """
-Module that stores the time utilities.    
+Module that stores the time utilities.
+
+`parse_time` parses ISO-8601 and common exchange timestamps ('20240102 09:30:00', '20240102-09:30:00.123',
+'2024/01/02 09:30:00') without dateutil, which is only used as a fallback for every other format.
 """
 
-# parse time function
-from dateutil.parser._parser import parse as parse_time
\ No newline at end of file
+import datetime as dt
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+
+# ISO-8601 timestamps `dt.datetime.fromisoformat` parses
+_ISO_8601 = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?(Z|[+-]\d{2}:\d{2})?")
+
+# compact and exchange timestamps, fractions up to nanoseconds (truncated to microseconds)
+_EXCHANGE = re.compile(
+    r"(\d{4})/?(\d{2})/?(\d{2})(?:[ T-](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,9}))?)?)?(Z)?")
+
+# default size of the parsed timestamp cache
+TIME_CACHE_SIZE = 4096
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_MICROSECOND = dt.timedelta(microseconds=1)
+
+# clock used for 'now' times
+_clock: Callable[[dt.tzinfo], dt.datetime] = lambda tz: dt.datetime.now(tz=tz)
+
+
+def now(tz: dt.tzinfo | None = None) -> dt.datetime:
+    """
+    Get the current time from the clock set by `set_clock()`.
+
+    Args:
+        tz (dt.tzinfo | None, optional): timezone. Defaults to None.
+
+    Returns:
+        dt.datetime: current time.
+    """
+
+    return _clock(tz)
+
+
+def set_clock(clock: Callable[[dt.tzinfo], dt.datetime] | None) -> None:
+    """
+    Set the clock used by `now()`, e.g. a simulated clock in backtests or a stub when profiling.
+
+    Args:
+        clock (Callable[[dt.tzinfo], dt.datetime] | None): function of a timezone returning the current time, None resets to the system clock.
+    """
+
+    global _clock
+
+    if clock is None:
+        _clock = lambda tz: dt.datetime.now(tz=tz)
+    else:
+        _clock = clock
+
+
+def epoch_ns(time: dt.datetime) -> int:
+    """
+    Convert a datetime to epoch nanoseconds, naive datetimes are read as UTC.
+
+    Args:
+        time (dt.datetime): datetime.
+
+    Returns:
+        int: epoch nanoseconds.
+    """
+
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=dt.timezone.utc)
+
+    return (time - _EPOCH) // _MICROSECOND * 1000
+
+
+def _parse_fast(timestr: str) -> dt.datetime | None:
+    """
+    Parse ISO-8601 and exchange timestamps.
+
+    Args:
+        timestr (str): timestamp.
+
+    Returns:
+        dt.datetime | None: parsed timestamp, None if `timestr` is not in a supported format.
+    """
+
+    _match = _ISO_8601.fullmatch(timestr)
+
+    if _match:
+        if _match.group(1) == "Z":
+            timestr = timestr[:-1] + "+00:00"
+
+        return dt.datetime.fromisoformat(timestr)
+
+    _match = _EXCHANGE.fullmatch(timestr)
+
+    if _match:
+        _year, _month, _day, _hour, _minute, _second, _fraction, _utc = _match.groups()
+
+        return dt.datetime(
+            int(_year), int(_month), int(_day),
+            int(_hour or 0), int(_minute or 0), int(_second or 0),
+            int(_fraction[:6].ljust(6, "0")) if _fraction else 0,
+            tzinfo=dt.timezone.utc if _utc else None
+        )
+
+    return None
+
+
+_parse_fast_cached = lru_cache(maxsize=TIME_CACHE_SIZE)(_parse_fast)
+
+
+def set_time_cache(maxsize: int | None) -> None:
+    """
+    Set the size of the LRU cache of timestamps parsed by `parse_time`.
+    Only timestamps parsed without dateutil are cached, the cache is cleared.
+
+    Args:
+        maxsize (int | None): maximum number of cached timestamps, 0 disables the cache, None makes it unbounded.
+    """
+
+    global _parse_fast_cached
+
+    if maxsize == 0:
+        _parse_fast_cached = _parse_fast
+    else:
+        _parse_fast_cached = lru_cache(maxsize=maxsize)(_parse_fast)
+
+
+def parse_time(timestr: str, **kwargs: Any) -> dt.datetime:
+    """
+    Parse a timestamp.
+
+    Args:
+        timestr (str): timestamp.
+        kwargs (Any): `dateutil.parser.parse` keyword arguments, if given the timestamp is always parsed by dateutil.
+
+    Returns:
+        dt.datetime: parsed timestamp.
+    """
+
+    if not kwargs:
+        _time = _parse_fast_cached(timestr)
+
+        if not _time is None:
+            return _time
+
+    # dateutil is slow to import and to parse, only load it when it's needed
+    from dateutil.parser._parser import parse
+
+    return parse(timestr, **kwargs)
+
+
+def parse_times(timestrs: Iterable[str]) -> list[dt.datetime]:
+    """
+    Parse timestamps in bulk, each distinct timestamp is only parsed once.
+
+    Args:
+        timestrs (Iterable[str]): timestamps.
+
+    Returns:
+        list[dt.datetime]: parsed timestamps.
+    """
+
+    _parsed: dict = {}
+    _times = []
+
+    for _timestr in timestrs:
+        try:
+            _times.append(_parsed[_timestr])
+        except KeyError:
+            _time = _parsed[_timestr] = parse_time(_timestr)
+            _times.append(_time)
+
+    return _times
@@ -1,11 +1,39 @@
 """
 Module for type validation.
+
+The cost of validation is controlled by a global validation mode:
+
+    - "strict": the type specification is validated and normalized on every call.
+    - "fast": type specifications are normalized once and cached, a passing check is a bare `isinstance`.
+    - "off": validation is skipped entirely.
+
+The mode defaults to "fast" and can be set through the `ODIN_VALIDATION` environment variable
+(read at import time) or through `set_validation_mode()`.
 """
 
-from varname import argname
+import os
 from typing import Type, Union, Any, get_origin, get_args
 from types import UnionType
-from typing import Any, Type, Union
+
+
+# valid validation modes
+VALIDATION_MODES = ("strict", "fast", "off")
+
+# environment variable used to set the validation mode at import time
+VALIDATION_MODE_ENV = "ODIN_VALIDATION"
+
+# normalized type specifications, keyed by the original specification
+_TYPE_CACHE: dict = {}
+
+
+def __getattr__(name: str) -> Any:
+    # `argname` is imported on first use, see `val_instance()`
+    if name == "argname":
+        from varname import argname
+
+        return argname
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 class LogWarning(Exception):
@@ -24,6 +52,129 @@ class LogWarning(Exception):
         print(f"WARNING: {__message}")
 
 
+def _check_mode(mode: str) -> str:
+    """
+    Validates a validation mode.
+
+    Args:
+        mode (str): validation mode.
+
+    Raises:
+        ValueError: If `mode` is not one of `VALIDATION_MODES`.
+
+    Returns:
+        str: lower case validation mode.
+    """
+
+    if not isinstance(mode, str) or not mode.lower() in VALIDATION_MODES:
+        raise ValueError(
+            f"expected one of {VALIDATION_MODES} for `mode` got '{mode}'.")
+
+    return mode.lower()
+
+
+_mode: str = _check_mode(os.environ.get(VALIDATION_MODE_ENV, "fast"))
+
+
+def get_validation_mode() -> str:
+    """
+    Get the global validation mode.
+
+    Returns:
+        str: "strict", "fast" or "off".
+    """
+
+    return _mode
+
+
+def set_validation_mode(mode: str) -> None:
+    """
+    Set the global validation mode.
+
+    Args:
+        mode (str): "strict", "fast" or "off".
+
+    Raises:
+        ValueError: If `mode` is not a valid validation mode.
+    """
+
+    global _mode
+
+    _mode = _check_mode(mode)
+
+
+def _flatten_type(_type: Any) -> list:
+    """
+    Break a type specification down into a list of types.
+
+    Args:
+        _type (Any): type specification.
+
+    Raises:
+        TypeError: If `_type` is not a valid type specification.
+
+    Returns:
+        list: list of types.
+    """
+
+    if isinstance(_type, tuple):
+        _types = []
+
+        for _t in _type:
+            _types += _flatten_type(_t)
+
+        return _types
+
+    if isinstance(_type, UnionType) or get_origin(_type) == Union:
+        return _flatten_type(get_args(_type))
+
+    if isinstance(_type, type):
+        return [_type]
+
+    # typing aliases such as `typing.Callable` are checked against their origin
+    _origin = get_origin(_type)
+
+    if isinstance(_origin, type):
+        return [_origin]
+
+    raise TypeError(
+        f"Expected `{(Type, type, UnionType, tuple)}` for `_type`, got `{type(_type)}`.")
+
+
+def _normalize_type(_type: Type | type | UnionType | tuple) -> tuple[tuple, str]:
+    """
+    Normalize a type specification to a tuple of types usable by `isinstance` and
+    `issubclass` and the string used in error messages.
+
+    Args:
+        _type (Type | type | UnionType | tuple): type specification.
+
+    Returns:
+        tuple[tuple, str]: tuple of types and expected types string.
+    """
+
+    if _mode == "strict":
+        _types = tuple(_flatten_type(_type))
+
+        return _types, ', '.join([v.__name__ for v in _types])
+
+    try:
+        return _TYPE_CACHE[_type]
+    except KeyError:
+        pass
+    except TypeError:
+        # unhashable type specification, can't be cached
+        _types = tuple(_flatten_type(_type))
+
+        return _types, ', '.join([v.__name__ for v in _types])
+
+    _types = tuple(_flatten_type(_type))
+    _normalized = _TYPE_CACHE[_type] = (
+        _types, ', '.join([v.__name__ for v in _types]))
+
+    return _normalized
+
+
 def val_instance(__o: Any, _type: Type | type | UnionType | tuple) -> None:
     """
     Validates instance.
@@ -36,32 +187,15 @@ def val_instance(__o: Any, _type: Type | type | UnionType | tuple) -> None:
         TypeError: If the __object <__o> is not an instance of <_type>.
     """
 
-    _exp = None
-
-    if get_origin(_type) == Union:
-        _type = get_args(_type)
-        _exp = ', '.join([v.__name__ for v in _type])
-    elif isinstance(_type, tuple):
-        # If it's a tuple, break every union type down into inidividual types.
-        _types = []
-
-        for _t in _type:
-            if get_origin(_t) == Union:
-                _types += list(get_args(_t))
-            else:
-                _types.append(_t)
+    if _mode == "off":
+        return
 
-        _exp = ', '.join([v.__name__ for v in _types])
-    elif not isinstance(_type, (Type, type, UnionType)):
-        raise TypeError(
-            f"Expected `{(Type, type, UnionType, tuple)}` for `_type`, got `{type(_type)}`.")
+    _types, _expected = _normalize_type(_type)
 
-    if not _exp:
-        _expected = _type.__name__
-    else:
-        _expected = _exp
+    if not isinstance(__o, _types):
+        # varname is slow to import, only load it to name the argument of a failed validation
+        from varname import argname
 
-    if not isinstance(__o, _type):
         raise TypeError(
             f"Expected `{_expected}` for `{argname('__o')}`, got `{type(__o).__name__}`.")
 
@@ -78,32 +212,14 @@ def val_subclass(__o: Any, _type: Type | type | UnionType | tuple) -> None:
         TypeError: If the __object <__o> is not a subclass of <_type>.
     """
 
-    _exp = None
+    if _mode == "off":
+        return
 
-    if get_origin(_type) == Union:
-        _type = get_args(_type)
-        _exp = ', '.join([v.__name__ for v in _type])
-    elif isinstance(_type, tuple):
-        # If it's a tuple, break every union type down into individual types.
-        _types = []
+    _types, _expected = _normalize_type(_type)
 
-        for _t in _type:
-            if get_origin(_t) == Union:
-                _types += list(get_args(_t))
-            else:
-                _types.append(_t)
-
-        _exp = ', '.join([v.__name__ for v in _types])
-    elif not isinstance(_type, (Type, type, UnionType)):
-        raise TypeError(
-            f"Expected `{(Type, type, UnionType, tuple)}` for `_type`, got `{type(_type)}`.")
-
-    if not _exp:
-        _expected = _type.__name__
-    else:
-        _expected = _exp
+    if not issubclass(__o.__class__, _types):
+        from varname import argname
 
-    if not issubclass(__o.__class__, _type):
         raise TypeError(
             f"Expected `{_expected}` for `{argname('__o')}`, got `{__o.__class__}`.")
 
@@ -0,0 +1,8 @@
+from _utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "backtest.data": ("TickData",),
+    "backtest.base": ("Backtester", "BacktestResult", "TRADE_DTYPE"),
+    "backtest.replay": ("TickFile", "ReplayStream", "write_ticks", "TICK_DTYPE"),
+    "backtest.sweep": ("Sweep", "SweepResult", "grid", "random_search")
+})
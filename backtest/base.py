@@ -0,0 +1,316 @@
+"""
+Module that stores the Backtester, which replays historical ticks through a Strategy.
+"""
+
+from types import NoneType
+from typing import Any
+
+import numpy as np
+
+from _utils.validate import val_instance
+from backtest.data import TickData
+from brokers.order import Order
+from brokers.simulated import SimulatedBroker
+from strategy.base import Strategy
+from strategy.protocol.base import StrategyResponse
+from strategy.protocol.batch import COMMANDS, COMMAND_CODES, NULL_CODE, NULL_INT, ResponseBatch
+from strategy.protocol.trade import TRADE_DTYPE, Trades
+from strategy.vector import VectorStrategy
+
+
+class BacktestResult:
+    """
+    Result of a backtest.
+
+    `responses` holds the responses emitted by the strategy, with the time of the tick they were emitted at and,
+    if the response has no price, the price of that tick. `trades` holds the closed trades (`TRADE_DTYPE`) of one unit each.
+    """
+
+    @property
+    def responses(self) -> ResponseBatch:
+        return self._responses
+
+    @property
+    def trades(self) -> np.ndarray:
+        return self._trades
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def fed(self) -> int:
+        return self._fed
+
+    @property
+    def open(self) -> int:
+        return self._open
+
+    @property
+    def pnl(self) -> float:
+        return float(self._trades["pnl"].sum())
+
+    def __init__(self, responses: ResponseBatch, trades: np.ndarray, ticks: int, fed: int, open: int) -> None:
+        """
+        Create a BacktestResult.
+
+        Args:
+            responses (ResponseBatch): emitted responses.
+            trades (np.ndarray): closed trades, `TRADE_DTYPE` records.
+            ticks (int): number of replayed ticks.
+            fed (int): number of ticks `Strategy.__feed__()` accepted.
+            open (int): number of BUY responses left without a SELL.
+        """
+
+        self._responses = responses
+        self._trades = trades
+        self._ticks = ticks
+        self._fed = fed
+        self._open = open
+
+    def __str__(self) -> str:
+        return f"{self._ticks} ticks, {self._fed} fed, {len(self._responses)} responses, {len(self._trades)} trades ({self._open} open), pnl {self.pnl}"
+
+
+class Backtester:
+    """
+    Replays historical ticks through a Strategy as `__feed__(time, price)` and `next(time, price)` calls
+    in a tight loop without per tick I/O. Times are passed as naive UTC datetimes.
+
+    VectorStrategy objects are evaluated in chunks through `feed_mask()` and `generate()` instead.
+    """
+
+    @property
+    def strategy(self) -> Strategy:
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, strategy: Strategy) -> None:
+        val_instance(strategy, Strategy)
+
+        self._strategy = strategy
+
+    @strategy.deleter
+    def strategy(self) -> None:
+        raise AttributeError("Cannot delete `strategy` attribute.")
+
+    @property
+    def data(self) -> TickData:
+        return self._data
+
+    @data.setter
+    def data(self, data: TickData) -> None:
+        val_instance(data, TickData)
+
+        self._data = data
+
+    @data.deleter
+    def data(self) -> None:
+        raise AttributeError("Cannot delete `data` attribute.")
+
+    def __init__(self, strategy: Strategy, data: TickData, chunk_size: int = 1 << 16, keep_holds: bool = False,
+                 broker: SimulatedBroker | NoneType = None) -> None:
+        """
+        Create a Backtester.
+
+        Args:
+            strategy (Strategy): strategy to be replayed.
+            data (TickData): historical ticks.
+            chunk_size (int, optional): number of ticks converted to python objects, or passed to `VectorStrategy.generate()`, at once. Defaults to 65536.
+            keep_holds (bool, optional): keep HOLD responses in the result. Defaults to False.
+            broker (SimulatedBroker | NoneType, optional): broker executing a market order of one unit for every BUY and SELL response,
+                the uid of an order is the index of its response in `BacktestResult.responses`. Defaults to None.
+        """
+
+        val_instance(chunk_size, int)
+        val_instance(keep_holds, bool)
+        val_instance(broker, (SimulatedBroker, NoneType))
+
+        self._strategy = None
+        self._data = None
+
+        self.strategy = strategy
+        self.data = data
+
+        self._chunk_size = chunk_size
+        self._keep_holds = keep_holds
+        self._broker = broker
+
+    def run(self) -> BacktestResult:
+        """
+        Replay every tick through the strategy.
+
+        Returns:
+            BacktestResult
+        """
+
+        if isinstance(self._strategy, VectorStrategy):
+            return self._run_vector()
+
+        feed = self._strategy.__feed__
+        next_ = self._strategy.next
+        keep_holds = self._keep_holds
+
+        # a declarative feed filter is evaluated over every tick at once, only fed ticks are replayed
+        if type(self._strategy).__feed__ is Strategy.__feed__ and not self._strategy.feed_filter is None:
+            fed_indices = np.flatnonzero(self._strategy.feed_filter.mask(self._data.time))
+            feed = None
+        else:
+            fed_indices = None
+
+        indices: list[int] = []
+        responses: list[StrategyResponse] = []
+        fed = 0
+
+        count = len(self._data) if fed_indices is None else len(fed_indices)
+
+        for start in range(0, count, self._chunk_size):
+            stop = start + self._chunk_size
+
+            # converting a chunk at once is far cheaper than converting tick by tick
+            if fed_indices is None:
+                chunk = range(start, min(stop, count))
+                times: list = self._data.time[start:stop].astype("datetime64[us]").tolist()
+                prices: list = self._data.price[start:stop].tolist()
+            else:
+                chunk = fed_indices[start:stop]
+                times: list = self._data.time[chunk].astype("datetime64[us]").tolist()
+                prices: list = self._data.price[chunk].tolist()
+                chunk = chunk.tolist()
+
+            for index, time, price in zip(chunk, times, prices):
+                if feed is None or feed(time, price):
+                    fed += 1
+                    response: Any = next_(time, price)
+
+                    if not response is None and (keep_holds or response._command != "HOLD"):
+                        indices.append(index)
+                        responses.append(response)
+
+        indices = np.array(indices, dtype=np.int64)
+        batch = _tick_batch(ResponseBatch.from_responses(responses), self._data, indices)
+        trades, open = _pair(batch)
+
+        if not self._broker is None:
+            _simulate(self._broker, self._data, batch, indices, self._chunk_size)
+
+        return BacktestResult(batch, trades, len(self._data), fed, open)
+
+    def _run_vector(self) -> BacktestResult:
+        """
+        Evaluate a VectorStrategy over the fed ticks in chunks, each chunk is preceded by `lookback` fed ticks.
+        """
+
+        strategy: VectorStrategy = self._strategy
+        lookback = strategy.lookback
+
+        fed_indices = np.flatnonzero(strategy.feed_mask(self._data.time, self._data.price))
+        times = self._data.time[fed_indices]
+        prices = self._data.price[fed_indices]
+
+        commands = np.empty(len(fed_indices), dtype=np.uint8)
+
+        for start in range(0, len(fed_indices), self._chunk_size):
+            stop = start + self._chunk_size
+            warmup = min(start, lookback)
+
+            commands[start:stop] = strategy.generate(
+                times[start - warmup:stop], prices[start - warmup:stop])[warmup:]
+
+        keep = np.ones(len(commands), dtype=bool) if self._keep_holds else commands != COMMAND_CODES["HOLD"]
+        indices = fed_indices[keep]
+
+        batch = ResponseBatch(
+            time=self._data.time[indices],
+            price=self._data.price[indices],
+            command=commands[keep],
+            uid=np.full(len(indices), NULL_INT, dtype=np.int64),
+            ticker=np.full(len(indices), NULL_CODE, dtype=np.int32),
+            exchange=np.full(len(indices), NULL_CODE, dtype=np.int32)
+        )
+        trades, open = _pair(batch)
+
+        if not self._broker is None:
+            _simulate(self._broker, self._data, batch, indices, self._chunk_size)
+
+        return BacktestResult(batch, trades, len(self._data), len(fed_indices), open)
+
+
+def _tick_batch(batch: ResponseBatch, data: TickData, indices: np.ndarray) -> ResponseBatch:
+    """
+    Set the time of every response to the time of the tick it was emitted at and fill missing prices with the tick price.
+    """
+
+    _price = batch.price
+
+    return ResponseBatch(
+        time=data.time[indices],
+        price=np.where(np.isnan(_price), data.price[indices], _price),
+        command=batch.command,
+        uid=batch.uid,
+        ticker=batch.ticker,
+        exchange=batch.exchange,
+        tickers=batch.tickers,
+        exchanges=batch.exchanges
+    )
+
+
+def _pair(batch: ResponseBatch) -> tuple[np.ndarray, int]:
+    """
+    Pair BUY responses with later SELL responses, by uid if the SELL has one and first in first out per ticker otherwise.
+
+    Returns:
+        tuple[np.ndarray, int]: closed trades (`TRADE_DTYPE`) and the number of BUY responses left open.
+    """
+
+    trades = Trades(batch.tickers)
+    trades.update_batch(batch)
+
+    return trades.closed.copy(), trades.open_count
+
+
+def _simulate(broker: SimulatedBroker, data: TickData, batch: ResponseBatch, indices: np.ndarray, chunk_size: int) -> None:
+    """
+    Replay the ticks through a SimulatedBroker, a market order is placed for every BUY and SELL response right after
+    the tick it was emitted at. The ticks of every ticker the responses refer to are the ticks of `data`,
+    ticks are skipped while the broker has no pending or open order.
+    """
+
+    orders = np.flatnonzero(batch.command != COMMAND_CODES["HOLD"])
+    order_ticks: list = indices[orders].tolist()
+    sides: list = [COMMANDS[_command] for _command in batch.command[orders].tolist()]
+    tickers: list = [None if _code == NULL_CODE else batch.tickers[_code] for _code in batch.ticker[orders].tolist()]
+    orders: list = orders.tolist()
+    books = sorted(set(tickers), key=str)
+
+    _time = data.time.view(np.int64)
+    on_tick = broker.on_tick
+    count = len(orders)
+    next_order = 0
+    start = 0
+
+    while start < len(data) and (next_order < count or not broker.idle):
+        if broker.idle:
+            start = order_ticks[next_order]
+
+        stop = start + chunk_size
+        times: list = _time[start:stop].tolist()
+        prices: list = data.price[start:stop].tolist()
+        volumes: list = [None] * len(times) if data.volume is None else data.volume[start:stop].tolist()
+
+        for offset, (time, price, volume) in enumerate(zip(times, prices, volumes)):
+            index = start + offset
+
+            for ticker in books:
+                on_tick(ticker, time, price, volume)
+
+            while next_order < count and order_ticks[next_order] == index:
+                broker.place_order(Order.fast(orders[next_order], sides[next_order], ticker=tickers[next_order]), time)
+                next_order += 1
+
+            if broker.idle and (next_order == count or order_ticks[next_order] > index + 1):
+                # skip to the tick of the next order
+                stop = index + 1
+                break
+
+        start = stop
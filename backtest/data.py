@@ -0,0 +1,153 @@
+"""
+Module that stores the historical tick data container used by backtests.
+"""
+
+import csv
+from types import NoneType
+
+import numpy as np
+
+from _utils.time import epoch_ns, parse_times
+from _utils.typing import PathLike
+from _utils.validate import val_instance
+
+
+class TickData:
+    """
+    Time sorted historical ticks stored as NumPy columns: `time` (datetime64[ns], UTC) and `price` (float64),
+    and optionally `volume` (float64).
+    """
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._time
+
+    @property
+    def price(self) -> np.ndarray:
+        return self._price
+
+    @property
+    def volume(self) -> np.ndarray | NoneType:
+        return self._volume
+
+    def __init__(self, time: np.ndarray, price: np.ndarray, volume: np.ndarray | NoneType = None, check_sorted: bool = True) -> None:
+        """
+        Create TickData from its columns, columns already of the right dtype are not copied.
+
+        Args:
+            time (np.ndarray): tick times, datetime64 or epoch nanoseconds.
+            price (np.ndarray): tick prices.
+            volume (np.ndarray | NoneType, optional): tick volumes. Defaults to None.
+            check_sorted (bool, optional): check that the ticks are sorted by time. Defaults to True.
+
+        Raises:
+            ValueError: If the columns don't have the same length or the ticks are not sorted by time.
+        """
+
+        val_instance(check_sorted, bool)
+
+        time = np.asarray(time)
+
+        if not np.issubdtype(time.dtype, np.datetime64):
+            time = time.astype(np.int64).view("datetime64[ns]")
+
+        self._time = time.astype("datetime64[ns]", copy=False)
+        self._price = np.asarray(price, dtype=np.float64)
+        self._volume = None if volume is None else np.asarray(volume, dtype=np.float64)
+
+        if len(self._price) != len(self._time) or (not self._volume is None and len(self._volume) != len(self._time)):
+            raise ValueError("expected columns of equal length.")
+
+        if check_sorted and len(self._time) > 1 and np.any(self._time[1:] < self._time[:-1]):
+            raise ValueError("expected ticks sorted by time.")
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    def __getitem__(self, __key: slice | np.ndarray) -> "TickData":
+        return self.__class__(
+            self._time[__key],
+            self._price[__key],
+            None if self._volume is None else self._volume[__key],
+            check_sorted=False
+        )
+
+    @classmethod
+    def from_csv(cls, __csv: PathLike, time_column: str = "time", price_column: str = "price", volume_column: str | NoneType = None) -> "TickData":
+        """
+        Load TickData from a csv file with a header row.
+        Times can be timestamps (naive timestamps are read as UTC) or epoch nanoseconds.
+
+        Args:
+            __csv (PathLike): path to the csv file.
+            time_column (str, optional): name of the time column. Defaults to "time".
+            price_column (str, optional): name of the price column. Defaults to "price".
+            volume_column (str | NoneType, optional): name of the volume column. Defaults to None, no volume.
+
+        Returns:
+            TickData
+        """
+
+        val_instance(__csv, PathLike)
+        val_instance(time_column, str)
+        val_instance(price_column, str)
+        val_instance(volume_column, (str, NoneType))
+
+        _times, _prices, _volumes = [], [], []
+
+        with open(__csv, "r", newline="") as f:
+            for _row in csv.DictReader(f):
+                _times.append(_row[time_column])
+                _prices.append(_row[price_column])
+
+                if not volume_column is None:
+                    _volumes.append(_row[volume_column])
+
+        if _times and _times[0].isdigit():
+            _time = np.array(_times, dtype=np.int64)
+        else:
+            _time = np.array([epoch_ns(_t) for _t in parse_times(_times)], dtype=np.int64)
+
+        return cls(
+            _time,
+            np.array(_prices, dtype=np.float64),
+            np.array(_volumes, dtype=np.float64) if not volume_column is None else None
+        )
+
+    @classmethod
+    def from_parquet(cls, __parquet: PathLike, time_column: str = "time", price_column: str = "price", volume_column: str | NoneType = None) -> "TickData":
+        """
+        Load TickData from a parquet file, requires `pyarrow`.
+
+        Args:
+            __parquet (PathLike): path to the parquet file.
+            time_column (str, optional): name of the time column. Defaults to "time".
+            price_column (str, optional): name of the price column. Defaults to "price".
+            volume_column (str | NoneType, optional): name of the volume column. Defaults to None, no volume.
+
+        Returns:
+            TickData
+        """
+
+        val_instance(__parquet, PathLike)
+        val_instance(time_column, str)
+        val_instance(price_column, str)
+        val_instance(volume_column, (str, NoneType))
+
+        import pyarrow.parquet as pq
+
+        _columns = [time_column, price_column] + ([volume_column] if not volume_column is None else [])
+        _table = pq.read_table(__parquet, columns=_columns)
+
+        _time = _table.column(time_column).to_numpy()
+
+        if np.issubdtype(_time.dtype, np.datetime64):
+            _time = _time.astype("datetime64[ns]")
+
+        return cls(
+            _time,
+            _table.column(price_column).to_numpy(),
+            _table.column(volume_column).to_numpy() if not volume_column is None else None
+        )
+
+
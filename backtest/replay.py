@@ -0,0 +1,407 @@
+"""
+Module that stores the memory mapped tick file format and the DataStream replaying it.
+
+A tick file is made of three files:
+
+    - the record file: a 16 byte header (`TICK_MAGIC`, record size) followed by time sorted `TICK_DTYPE` records.
+    - the symbol file (`<record file>.symbols`): json side table of the symbols the record codes refer to,
+      and of the bounds of each symbol in the index file.
+    - the index file (`<record file>.index`): npy array of record positions grouped by symbol, in time order.
+
+Every file is memory mapped, readers of the same file share its pages instead of loading it.
+"""
+
+import datetime as dt
+import json
+import os
+import struct
+import time as _time
+from pathlib import Path
+from types import NoneType
+from typing import Any, Iterable
+
+import numpy as np
+
+from _utils.time import epoch_ns
+from _utils.typing import PathLike
+from _utils.validate import val_instance
+from backtest.data import TickData
+from bot.datastream import DataStream, TickChunk
+
+
+# magic bytes at the start of every tick file
+TICK_MAGIC = b"ODINTCK1"
+
+# tick file header: magic, record size, reserved
+_HEADER = struct.Struct("<8sII")
+HEADER_SIZE = _HEADER.size
+
+# fixed width tick record, padded to 32 bytes so that every 8 byte field stays aligned
+TICK_DTYPE = np.dtype({
+    "names": ["time", "price", "volume", "symbol"],
+    "formats": ["<M8[ns]", "<f8", "<f8", "<i4"],
+    "offsets": [0, 8, 16, 24],
+    "itemsize": 32
+})
+
+# number of ticks converted to python objects at once by `ReplayStream.request()`
+REPLAY_BLOCK_SIZE = 4096
+
+
+def _symbols_path(__path: PathLike) -> Path:
+    return Path(str(__path) + ".symbols")
+
+
+def _index_path(__path: PathLike) -> Path:
+    return Path(str(__path) + ".index")
+
+
+def _replace(__path: Path, __write) -> None:
+    """
+    Atomically replace a file with the content written by `__write(f)`.
+    """
+
+    _tmp = __path.with_name(__path.name + ".tmp")
+
+    with open(_tmp, "wb") as f:
+        __write(f)
+
+    os.replace(_tmp, __path)
+
+
+def _as_ns(__time: dt.datetime | int) -> int:
+    return __time if type(__time) is int else epoch_ns(__time)
+
+
+def write_ticks(data: TickData, __path: PathLike, symbols: Iterable[str] | NoneType = None) -> int:
+    """
+    Write time sorted ticks to a tick file, see `TICK_DTYPE`.
+
+    Args:
+        data (TickData): ticks to be written, missing volumes are written as 0.
+        __path (PathLike): path to the record file, the side tables are stored at `<__path>.symbols` and `<__path>.index`.
+        symbols (Iterable[str] | NoneType, optional): symbol of every tick. Defaults to None, a single unnamed symbol.
+
+    Returns:
+        int: number of ticks written.
+    """
+
+    val_instance(data, TickData)
+    val_instance(__path, PathLike)
+
+    _path = Path(__path)
+
+    if symbols is None:
+        _symbols, _codes = np.array([""], dtype=object), np.zeros(len(data), dtype=np.int32)
+    else:
+        _symbols, _codes = np.unique(np.asarray(list(symbols), dtype=object), return_inverse=True)
+
+        if len(_codes) != len(data):
+            raise ValueError(f"expected {len(data)} symbols, got {len(_codes)}.")
+
+    _records = np.zeros(len(data), dtype=TICK_DTYPE)
+    _records["time"] = data.time
+    _records["price"] = data.price
+    _records["symbol"] = _codes
+
+    if not data.volume is None:
+        _records["volume"] = data.volume
+
+    # a stable sort keeps the positions of each symbol in time order
+    _index = np.argsort(_codes, kind="stable").astype(np.int64)
+    _bounds = np.searchsorted(_codes[_index], np.arange(len(_symbols) + 1)).tolist()
+
+    def _write_records(f) -> None:
+        f.write(_HEADER.pack(TICK_MAGIC, TICK_DTYPE.itemsize, 0))
+        f.write(_records.tobytes())
+
+    # the side tables are written first, records never refer to codes missing from them
+    _replace(_index_path(_path), lambda f: np.save(f, _index))
+    _replace(_symbols_path(_path), lambda f: f.write(json.dumps(
+        {"symbols": _symbols.tolist(), "bounds": _bounds}).encode()))
+    _replace(_path, _write_records)
+
+    return len(_records)
+
+
+class TickFile:
+    """
+    Memory mapped reader of a tick file written by `write_ticks()`, indexed by time (binary search over the sorted
+    records) and by symbol (positions of each symbol in the index file).
+    """
+
+    @property
+    def records(self) -> np.ndarray:
+        return self._records
+
+    @property
+    def symbols(self) -> tuple[str]:
+        return self._symbols
+
+    def __init__(self, __path: PathLike) -> None:
+        """
+        Open a tick file.
+
+        Args:
+            __path (PathLike): path to the record file.
+
+        Raises:
+            ValueError: If the file is not a valid tick file.
+        """
+
+        val_instance(__path, PathLike)
+
+        self._path = Path(__path)
+
+        with open(self._path, "rb") as f:
+            _header = f.read(HEADER_SIZE)
+
+        if len(_header) != HEADER_SIZE:
+            raise ValueError("expected a tick file, the header is truncated.")
+
+        _magic, _record_size, _ = _HEADER.unpack(_header)
+
+        if _magic != TICK_MAGIC:
+            raise ValueError(f"expected {TICK_MAGIC} tick file magic, got {_magic}.")
+
+        if _record_size != TICK_DTYPE.itemsize:
+            raise ValueError(f"expected {TICK_DTYPE.itemsize} byte records, got {_record_size} byte records.")
+
+        _count = (self._path.stat().st_size - HEADER_SIZE) // TICK_DTYPE.itemsize
+
+        if _count:
+            self._records = np.memmap(self._path, dtype=TICK_DTYPE, mode="r", offset=HEADER_SIZE, shape=(_count,))
+            self._index = np.load(_index_path(self._path), mmap_mode="r")
+        else:
+            self._records = np.empty(0, dtype=TICK_DTYPE)
+            self._index = np.empty(0, dtype=np.int64)
+
+        with open(_symbols_path(self._path), "r") as f:
+            _table = json.load(f)
+
+        self._symbols = tuple(_table["symbols"])
+        self._bounds = _table["bounds"]
+        self._codes = {_symbol: _code for _code, _symbol in enumerate(self._symbols)}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def search(self, __time: dt.datetime | int) -> int:
+        """
+        Position of the first tick at or after a time.
+
+        Args:
+            __time (dt.datetime | int): datetime (naive datetimes are read as UTC) or epoch nanoseconds.
+
+        Returns:
+            int: record position, `len(self)` if every tick is earlier.
+        """
+
+        return int(np.searchsorted(self._records["time"].view(np.int64), _as_ns(__time), side="left"))
+
+    def positions(self, symbol: str) -> np.ndarray:
+        """
+        Record positions of the ticks of a symbol, in time order.
+
+        Args:
+            symbol (str): symbol.
+
+        Raises:
+            KeyError: If the file has no tick of the symbol.
+
+        Returns:
+            np.ndarray: read only int64 view of the index file.
+        """
+
+        _code = self._codes[symbol]
+
+        return self._index[self._bounds[_code]:self._bounds[_code + 1]]
+
+    def to_tick_data(self, symbol: str | NoneType = None) -> TickData:
+        """
+        Generate TickData, views of the records for the whole file and copies for a symbol.
+
+        Args:
+            symbol (str | NoneType, optional): symbol. Defaults to None, every tick.
+
+        Returns:
+            TickData
+        """
+
+        _records = self._records if symbol is None else self._records[self.positions(symbol)]
+
+        return TickData(_records["time"], _records["price"], _records["volume"], check_sorted=False)
+
+
+class ReplayStream(DataStream):
+    """
+    DataStream replaying a tick file at maximum, real time or scaled speed.
+
+    Datapoints are `(time, price)` with naive UTC datetimes, prefixed with the symbol if `keyed`
+    and followed by the volume if `volume`. Every ReplayStream keeps its own position, so several streams
+    can replay the same TickFile concurrently without copying it.
+    """
+
+    @property
+    def file(self) -> TickFile:
+        return self._file
+
+    @property
+    def keyed(self) -> bool:
+        return self._keyed
+
+    @property
+    def speed(self) -> float | NoneType:
+        return self._speed
+
+    def __init__(self, file: TickFile | PathLike, symbols: Iterable[str] | NoneType = None, speed: float | NoneType = None,
+                 keyed: bool = False, volume: bool = False) -> None:
+        """
+        Create a ReplayStream.
+
+        Args:
+            file (TickFile | PathLike): tick file, or path to a tick file.
+            symbols (Iterable[str] | NoneType, optional): replayed symbols. Defaults to None, every symbol.
+            speed (float | NoneType, optional): replay speed, 1.0 for real time and 2.0 for twice as fast. Defaults to None, maximum speed.
+            keyed (bool, optional): prefix datapoints with their symbol. Defaults to False.
+            volume (bool, optional): append the volume to datapoints. Defaults to False.
+        """
+
+        val_instance(file, (TickFile, PathLike))
+        val_instance(speed, (float, int, NoneType))
+        val_instance(keyed, bool)
+        val_instance(volume, bool)
+
+        if not speed is None and speed <= 0:
+            raise ValueError(f"expected a positive `speed`, got {speed}.")
+
+        super().__init__()
+
+        self._file = file if isinstance(file, TickFile) else TickFile(file)
+        self._speed = None if speed is None else float(speed)
+        self._keyed = keyed
+        self._volume = volume
+
+        # positions of the replayed ticks, None for every tick
+        if symbols is None:
+            self._positions = None
+        else:
+            _positions = [self._file.positions(_symbol) for _symbol in symbols]
+            self._positions = _positions[0] if len(_positions) == 1 else np.sort(np.concatenate(_positions))
+
+        self._times = self._file.records["time"].view(np.int64)
+        self._count = len(self._file) if self._positions is None else len(self._positions)
+        self.seek(0)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def seek(self, __time: dt.datetime | int) -> None:
+        """
+        Move to the first replayed tick at or after a time, pacing restarts from that tick.
+
+        Args:
+            __time (dt.datetime | int): datetime (naive datetimes are read as UTC) or epoch nanoseconds.
+        """
+
+        val_instance(__time, (dt.datetime, int))
+
+        if self._positions is None:
+            self._position = self._file.search(__time)
+        else:
+            self._position = int(np.searchsorted(self._times[self._positions], _as_ns(__time), side="left"))
+
+        self._block = []
+        self._block_index = 0
+        self._anchor = None
+
+    def _wait(self, __time_ns: int) -> None:
+        """
+        Sleep until a tick is due, the first tick after `seek()` anchors tick times to the wall clock.
+        """
+
+        if self._anchor is None:
+            self._anchor = (_time.monotonic(), __time_ns)
+
+            return
+
+        _delay = self._anchor[0] + (__time_ns - self._anchor[1]) / 1e9 / self._speed - _time.monotonic()
+
+        if _delay > 0:
+            _time.sleep(_delay)
+
+    def _slice(self, start: int, stop: int) -> np.ndarray:
+        if self._positions is None:
+            return self._file.records[start:stop]
+
+        return self._file.records[self._positions[start:stop]]
+
+    def _load_block(self) -> None:
+        """
+        Convert the next block of ticks to datapoints at once, far cheaper than converting tick by tick.
+        """
+
+        _records = self._slice(self._position, self._position + REPLAY_BLOCK_SIZE)
+        _columns = [_records["time"].astype("datetime64[us]").tolist(), _records["price"].tolist()]
+
+        if self._keyed:
+            _columns.insert(0, [self._file.symbols[_code] for _code in _records["symbol"].tolist()])
+
+        if self._volume:
+            _columns.append(_records["volume"].tolist())
+
+        self._block = list(zip(*_columns))
+        self._block_times = _records["time"].view(np.int64).tolist()
+        self._block_index = 0
+
+    def request(self) -> Any:
+        if self._block_index == len(self._block):
+            if self._position >= self._count:
+                raise StopIteration
+
+            self._load_block()
+
+        _index = self._block_index
+
+        if not self._speed is None:
+            self._wait(self._block_times[_index])
+
+        self._block_index += 1
+        self._position += 1
+
+        return self._block[_index]
+
+    def request_many(self, max_n: int) -> TickChunk:
+        """
+        Request up to `max_n` ticks, at maximum speed and the ticks already due otherwise.
+        Times and prices are views of the memory mapped file, unless the stream is restricted to some symbols.
+        """
+
+        val_instance(max_n, int)
+
+        if self._position >= self._count:
+            raise StopIteration
+
+        _stop = min(self._position + max_n, self._count)
+
+        if not self._speed is None:
+            _first = int(self._times[self._position if self._positions is None else self._positions[self._position]])
+            self._wait(_first)
+
+            # every tick due by now, at least the first one
+            _due = self._anchor[1] + int((_time.monotonic() - self._anchor[0]) * 1e9 * self._speed)
+            _times = self._slice(self._position, _stop)["time"].view(np.int64)
+            _stop = self._position + max(int(np.searchsorted(_times, _due, side="right")), 1)
+
+        _records = self._slice(self._position, _stop)
+
+        self._position = _stop
+        # ticks converted by `request()` are dropped
+        self._block = []
+        self._block_index = 0
+
+        return TickChunk(
+            _records["time"],
+            _records["price"],
+            np.array(self._file.symbols, dtype=object)[_records["symbol"]] if self._keyed else None
+        )
@@ -0,0 +1,352 @@
+"""
+Module that stores the parameter sweeps of strategies.
+
+A sweep backtests a Strategy subclass instantiated with many parameter sets (`strategy_class(**params)`) across
+a process pool. The tick history is copied once into shared memory and every worker maps it read only, so parameter
+sets are the only data sent to workers. Results are cached by (strategy, parameters, data hash, number of ticks).
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from types import NoneType
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from _utils.typing import PathLike
+from _utils.validate import val_instance
+from backtest.base import Backtester, BacktestResult
+from backtest.data import TickData
+from strategy.base import Strategy
+
+
+# tick history mapped by the worker processes of a sweep
+_data: TickData | NoneType = None
+_shm: shared_memory.SharedMemory | NoneType = None
+
+
+def grid(space: dict[str, Iterable]) -> list[dict]:
+    """
+    Every combination of parameter values.
+
+    Args:
+        space (dict[str, Iterable]): values of every parameter.
+
+    Returns:
+        list[dict]: parameter sets.
+    """
+
+    val_instance(space, dict)
+
+    _names = list(space)
+
+    return [dict(zip(_names, _values)) for _values in itertools.product(*(list(space[_name]) for _name in _names))]
+
+
+def random_search(space: dict[str, Iterable | Callable[[random.Random], Any]], n: int, seed: int | NoneType = None) -> list[dict]:
+    """
+    Random parameter sets, duplicates are dropped.
+
+    Args:
+        space (dict[str, Iterable | Callable[[random.Random], Any]]): values to choose from, or function of a random
+            generator drawing a value, of every parameter.
+        n (int): number of parameter sets drawn.
+        seed (int | NoneType, optional): random seed. Defaults to None.
+
+    Returns:
+        list[dict]: at most `n` distinct parameter sets.
+    """
+
+    val_instance(space, dict)
+    val_instance(n, int)
+
+    _rng = random.Random(seed)
+    _space = {_name: _values if callable(_values) else list(_values) for _name, _values in space.items()}
+    _params = {}
+
+    for _ in range(n):
+        _set = {_name: _values(_rng) if callable(_values) else _rng.choice(_values) for _name, _values in _space.items()}
+        _params.setdefault(_key(_set), _set)
+
+    return list(_params.values())
+
+
+def _key(params: dict) -> str:
+    return json.dumps(params, sort_keys=True, default=repr)
+
+
+def _summary(result: BacktestResult) -> dict:
+    return {
+        "pnl": result.pnl,
+        "trades": len(result.trades),
+        "open": result.open,
+        "fed": result.fed,
+        "responses": len(result.responses)
+    }
+
+
+def _attach(name: str, count: int, volume: bool) -> None:
+    """
+    Worker initializer, map the shared tick history.
+    """
+
+    global _data, _shm
+
+    # workers share the resource tracker of the parent, which unlinks the segment in `Sweep.close()`
+    _shm = shared_memory.SharedMemory(name=name)
+    _columns = np.ndarray((3 if volume else 2, count), dtype=np.int64, buffer=_shm.buf)
+    _data = TickData(
+        _columns[0].view("datetime64[ns]"),
+        _columns[1].view(np.float64),
+        _columns[2].view(np.float64) if volume else None,
+        check_sorted=False
+    )
+
+
+def _evaluate(strategy_class: type, params: dict, stop: int, metric: Callable[[BacktestResult], float] | NoneType) -> tuple[dict, float]:
+    """
+    Worker task, backtest a parameter set over the first `stop` ticks.
+    """
+
+    result = Backtester(strategy_class(**params), _data[:stop]).run()
+
+    return _summary(result), float(result.pnl if metric is None else metric(result))
+
+
+class SweepResult:
+    """
+    Result of a parameter set: its score and a summary of its backtest (pnl, trades, open, fed, responses).
+    """
+
+    __slots__ = ("_params", "_score", "_summary", "_ticks")
+
+    @property
+    def params(self) -> dict:
+        return self._params
+
+    @property
+    def score(self) -> float:
+        return self._score
+
+    @property
+    def summary(self) -> dict:
+        return self._summary
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    def __init__(self, params: dict, score: float, summary: dict, ticks: int) -> None:
+        self._params = params
+        self._score = score
+        self._summary = summary
+        self._ticks = ticks
+
+    def __repr__(self) -> str:
+        return f"SweepResult({self._params}, score={self._score}, ticks={self._ticks})"
+
+
+class Sweep:
+    """
+    Parameter sweep of a Strategy subclass over a tick history.
+
+        with Sweep(SampleStrategy, data) as sweep:
+            results = sweep.run(grid({"window": range(5, 50, 5), "hold": range(5, 50, 5)}))
+    """
+
+    @property
+    def strategy_class(self) -> type:
+        return self._strategy_class
+
+    @property
+    def data_hash(self) -> str:
+        return self._data_hash
+
+    def __init__(self, strategy_class: type, data: TickData, workers: int | NoneType = None,
+                 metric: Callable[[BacktestResult], float] | NoneType = None, cache: PathLike | NoneType = None) -> None:
+        """
+        Create a Sweep.
+
+        Args:
+            strategy_class (type): importable Strategy subclass, instantiated with the keyword arguments of every parameter set.
+            data (TickData): tick history.
+            workers (int | NoneType, optional): number of worker processes. Defaults to None, the number of cpus.
+            metric (Callable[[BacktestResult], float] | NoneType, optional): picklable score of a backtest, higher is better. Defaults to None, the pnl.
+            cache (PathLike | NoneType, optional): json file results are cached in across sweeps. Defaults to None, cached in memory only.
+        """
+
+        val_instance(strategy_class, type)
+        val_instance(data, TickData)
+        val_instance(workers, (int, NoneType))
+        val_instance(cache, (PathLike, NoneType))
+
+        if not issubclass(strategy_class, Strategy):
+            raise TypeError(f"expected a Strategy subclass, got {strategy_class}.")
+
+        self._strategy_class = strategy_class
+        self._strategy_name = f"{strategy_class.__module__}.{strategy_class.__qualname__}"
+        self._data = data
+        self._workers = workers or os.cpu_count() or 1
+        self._metric = metric
+        # results are cached per metric, functions are identified by their import path
+        self._metric_name = "pnl" if metric is None else \
+            f"{metric.__module__}.{getattr(metric, '__qualname__', type(metric).__qualname__)}"
+        self._cache_path = None if cache is None else Path(cache)
+
+        _hash = hashlib.blake2b(digest_size=16)
+
+        for _column in (data.time, data.price, data.volume):
+            if not _column is None:
+                _hash.update(np.ascontiguousarray(_column).view(np.uint8))
+
+        self._data_hash = _hash.hexdigest()
+        self._cache: dict = {}
+
+        if not self._cache_path is None and self._cache_path.exists():
+            with open(self._cache_path, "r") as f:
+                self._cache = json.load(f)
+
+        self._shm = None
+        self._executor = None
+
+    def __enter__(self) -> "Sweep":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _start(self) -> ProcessPoolExecutor:
+        """
+        Copy the tick history to shared memory and start the workers, once per sweep.
+        """
+
+        if self._executor is None:
+            _volume = not self._data.volume is None
+            _count = len(self._data)
+            self._shm = shared_memory.SharedMemory(create=True, size=max(8 * _count * (3 if _volume else 2), 1))
+
+            _columns = np.ndarray((3 if _volume else 2, _count), dtype=np.int64, buffer=self._shm.buf)
+            _columns[0] = self._data.time.view(np.int64)
+            _columns[1] = self._data.price.view(np.int64)
+
+            if _volume:
+                _columns[2] = self._data.volume.view(np.int64)
+
+            self._executor = ProcessPoolExecutor(self._workers, initializer=_attach, initargs=(self._shm.name, _count, _volume))
+
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory.
+        """
+
+        if not self._executor is None:
+            self._executor.shutdown()
+            self._executor = None
+
+        if not self._shm is None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def run(self, params: Iterable[dict], ticks: int | NoneType = None) -> list[SweepResult]:
+        """
+        Backtest every parameter set.
+
+        Args:
+            params (Iterable[dict]): parameter sets.
+            ticks (int | NoneType, optional): backtest over the first `ticks` ticks. Defaults to None, every tick.
+
+        Returns:
+            list[SweepResult]: results sorted by decreasing score.
+        """
+
+        val_instance(ticks, (int, NoneType))
+
+        _stop = len(self._data) if ticks is None else min(ticks, len(self._data))
+        _params = list(params)
+        _keys = [f"{self._strategy_name}|{_key(_set)}|{self._data_hash}|{_stop}|{self._metric_name}" for _set in _params]
+        _missing = [_index for _index, _k in enumerate(_keys) if not _k in self._cache]
+
+        if _missing:
+            _executor = self._start()
+            # a few tasks per worker balances uneven backtests without a round trip per task
+            _chunksize = max(1, len(_missing) // (4 * self._workers))
+
+            for _index, (_summary, _score) in zip(_missing, _executor.map(
+                _evaluate,
+                itertools.repeat(self._strategy_class),
+                [_params[_index] for _index in _missing],
+                itertools.repeat(_stop),
+                itertools.repeat(self._metric),
+                chunksize=_chunksize
+            )):
+                self._cache[_keys[_index]] = {"summary": _summary, "score": _score}
+
+            self._save()
+
+        _results = [SweepResult(_set, self._cache[_k]["score"], self._cache[_k]["summary"], _stop)
+                    for _set, _k in zip(_params, _keys)]
+
+        return sorted(_results, key=lambda _result: -_result.score if _result.score == _result.score else float("inf"))
+
+    def successive_halving(self, params: Iterable[dict], eta: int = 3, min_ticks: int | NoneType = None) -> list[SweepResult]:
+        """
+        Successive halving: every parameter set is backtested over the first `min_ticks` ticks, the best `1 / eta`
+        over `eta` times more ticks, and so on until the remaining sets are backtested over every tick.
+
+        Args:
+            params (Iterable[dict]): parameter sets.
+            eta (int, optional): reduction factor. Defaults to 3.
+            min_ticks (int | NoneType, optional): ticks of the first round. Defaults to None, enough rounds to keep a single set.
+
+        Returns:
+            list[SweepResult]: results of the last round, over every tick, sorted by decreasing score.
+        """
+
+        val_instance(eta, int)
+        val_instance(min_ticks, (int, NoneType))
+
+        if eta < 2:
+            raise ValueError(f"expected `eta` greater than 1, got {eta}.")
+
+        _params = list(params)
+        _count = len(self._data)
+
+        if min_ticks is None:
+            _rounds = 0
+
+            while eta ** (_rounds + 1) <= len(_params):
+                _rounds += 1
+
+            min_ticks = max(_count // eta ** _rounds, 1)
+
+        _ticks = min_ticks
+
+        while True:
+            _results = self.run(_params, _ticks)
+
+            if _ticks >= _count:
+                return _results
+
+            _params = [_result.params for _result in _results[:max(len(_results) // eta, 1)]]
+            # the last round, and the round of a single remaining set, is over every tick
+            _ticks = _count if len(_params) == 1 or _ticks * eta * eta > _count else _ticks * eta
+
+    def _save(self) -> None:
+        if self._cache_path is None:
+            return
+
+        _tmp = self._cache_path.with_name(self._cache_path.name + ".tmp")
+
+        with open(_tmp, "w") as f:
+            json.dump(self._cache, f)
+
+        os.replace(_tmp, self._cache_path)
@@ -1,2 +1,13 @@
-from bot.bot import Bot
-from bot.datastream import DataStream
\ No newline at end of file
+from _utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "bot.bot": ("Bot",),
+    "bot.datastream": ("DataStream", "AsyncDataStream", "TickChunk"),
+    "bot.asyncbot": ("AsyncBot", "BackpressureQueue"),
+    "bot.pool": ("BotPool", "ConsistentHash"),
+    "bot.streams": ("StreamWrapper", "ConflatingStream", "BarStream", "SamplingStream"),
+    "bot.metrics": ("BotMetrics", "LatencyHistogram"),
+    "bot.fanout": ("FanOutBot",),
+    "bot.checkpoint": ("Checkpoint", "CheckpointStream"),
+    "bot.journal": ("Journal", "JournalingBot", "iter_journal")
+})
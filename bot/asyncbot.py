@@ -0,0 +1,290 @@
+import asyncio
+import inspect
+from collections import deque
+from typing import Any
+from _utils.errors import RequiredOverwrite
+from _utils.validate import val_instance
+from bot.bot import as_args
+from bot.datastream import AsyncDataStream, DataStream
+from strategy.base import Strategy
+from strategy.protocol.base import StrategyResponse
+
+
+# backpressure policies of the tick queue
+BACKPRESSURE_POLICIES = ("block", "drop-oldest", "coalesce")
+
+# marker put in the queues to shut the stages down, never dropped or coalesced
+_STOP = object()
+
+
+def _request(data_stream: DataStream) -> Any:
+    """
+    Request a datapoint from a synchronous DataStream on a worker thread,
+    `StopIteration` can't be raised into a future so it is raised as `StopAsyncIteration`.
+    """
+
+    try:
+        return data_stream.request()
+    except StopIteration:
+        raise StopAsyncIteration
+
+
+class BackpressureQueue:
+    """
+    Bounded asyncio queue with a configurable policy for puts on a full queue:
+
+        - "block": wait until there is space.
+        - "drop-oldest": drop the oldest item.
+        - "coalesce": replace the newest item, only the latest value is kept.
+    """
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    def __init__(self, maxsize: int, policy: str = "block") -> None:
+        """
+        Create a BackpressureQueue.
+
+        Args:
+            maxsize (int): maximum number of queued items, must be greater than 0.
+            policy (str, optional): "block", "drop-oldest" or "coalesce". Defaults to "block".
+        """
+
+        val_instance(maxsize, int)
+        val_instance(policy, str)
+
+        if maxsize < 1:
+            raise ValueError(f"expected `maxsize` greater than 0, got {maxsize}.")
+
+        if not policy in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"expected one of {BACKPRESSURE_POLICIES} for `policy` got '{policy}'.")
+
+        self._maxsize = maxsize
+        self._policy = policy
+        self._items = deque()
+        self._condition = asyncio.Condition()
+        self._dropped = 0
+        self._coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, item: Any, force: bool = False) -> None:
+        """
+        Put an item in the queue, applying the backpressure policy if the queue is full.
+
+        Args:
+            item (Any): item.
+            force (bool, optional): append the item even if the queue is full. Defaults to False.
+        """
+
+        async with self._condition:
+            if not force and len(self._items) >= self._maxsize:
+                if self._policy == "block":
+                    await self._condition.wait_for(lambda: len(self._items) < self._maxsize)
+                elif self._policy == "drop-oldest":
+                    self._items.popleft()
+                    self._dropped += 1
+                elif self._items[-1] is not _STOP:
+                    self._items[-1] = item
+                    self._coalesced += 1
+
+                    return
+
+            self._items.append(item)
+            self._condition.notify_all()
+
+    async def get(self) -> Any:
+        """
+        Wait for and remove the oldest item.
+
+        Returns:
+            Any: item.
+        """
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._items)
+
+            item = self._items.popleft()
+            self._condition.notify_all()
+
+            return item
+
+
+class AsyncBot:
+    """
+    Event driven Bot, ingestion, strategy evaluation and response handling run as separate asyncio tasks
+    connected by bounded queues so that slow handling doesn't stall ingestion.
+
+    Synchronous `DataStream` objects are polled on a worker thread, `handle()` can be a coroutine or a plain method.
+    The response queue always blocks, responses are never dropped.
+    """
+
+    @property
+    def strategy(self) -> Strategy:
+        return self._strategy
+
+    @strategy.setter
+    def strategy(self, strategy: Strategy) -> None:
+        val_instance(strategy, Strategy)
+
+        self._strategy = strategy
+
+    @strategy.deleter
+    def strategy(self) -> None:
+        raise AttributeError("Cannot delete `strategy` attribute.")
+
+    @property
+    def data_stream(self) -> AsyncDataStream | DataStream:
+        return self._data_stream
+
+    @data_stream.setter
+    def data_stream(self, data_stream: AsyncDataStream | DataStream) -> None:
+        val_instance(data_stream, (AsyncDataStream, DataStream))
+
+        self._data_stream = data_stream
+
+    @data_stream.deleter
+    def data_stream(self) -> None:
+        raise AttributeError("Cannot delete `data_stream` attribute.")
+
+    @property
+    def ticks(self) -> BackpressureQueue:
+        return self._ticks
+
+    @property
+    def responses(self) -> BackpressureQueue:
+        return self._responses
+
+    def __init__(self, strategy: Strategy, data_stream: AsyncDataStream | DataStream, queue_size: int = 1024, policy: str = "block") -> None:
+        """
+        Create an AsyncBot.
+
+        Args:
+            strategy (Strategy): strategy.
+            data_stream (AsyncDataStream | DataStream): data stream.
+            queue_size (int, optional): capacity of the tick and response queues. Defaults to 1024.
+            policy (str, optional): backpressure policy of the tick queue, "block", "drop-oldest" or "coalesce". Defaults to "block".
+        """
+
+        val_instance(queue_size, int)
+        val_instance(policy, str)
+
+        if queue_size < 1:
+            raise ValueError(f"expected `queue_size` greater than 0, got {queue_size}.")
+
+        if not policy in BACKPRESSURE_POLICIES:
+            raise ValueError(
+                f"expected one of {BACKPRESSURE_POLICIES} for `policy` got '{policy}'.")
+
+        self._strategy = None
+        self._data_stream = None
+
+        self.strategy = strategy
+        self.data_stream = data_stream
+
+        self._queue_size = queue_size
+        self._policy = policy
+        self._ticks = None
+        self._responses = None
+        self._stopping = False
+
+    async def request(self) -> Any:
+        """
+        Request the next datapoint from the data stream.
+
+        Returns:
+            Any: datapoint.
+        """
+
+        if isinstance(self._data_stream, AsyncDataStream):
+            return await self._data_stream.request()
+
+        return await asyncio.to_thread(_request, self._data_stream)
+
+    async def run(self) -> None:
+        """
+        Run the bot until the data stream is exhausted (`StopAsyncIteration` or `StopIteration`) or `stop()` is called,
+        every tick already ingested is evaluated and every response handled before returning.
+        """
+
+        self._ticks = BackpressureQueue(self._queue_size, self._policy)
+        self._responses = BackpressureQueue(self._queue_size, "block")
+        self._stopping = False
+
+        tasks = [
+            asyncio.create_task(self._ingest()),
+            asyncio.create_task(self._evaluate()),
+            asyncio.create_task(self._dispatch())
+        ]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def stop(self) -> None:
+        """
+        Request a graceful shutdown, ingestion stops after the pending request and queued ticks are drained.
+        """
+
+        self._stopping = True
+
+    async def handle(self, strategy_response: StrategyResponse) -> None:
+        raise RequiredOverwrite("`handle()` requires overwrite.")
+
+    async def _ingest(self) -> None:
+        try:
+            while not self._stopping:
+                try:
+                    data: Any = await self.request()
+                except StopAsyncIteration:
+                    break
+
+                await self._ticks.put(data)
+        finally:
+            await self._ticks.put(_STOP, force=True)
+
+    async def _evaluate(self) -> None:
+        strategy = self._strategy
+
+        try:
+            while True:
+                data: Any = await self._ticks.get()
+
+                if data is _STOP:
+                    break
+
+                args: tuple = as_args(data)
+
+                if strategy.__feed__(*args):
+                    await self._responses.put(strategy.next(*args))
+        finally:
+            await self._responses.put(_STOP, force=True)
+
+    async def _dispatch(self) -> None:
+        while True:
+            response: StrategyResponse = await self._responses.get()
+
+            if response is _STOP:
+                break
+
+            result = self.handle(response)
+
+            if inspect.isawaitable(result):
+                await result
@@ -1,3 +1,5 @@
+from time import perf_counter_ns
+from types import NoneType
 from typing import Any
 from _utils.errors import RequiredOverwrite
 from _utils.validate import val_instance
@@ -36,21 +38,245 @@ class Bot:
         raise AttributeError("Cannot delete `data_stream` attribute.")
     
     
-    def __init__(self, strategy: Strategy, data_stream: DataStream) -> None:
+    @property
+    def chunk_size(self) -> int | None:
+        return self._chunk_size
+    
+    @property
+    def metrics(self) -> "BotMetrics | None":
+        return self._metrics
+    
+    @property
+    def checkpoint(self) -> "Checkpoint | None":
+        return self._checkpoint
+    
+    @property
+    def journal(self) -> "Journal | None":
+        return self._journal
+    
+    
+    def __init__(self, strategy: Strategy, data_stream: DataStream, chunk_size: int | None = None, metrics: "BotMetrics | None" = None,
+                 checkpoint: "Checkpoint | None" = None, journal: "Journal | None" = None) -> None:
+        """
+        Create a Bot.
+
+        Args:
+            strategy (Strategy): evaluated strategy.
+            data_stream (DataStream): data stream.
+            chunk_size (int | None, optional): request ticks in chunks of up to `chunk_size` through `DataStream.request_many()`
+                and evaluate them through `Strategy.next_many()`. Defaults to None, one tick at a time.
+            metrics (BotMetrics | None, optional): record stage latencies, tick and response counts into `metrics`.
+                Defaults to None, uninstrumented.
+            checkpoint (Checkpoint | None, optional): restore the strategy from `checkpoint` when running, skip the ticks
+                it already reflects and periodically checkpoint it, see `CheckpointStream`. Defaults to None.
+            journal (Journal | None, optional): append every 'BUY' and 'SELL' response to `journal` before it is handled,
+                the journal is written and fsynced in the background. 'HOLD' responses place no order and are not journaled,
+                fills are journaled by a `JournalingBot` given to the broker. Defaults to None.
+        """
+        
+        val_instance(chunk_size, (int, NoneType))
+
+        # the modules of the optional features are only imported when they are used
+        if not metrics is None:
+            from bot.metrics import BotMetrics
+
+            val_instance(metrics, BotMetrics)
+
+        if not checkpoint is None:
+            from bot.checkpoint import Checkpoint
+
+            val_instance(checkpoint, Checkpoint)
+
+        if not journal is None:
+            from bot.journal import Journal
+
+            val_instance(journal, Journal)
+        
         self._strategy = None
         self._data_stream = None
         
         self.strategy = strategy
         self.data_stream = data_stream
         
+        self._chunk_size = chunk_size
+        self._metrics = metrics
+        self._checkpoint = checkpoint
+        self._journal = journal
+        
     def run(self) -> None:
+        """
+        Evaluate the ticks of the data stream until it is exhausted (`StopIteration`).
+        """
+        
+        if not self._checkpoint is None or not self._journal is None:
+            return self._run_wrapped()
+        
+        return self._run()
+    
+    def _run_wrapped(self) -> None:
+        """
+        `run()` over a CheckpointStream wrapping the data stream and with `handle()` journaling responses first,
+        the data stream and `handle()` are restored when the run ends.
+        """
+        
+        data_stream = self._data_stream
+        
+        if not self._checkpoint is None:
+            from bot.checkpoint import CheckpointStream
+
+            self._data_stream = CheckpointStream(data_stream, self._strategy, self._checkpoint)
+        
+        if not self._journal is None:
+            handle = self.handle
+            append = self._journal.append
+            
+            def journaled(strategy_response: StrategyResponse) -> None:
+                if not strategy_response is None and strategy_response._command != "HOLD":
+                    append(strategy_response)
+                
+                handle(strategy_response)
+            
+            # instance attribute shadowing the method for the duration of the run
+            self.handle = journaled
+        
+        try:
+            return self._run()
+        finally:
+            self._data_stream = data_stream
+            
+            if not self._journal is None:
+                del self.handle
+            
+            if not self._checkpoint is None:
+                self._checkpoint.close()
+    
+    def _run(self) -> None:
+        if not self._metrics is None:
+            return self._run_chunks_instrumented() if not self._chunk_size is None else self._run_instrumented()
+        
+        if not self._chunk_size is None:
+            return self._run_chunks()
+        
         while True:
-            data: Any = self.data_stream.request()
+            try:
+                data: Any = self.data_stream.request()
+            except StopIteration:
+                return
+            
+            args: tuple = as_args(data)
             
-            if self.strategy.__feed__(data):
-                response: StrategyResponse = self.strategy.next(data)
+            if self.strategy.__feed__(*args):
+                response: StrategyResponse = self.strategy.next(*args)
                 
                 self.handle(response)
     
-    def handle(strategy_response: StrategyResponse) -> None:
-        RequiredOverwrite("`handle()` requires overwrite.")
\ No newline at end of file
+    def _run_chunks(self) -> None:
+        while True:
+            try:
+                chunk = self.data_stream.request_many(self._chunk_size)
+            except StopIteration:
+                return
+            
+            for response in self.strategy.next_many(chunk.times, chunk.prices, chunk.symbols):
+                self.handle(response)
+    
+    def _run_instrumented(self) -> None:
+        """
+        `run()` recording every stage into `metrics`, kept separate so that uninstrumented bots pay nothing.
+        """
+        
+        from bot.metrics import STAGES
+
+        clock = perf_counter_ns
+        metrics = self._metrics
+        request, feed, next_, handle = (metrics.histograms[_stage].record for _stage in STAGES)
+        responses = metrics._responses
+        
+        while True:
+            start = clock()
+            
+            try:
+                data: Any = self.data_stream.request()
+            except StopIteration:
+                return
+            
+            fed_at = clock()
+            request(fed_at - start)
+            
+            args: tuple = as_args(data)
+            fed = self.strategy.__feed__(*args)
+            start = clock()
+            feed(start - fed_at)
+            
+            if not fed:
+                metrics._filtered += 1
+                continue
+            
+            metrics._fed += 1
+            response: StrategyResponse = self.strategy.next(*args)
+            handled_at = clock()
+            next_(handled_at - start)
+            
+            if not response is None:
+                responses[response._command] += 1
+            
+            self.handle(response)
+            handle(clock() - handled_at)
+    
+    def _run_chunks_instrumented(self) -> None:
+        from bot.metrics import STAGES
+
+        clock = perf_counter_ns
+        metrics = self._metrics
+        request, _, next_, handle = (metrics.histograms[_stage].record for _stage in STAGES)
+        responses = metrics._responses
+        
+        while True:
+            start = clock()
+            
+            try:
+                chunk = self.data_stream.request_many(self._chunk_size)
+            except StopIteration:
+                return
+            
+            evaluated_at = clock()
+            request(evaluated_at - start)
+            
+            chunk_responses = self.strategy.next_many(chunk.times, chunk.prices, chunk.symbols)
+            start = clock()
+            next_(start - evaluated_at)
+            
+            fed = 0
+            
+            for response in chunk_responses:
+                fed += 1
+                
+                if not response is None:
+                    responses[response._command] += 1
+                
+                self.handle(response)
+                
+                handled_at = clock()
+                handle(handled_at - start)
+                start = handled_at
+            
+            metrics._fed += fed
+            metrics._filtered += len(chunk) - fed
+    
+    def handle(self, strategy_response: StrategyResponse) -> None:
+        raise RequiredOverwrite("`handle()` requires overwrite.")
+
+
+def as_args(data: Any) -> tuple:
+    """
+    Convert a datapoint to the positional arguments of `Strategy.__feed__()` and `Strategy.next()`,
+    tuples (e.g. `(time, price)`) are unpacked.
+
+    Args:
+        data (Any): datapoint returned by a DataStream.
+
+    Returns:
+        tuple: positional arguments.
+    """
+    
+    return data if isinstance(data, tuple) else (data,)
\ No newline at end of file
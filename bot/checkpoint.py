@@ -0,0 +1,476 @@
+"""
+Module that stores the checkpoints of strategy state used by bots to restart warm.
+
+A checkpoint file is a 16 byte header (`CHECKPOINT_MAGIC`, record header size, reserved) followed by records, each a
+40 byte record header (time and number of ticks at that time of the last tick, total ticks, payload size, crc32, kind)
+and a payload of serialized attributes (`Strategy.__snapshot__()`):
+
+    - full records hold every attribute.
+    - delta records hold the attributes whose serialized value changed since the previous record, and removed ones.
+
+Records are appended and flushed (fsynced by default). A torn record at the end of the file, from a crash while it was
+written, fails its size or checksum and is dropped, so the last complete record is restored. Every `compact` records the
+file is atomically replaced by a single full record through a temporary file and `os.replace`.
+"""
+
+import datetime as dt
+import os
+import pickle
+import struct
+import time as _time
+import zlib
+from pathlib import Path
+from types import NoneType
+from typing import Any
+
+import numpy as np
+
+from _utils.time import epoch_ns
+from _utils.typing import PathLike
+from _utils.validate import val_instance
+from bot.datastream import DataStream, TickChunk
+from bot.streams import StreamWrapper
+from strategy.base import Strategy
+
+
+# magic bytes at the start of every checkpoint file
+CHECKPOINT_MAGIC = b"ODINCKP1"
+
+# checkpoint file header: magic, record header size, reserved
+_HEADER = struct.Struct("<8sII")
+
+# record header: time of the last tick (epoch nanoseconds), ticks at that time, total ticks, payload size, crc32, kind
+_RECORD = struct.Struct("<qqqIIB3x")
+
+# record kinds, payloads larger than `_COMPRESS_MIN` bytes are zlib compressed when it makes them smaller
+_FULL = 1
+_DELTA = 2
+_COMPRESSED = 4
+_COMPRESS_MIN = 512
+
+
+class Checkpoint:
+    """
+    Checkpoint file of the state of a strategy and the position of the last tick it evaluated.
+
+        checkpoint = Checkpoint("bot.ckpt", every=10_000)
+        MyBot(strategy, data_stream, checkpoint=checkpoint).run()
+    """
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def every(self) -> int | NoneType:
+        return self._every
+
+    @property
+    def interval(self) -> dt.timedelta | NoneType:
+        return self._interval
+
+    def __init__(self, __path: PathLike, every: int | NoneType = 10_000, interval: dt.timedelta | NoneType = None,
+                 compact: int = 64, fsync: bool = True) -> None:
+        """
+        Create a Checkpoint.
+
+        Args:
+            __path (PathLike): path to the checkpoint file.
+            every (int | NoneType, optional): save after every `every` ticks. Defaults to 10_000.
+            interval (dt.timedelta | NoneType, optional): save at most `interval` apart (wall clock). Defaults to None.
+            compact (int, optional): rewrite the file as a single full record every `compact` records. Defaults to 64.
+            fsync (bool, optional): fsync every record, otherwise records survive process crashes but not system crashes.
+                Defaults to True.
+        """
+
+        val_instance(__path, PathLike)
+        val_instance(every, (int, NoneType))
+        val_instance(interval, (dt.timedelta, NoneType))
+        val_instance(compact, int)
+        val_instance(fsync, bool)
+
+        if not every is None and every < 1:
+            raise ValueError(f"expected `every` greater than 0, got {every}.")
+
+        if compact < 1:
+            raise ValueError(f"expected `compact` greater than 0, got {compact}.")
+
+        self._path = Path(__path)
+        self._every = every
+        self._interval = interval
+        self._compact = compact
+        self._fsync = fsync
+        self._file = None
+        # serialized attributes of the last record and number of records since the last full record,
+        # deltas are only appended to a file that was loaded or written by this checkpoint
+        self._attributes: dict = {}
+        self._records = 0
+        self._synced = False
+
+    def save(self, strategy: Strategy, time: int, at_time: int, ticks: int) -> int:
+        """
+        Save the state of a strategy, as a delta of the previous record unless the file is due for compaction.
+
+        Args:
+            strategy (Strategy): strategy.
+            time (int): epoch nanoseconds of the last tick evaluated.
+            at_time (int): number of ticks evaluated at `time`.
+            ticks (int): total number of ticks evaluated.
+
+        Returns:
+            int: number of bytes written.
+        """
+
+        _attributes = {_name: pickle.dumps(_value, protocol=pickle.HIGHEST_PROTOCOL)
+                       for _name, _value in strategy.__snapshot__().items()}
+
+        if not self._synced or self._records >= self._compact:
+            _written = self._rewrite(_attributes, time, at_time, ticks)
+        else:
+            _changed = {_name: _value for _name, _value in _attributes.items() if self._attributes.get(_name) != _value}
+            _removed = tuple(_name for _name in self._attributes if not _name in _attributes)
+            _record = _encode(_DELTA, _changed, _removed, time, at_time, ticks)
+
+            if self._file is None:
+                self._file = open(self._path, "ab")
+
+            self._file.write(_record)
+            self._flush(self._file)
+            self._records += 1
+            _written = len(_record)
+
+        self._attributes = _attributes
+
+        return _written
+
+    def load(self) -> tuple[dict[str, Any], int, int, int] | NoneType:
+        """
+        Read the last complete state of the checkpoint file, a torn record at the end of the file is truncated.
+
+        Raises:
+            ValueError: If the file is not a checkpoint file.
+
+        Returns:
+            tuple[dict[str, Any], int, int, int] | NoneType: state, time (epoch nanoseconds) and number of ticks at
+                that time of the last tick, total ticks. None if there is no checkpoint.
+        """
+
+        self.close()
+        self._synced = False
+
+        if not self._path.exists():
+            return None
+
+        with open(self._path, "rb") as f:
+            _data = f.read()
+
+        if len(_data) < _HEADER.size:
+            raise ValueError("expected a checkpoint file, the header is truncated.")
+
+        _magic, _record_size, _ = _HEADER.unpack_from(_data)
+
+        if _magic != CHECKPOINT_MAGIC:
+            raise ValueError(f"expected {CHECKPOINT_MAGIC} checkpoint file magic, got {_magic}.")
+
+        if _record_size != _RECORD.size:
+            raise ValueError(f"expected {_RECORD.size} byte record headers, got {_record_size} byte record headers.")
+
+        _offset = _HEADER.size
+        _attributes = {}
+        _position = None
+        _records = 0
+
+        while _offset + _RECORD.size <= len(_data):
+            _tick_time, _at_time, _ticks, _size, _crc, _kind = _RECORD.unpack_from(_data, _offset)
+            _payload = _data[_offset + _RECORD.size:_offset + _RECORD.size + _size]
+
+            if len(_payload) != _size or zlib.crc32(_payload) != _crc:
+                break
+
+            if _kind & _COMPRESSED:
+                _payload = zlib.decompress(_payload)
+
+            _changed, _removed = pickle.loads(_payload)
+
+            if _kind & _FULL:
+                _attributes = {}
+                _records = 0
+            else:
+                _records += 1
+
+            _attributes.update(_changed)
+
+            for _name in _removed:
+                _attributes.pop(_name, None)
+
+            _position = _tick_time, _at_time, _ticks
+            _offset += _RECORD.size + _size
+
+        if _offset < len(_data):
+            with open(self._path, "r+b") as f:
+                f.truncate(_offset)
+
+        if _position is None:
+            return None
+
+        self._attributes = _attributes
+        self._records = _records
+        self._synced = True
+
+        return {_name: pickle.loads(_value) for _name, _value in _attributes.items()}, *_position
+
+    def restore(self, strategy: Strategy) -> tuple[int, int, int] | NoneType:
+        """
+        Restore the last complete state of the checkpoint file into a strategy.
+
+        Args:
+            strategy (Strategy): strategy.
+
+        Returns:
+            tuple[int, int, int] | NoneType: time (epoch nanoseconds) and number of ticks at that time of the last tick,
+                total ticks. None if there is no checkpoint.
+        """
+
+        _loaded = self.load()
+
+        if _loaded is None:
+            return None
+
+        strategy.__restore__(_loaded[0])
+
+        return _loaded[1:]
+
+    def close(self) -> None:
+        if not self._file is None:
+            self._file.close()
+            self._file = None
+
+    def _rewrite(self, attributes: dict[str, bytes], time: int, at_time: int, ticks: int) -> int:
+        """
+        Atomically replace the file by a single full record.
+        """
+
+        self.close()
+
+        _record = _encode(_FULL, attributes, (), time, at_time, ticks)
+        _tmp = self._path.with_name(self._path.name + ".tmp")
+
+        with open(_tmp, "wb") as f:
+            f.write(_HEADER.pack(CHECKPOINT_MAGIC, _RECORD.size, 0))
+            f.write(_record)
+            self._flush(f)
+
+        os.replace(_tmp, self._path)
+
+        self._file = open(self._path, "ab")
+        self._records = 0
+        self._synced = True
+
+        return _HEADER.size + len(_record)
+
+    def _flush(self, f) -> None:
+        f.flush()
+
+        if self._fsync:
+            os.fsync(f.fileno())
+
+
+def _encode(kind: int, changed: dict[str, bytes], removed: tuple[str], time: int, at_time: int, ticks: int) -> bytes:
+    _payload = pickle.dumps((changed, removed), protocol=pickle.HIGHEST_PROTOCOL)
+
+    if len(_payload) > _COMPRESS_MIN:
+        _compressed = zlib.compress(_payload, 1)
+
+        if len(_compressed) < len(_payload):
+            _payload = _compressed
+            kind |= _COMPRESSED
+
+    return _RECORD.pack(time, at_time, ticks, len(_payload), zlib.crc32(_payload), kind) + _payload
+
+
+class CheckpointStream(StreamWrapper):
+    """
+    DataStream wrapper checkpointing a strategy, used by bots created with a Checkpoint.
+
+    The strategy is restored from the checkpoint when the stream is created, then the ticks the restored state already
+    reflects are skipped: streams with a `seek()` method (e.g. ReplayStream) seek to the checkpoint, other streams are read
+    through it. A checkpoint is saved before requesting a tick once it is due, when every tick requested so far has been
+    evaluated, and when the stream is exhausted: the final checkpoint is saved before the `StopIteration` of the wrapped
+    stream is raised again, it is the end of stream signal `Bot.run()` returns on.
+
+    Responses of the ticks evaluated between the last checkpoint and a restart are returned again after the restart.
+    """
+
+    @property
+    def strategy(self) -> Strategy:
+        return self._strategy
+
+    @property
+    def checkpoint(self) -> Checkpoint:
+        return self._checkpoint
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def restored(self) -> bool:
+        return self._restored
+
+    def __init__(self, stream: DataStream, strategy: Strategy, checkpoint: Checkpoint) -> None:
+        """
+        Wrap a DataStream and restore a strategy from a checkpoint.
+
+        Args:
+            stream (DataStream): wrapped stream, datapoints start with their time (with their symbol then their time if keyed).
+            strategy (Strategy): checkpointed strategy.
+            checkpoint (Checkpoint): checkpoint.
+        """
+
+        val_instance(strategy, Strategy)
+        val_instance(checkpoint, Checkpoint)
+
+        super().__init__(stream, stream.keyed)
+
+        self._strategy = strategy
+        self._checkpoint = checkpoint
+        # position of the last tick returned: time, ticks at that time, total ticks
+        self._time = None
+        self._at_time = 0
+        self._ticks = 0
+        self._saved_ticks = 0
+        self._saved_at = _time.monotonic()
+        # position to resume from and number of ticks at its time skipped so far
+        self._resume = None
+        self._skipped = 0
+
+        _position = checkpoint.restore(strategy)
+        self._restored = not _position is None
+
+        if self._restored:
+            self._time, self._at_time, self._ticks = _position
+            self._saved_ticks = self._ticks
+            self._resume = self._time, self._at_time
+
+            if hasattr(stream, "seek"):
+                stream.seek(self._time)
+
+    def save(self) -> None:
+        """
+        Save a checkpoint now, every tick requested so far must have been evaluated.
+        """
+
+        if not self._time is None:
+            self._checkpoint.save(self._strategy, self._time, self._at_time, self._ticks)
+
+        self._saved_ticks = self._ticks
+        self._saved_at = _time.monotonic()
+
+    def _due(self) -> bool:
+        if self._ticks == self._saved_ticks:
+            return False
+
+        _every = self._checkpoint._every
+        _interval = self._checkpoint._interval
+
+        return (not _every is None and self._ticks - self._saved_ticks >= _every) or \
+            (not _interval is None and _time.monotonic() - self._saved_at >= _interval.total_seconds())
+
+    def _skip(self, time: int) -> bool:
+        """
+        Whether a tick is reflected by the restored state.
+        """
+
+        _resume_time, _resume_count = self._resume
+
+        if time < _resume_time:
+            return True
+
+        if time == _resume_time and self._skipped < _resume_count:
+            self._skipped += 1
+
+            return True
+
+        self._resume = None
+
+        return False
+
+    def request(self) -> Any:
+        if self._due():
+            self.save()
+
+        request = self._stream.request
+        index = 1 if self._keyed else 0
+
+        while True:
+            try:
+                data: Any = request()
+            except StopIteration:
+                if self._ticks != self._saved_ticks:
+                    self.save()
+
+                raise
+
+            time = data[index]
+
+            if not type(time) is int:
+                time = epoch_ns(time)
+
+            if self._resume is None or not self._skip(time):
+                break
+
+        if time == self._time:
+            self._at_time += 1
+        else:
+            self._time = time
+            self._at_time = 1
+
+        self._ticks += 1
+
+        return data
+
+    def request_many(self, max_n: int) -> TickChunk:
+        if self._due():
+            self.save()
+
+        while True:
+            try:
+                chunk: TickChunk = self._stream.request_many(max_n)
+            except StopIteration:
+                if self._ticks != self._saved_ticks:
+                    self.save()
+
+                raise
+
+            times = chunk.times.view(np.int64)
+
+            if self._resume is None:
+                break
+
+            _start = 0
+
+            while _start < len(times) and self._skip(int(times[_start])):
+                _start += 1
+
+            if _start < len(times):
+                if _start:
+                    chunk = TickChunk(chunk.times[_start:], chunk.prices[_start:],
+                                      None if chunk.symbols is None else chunk.symbols[_start:])
+                    times = times[_start:]
+
+                break
+
+        last = int(times[-1])
+        # ticks of the chunk before its trailing run of ticks at the time of its last tick
+        _before = np.flatnonzero(times != last)
+        _trailing = len(times) - (int(_before[-1]) + 1 if len(_before) else 0)
+
+        if not len(_before) and last == self._time:
+            self._at_time += _trailing
+        else:
+            self._time = last
+            self._at_time = _trailing
+
+        self._ticks += len(times)
+
+        return chunk
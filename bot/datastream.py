@@ -1,9 +1,129 @@
 from typing import Any
+
 from _utils.errors import RequiredOverwrite
+from _utils.time import epoch_ns
+from _utils.validate import val_instance
+
+
+class TickChunk:
+    """
+    Columnar chunk of ticks returned by `DataStream.request_many()`, numpy is only imported once a chunk is created
+    so that bots evaluating one tick at a time don't load it.
+    """
+
+    __slots__ = ("_times", "_prices", "_symbols")
+
+    @property
+    def times(self) -> "np.ndarray":
+        return self._times
+
+    @property
+    def prices(self) -> "np.ndarray":
+        return self._prices
+
+    @property
+    def symbols(self) -> "np.ndarray | None":
+        return self._symbols
+
+    def __init__(self, times: "np.ndarray", prices: "np.ndarray", symbols: "np.ndarray | None" = None) -> None:
+        """
+        Create a TickChunk.
+
+        Args:
+            times (np.ndarray): tick times, datetime64 (UTC) or epoch nanoseconds, not copied if datetime64[ns] or int64.
+            prices (np.ndarray): tick prices, not copied if float64.
+            symbols (np.ndarray | None, optional): tick symbols of keyed streams. Defaults to None.
+        """
+
+        import numpy as np
+
+        times = np.asarray(times)
+
+        # datetime64[ns] and int64 columns (e.g. memory mapped records) are kept as views, other units are converted
+        if np.issubdtype(times.dtype, np.datetime64):
+            times = times.astype("datetime64[ns]", copy=False)
+        else:
+            times = times.astype(np.int64, copy=False).view("datetime64[ns]")
+
+        self._times = times
+        self._prices = np.asarray(prices, dtype=np.float64)
+        self._symbols = None if symbols is None else np.asarray(symbols, dtype=object)
+
+        if len(self._prices) != len(times) or (not self._symbols is None and len(self._symbols) != len(times)):
+            raise ValueError("expected columns of the same length.")
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    def __iter__(self):
+        """
+        Iterate over the datapoints of the chunk, `(time, price)` or `(symbol, time, price)` with naive UTC datetimes.
+        """
+
+        times: list = self._times.astype("datetime64[us]").tolist()
+        prices: list = self._prices.tolist()
+
+        if self._symbols is None:
+            return zip(times, prices)
+
+        return zip(self._symbols.tolist(), times, prices)
+
 
 class DataStream:
+    # datapoints start with their symbol, `(symbol, time, price)` instead of `(time, price)`
+    keyed: bool = False
+
     def __init__(self) -> None:
         pass
     
     def request(self) -> Any:
-        RequiredOverwrite("`request()` requires overwrite.")
\ No newline at end of file
+        raise RequiredOverwrite("`request()` requires overwrite.")
+
+    def request_many(self, max_n: int) -> TickChunk:
+        """
+        Request up to `max_n` ticks as a columnar chunk, raise `StopIteration` when the stream is exhausted.
+        Streams receiving packets of ticks should overwrite it to return the ticks already available without blocking,
+        defaults to `max_n` calls to `request()` of `(time, price)` (or `(symbol, time, price)` if keyed) datapoints.
+
+        Args:
+            max_n (int): maximum number of ticks.
+
+        Returns:
+            TickChunk: between 1 and `max_n` ticks.
+        """
+
+        val_instance(max_n, int)
+
+        request = self.request
+        keyed = self.keyed
+        times, prices, symbols = [], [], []
+
+        for _ in range(max_n):
+            try:
+                data: Any = request()
+            except StopIteration:
+                break
+
+            if keyed:
+                symbols.append(data[0])
+                data = data[1:]
+
+            times.append(data[0] if type(data[0]) is int else epoch_ns(data[0]))
+            prices.append(data[1])
+
+        if not times:
+            raise StopIteration
+
+        return TickChunk(times, prices, symbols if keyed else None)
+
+
+class AsyncDataStream:
+    def __init__(self) -> None:
+        pass
+    
+    async def request(self) -> Any:
+        """
+        Await the next datapoint, raise `StopAsyncIteration` when the stream is exhausted.
+        """
+        
+        raise RequiredOverwrite("`request()` requires overwrite.")
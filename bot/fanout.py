@@ -0,0 +1,344 @@
+"""
+Module that stores the fan-out bot running many strategies over a single data stream.
+
+Every tick is requested and converted to arguments once, and every distinct feed filter is evaluated once per tick:
+strategies using the default `__feed__()` share the result of their `feed_filter` (instances of a class share the
+class attribute), strategies overwriting `__feed__()` are evaluated on their own. Responses are handled in tick order,
+and in the order the strategies were given within a tick, whether the strategies run on the calling thread or in
+groups on worker threads or processes.
+"""
+
+import multiprocessing as mp
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from heapq import merge
+from multiprocessing.connection import Connection
+from types import NoneType
+from typing import Any, Iterable
+
+from _utils.errors import RequiredOverwrite
+from _utils.validate import val_instance
+from bot.bot import as_args
+from bot.datastream import DataStream
+from strategy.base import Strategy
+from strategy.protocol.base import StrategyResponse
+
+
+# ways of running the strategies
+MODES = ("serial", "thread", "process")
+
+
+def _evaluate(group: list[tuple], batch: list[tuple], fed: list[list[bool]]) -> list[tuple]:
+    """
+    Evaluate the strategies of a group over a batch of ticks.
+
+    Args:
+        group (list[tuple]): `(index, strategy, filter index)` of the strategies, None filter index for strategies
+            evaluating their own `__feed__()`.
+        batch (list[tuple]): arguments of the ticks.
+        fed (list[list[bool]]): result of every distinct filter for every tick.
+
+    Returns:
+        list[tuple]: `(tick, index, response)` of every fed tick, ordered by tick and strategy index.
+    """
+
+    responses = []
+
+    for tick, args in enumerate(batch):
+        for index, strategy, filter_index in group:
+            if strategy.__feed__(*args) if filter_index is None else fed[filter_index][tick]:
+                responses.append((tick, index, strategy.next(*args)))
+
+    return responses
+
+
+def _worker(group: list[tuple], conn: Connection) -> None:
+    """
+    FanOutBot worker loop, evaluates `(batch, fed)` messages and sends back the responses of every batch.
+    A None message shuts the worker down, exceptions are sent back and end the worker.
+    """
+
+    try:
+        while True:
+            message = conn.recv()
+
+            if message is None:
+                break
+
+            conn.send(_evaluate(group, *message))
+    except BaseException as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+class _ThreadGroups:
+    """
+    Strategy groups evaluated by one worker thread each, batches of a group are evaluated in order.
+    """
+
+    def __init__(self, groups: list[list[tuple]]) -> None:
+        self._groups = groups
+        self._executors = [ThreadPoolExecutor(1) for _ in groups]
+
+    def submit(self, batch: list[tuple], fed: list[list[bool]]) -> list[Future]:
+        return [_executor.submit(_evaluate, _group, batch, fed) for _group, _executor in zip(self._groups, self._executors)]
+
+    def collect(self, token: list[Future]) -> list[list[tuple]]:
+        return [_future.result() for _future in token]
+
+    def close(self) -> None:
+        for _executor in self._executors:
+            _executor.shutdown(cancel_futures=True)
+
+
+class _ProcessGroups:
+    """
+    Strategy groups evaluated by one worker process each, the strategies live in the workers.
+    """
+
+    def __init__(self, groups: list[list[tuple]]) -> None:
+        self._conns = []
+        self._processes = []
+
+        for _group in groups:
+            conn, worker_conn = mp.Pipe()
+            process = mp.Process(target=_worker, args=(_group, worker_conn), daemon=True)
+            process.start()
+            worker_conn.close()
+
+            self._conns.append(conn)
+            self._processes.append(process)
+
+    def submit(self, batch: list[tuple], fed: list[list[bool]]) -> None:
+        for conn in self._conns:
+            conn.send((batch, fed))
+
+    def collect(self, token: NoneType) -> list[list[tuple]]:
+        # pipes are ordered, the next message of every worker answers the oldest batch in flight
+        results = []
+
+        for conn in self._conns:
+            message = conn.recv()
+
+            if isinstance(message, BaseException):
+                raise message
+
+            results.append(message)
+
+        return results
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+        for process in self._processes:
+            process.join()
+
+        for conn in self._conns:
+            conn.close()
+
+
+class FanOutBot:
+    """
+    Bot running many strategies over a single data stream, responses are handled by `handle(name, response)` on the
+    calling thread.
+
+        class MyBot(FanOutBot):
+            def handle(self, name, strategy_response):
+                ...
+
+        MyBot({"fast": SampleStrategy(10), "slow": SampleStrategy(40)}, data_stream, mode="thread").run()
+
+    In 'process' mode every worker evaluates copies of its strategies, the `strategies` of the bot are not updated.
+    """
+
+    @property
+    def data_stream(self) -> DataStream:
+        return self._data_stream
+
+    @data_stream.setter
+    def data_stream(self, data_stream: DataStream) -> None:
+        val_instance(data_stream, DataStream)
+
+        self._data_stream = data_stream
+
+    @data_stream.deleter
+    def data_stream(self) -> None:
+        raise AttributeError("Cannot delete `data_stream` attribute.")
+
+    @property
+    def strategies(self) -> dict[Any, Strategy]:
+        return self._strategies
+
+    @property
+    def filters(self) -> int:
+        """
+        Number of distinct feed filters evaluated per tick.
+        """
+
+        return len(self._filters)
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def __init__(self, strategies: dict[Any, Strategy] | Iterable[Strategy], data_stream: DataStream, mode: str = "serial",
+                 workers: int | NoneType = None, batch_size: int = 256) -> None:
+        """
+        Create a FanOutBot.
+
+        Args:
+            strategies (dict[Any, Strategy] | Iterable[Strategy]): strategies by name, or strategies named by their position.
+            data_stream (DataStream): data stream.
+            mode (str, optional): 'serial' (calling thread), 'thread' or 'process' (picklable strategies) groups. Defaults to 'serial'.
+            workers (int | NoneType, optional): number of strategy groups of the 'thread' and 'process' modes.
+                Defaults to None, the number of cpus.
+            batch_size (int, optional): number of ticks sent to the groups at once in the 'thread' and 'process' modes. Defaults to 256.
+        """
+
+        val_instance(mode, str)
+        val_instance(workers, (int, NoneType))
+        val_instance(batch_size, int)
+
+        if not mode in MODES:
+            raise ValueError(f"expected `mode` in {MODES}, got '{mode}'.")
+
+        if batch_size < 1:
+            raise ValueError(f"expected `batch_size` greater than 0, got {batch_size}.")
+
+        self._data_stream = None
+        self.data_stream = data_stream
+
+        self._strategies = dict(strategies) if isinstance(strategies, dict) else dict(enumerate(strategies))
+
+        for _strategy in self._strategies.values():
+            val_instance(_strategy, Strategy)
+
+        self._names = list(self._strategies)
+        self._mode = mode
+        self._workers = max(1, min(workers or os.cpu_count() or 1, len(self._strategies)))
+        self._batch_size = batch_size
+        self._stopping = False
+
+        # distinct feed filters, None stands for strategies fed every tick
+        self._filters = []
+        _filter_indices: dict = {}
+        # (index, strategy, filter index) of every strategy
+        self._entries = []
+
+        for _index, _strategy in enumerate(self._strategies.values()):
+            if type(_strategy).__feed__ is Strategy.__feed__:
+                _filter = _strategy.feed_filter
+
+                try:
+                    _filter_index = _filter_indices[id(_filter)]
+                except KeyError:
+                    _filter_index = _filter_indices[id(_filter)] = len(self._filters)
+                    self._filters.append(_filter)
+            else:
+                _filter_index = None
+
+            self._entries.append((_index, _strategy, _filter_index))
+
+    def stop(self) -> None:
+        """
+        Request a graceful shutdown, every tick already requested is evaluated and handled.
+        """
+
+        self._stopping = True
+
+    def run(self) -> None:
+        """
+        Run the bot until the data stream is exhausted (`StopIteration`) or `stop()` is called.
+        """
+
+        self._stopping = False
+
+        if self._mode == "serial":
+            return self._run_serial()
+
+        # strategies are dealt round robin so that groups get a similar share of every filter
+        groups = [self._entries[_group::self._workers] for _group in range(self._workers)]
+        runner = _ThreadGroups(groups) if self._mode == "thread" else _ProcessGroups(groups)
+        in_flight = False
+        token_in_flight = None
+
+        try:
+            while True:
+                batch = self._request_batch()
+
+                if batch:
+                    # the next batch is evaluated while the responses of the previous one are handled
+                    token = runner.submit(batch, self._feed(batch))
+
+                if in_flight:
+                    self._handle_batch(runner.collect(token_in_flight))
+
+                if not batch:
+                    break
+
+                in_flight, token_in_flight = True, token
+        finally:
+            runner.close()
+
+    def _run_serial(self) -> None:
+        request = self._data_stream.request
+        filters = self._filters
+        entries = self._entries
+        names = self._names
+        handle = self.handle
+        # keyed datapoints `(symbol, time, price)` start with their symbol
+        time_index = 1 if self._data_stream.keyed else 0
+
+        while not self._stopping:
+            try:
+                data: Any = request()
+            except StopIteration:
+                break
+
+            args: tuple = as_args(data)
+            fed = [True if _filter is None else _filter(args[time_index]) for _filter in filters]
+
+            for index, strategy, filter_index in entries:
+                if strategy.__feed__(*args) if filter_index is None else fed[filter_index]:
+                    handle(names[index], strategy.next(*args))
+
+    def _request_batch(self) -> list[tuple]:
+        batch = []
+        request = self._data_stream.request
+
+        while len(batch) < self._batch_size and not self._stopping:
+            try:
+                batch.append(as_args(request()))
+            except StopIteration:
+                self._stopping = True
+
+        return batch
+
+    def _feed(self, batch: list[tuple]) -> list[list[bool]]:
+        """
+        Result of every distinct filter for every tick of a batch.
+        """
+
+        _all = [True] * len(batch)
+        _index = 1 if self._data_stream.keyed else 0
+
+        return [_all if _filter is None else [_filter(_args[_index]) for _args in batch] for _filter in self._filters]
+
+    def _handle_batch(self, results: list[list[tuple]]) -> None:
+        names = self._names
+        handle = self.handle
+
+        for _, index, response in merge(*results):
+            handle(names[index], response)
+
+    def handle(self, name: Any, strategy_response: StrategyResponse) -> None:
+        raise RequiredOverwrite("`handle()` requires overwrite.")
@@ -0,0 +1,547 @@
+"""
+Module that stores the write-ahead journal of strategy responses and broker fills.
+
+`Journal.append()` only queues a record, a background writer thread encodes the queued records, writes them in a single
+write and group commits them: the journal is fsynced once `sync_every` records or `sync_interval` have passed since the
+oldest record not yet synced, whichever comes first, so the bot never waits on the disk unless it calls `sync()`.
+
+A journal is a directory of segments named after the sequence number of their first record. A segment is a 16 byte
+header (`JOURNAL_MAGIC`, record header size, reserved) followed by records: a 16 byte header (payload size, crc32 of the
+payload, sequence number) and the payload. Segments are rotated at the record that makes them reach `segment_size` bytes,
+a journal opened again truncates a torn record at the end of its last segment and starts a new segment.
+
+Bots created with a journal append their 'BUY' and 'SELL' responses, the orders a restarted bot needs to reconcile with
+its broker. 'HOLD' responses place no order and are not journaled. Fills are journaled by a `JournalingBot` passed to the
+broker in place of the `brokers.base.Bot` receiving them.
+"""
+
+import datetime as dt
+import os
+import struct
+import threading
+import time as _time
+import zlib
+from collections import deque
+from pathlib import Path
+from types import NoneType
+from typing import Iterator
+
+from _utils.typing import Callable, PathLike
+from _utils.validate import val_instance
+from brokers.base import Bot
+from brokers.order import Fill
+from strategy.protocol.base import StrategyResponse
+from strategy.protocol.batch import COMMAND_CODES, NULL_INT, _RESPONSE_CLASSES, _ns_to_time, _time_to_ns
+
+
+# magic bytes at the start of every segment
+JOURNAL_MAGIC = b"ODINJRN1"
+
+# segment header: magic, record header size, reserved
+_HEADER = struct.Struct("<8sII")
+
+# record header: payload size, crc32 of the payload, sequence number
+_RECORD = struct.Struct("<IIQ")
+
+# payloads: kind, command or side code, time (epoch nanoseconds), price, uid, then length prefixed ticker (and exchange)
+_RESPONSE = struct.Struct("<BBqdq")
+_FILL = struct.Struct("<BBqdqdd")
+_STRING = struct.Struct("<H")
+
+_KIND_RESPONSE = 1
+_KIND_FILL = 2
+
+# length of missing strings
+_NULL_STRING = 0xFFFF
+
+_SIDE_CODES = {"BUY": 0, "SELL": 1}
+_SIDES = ("BUY", "SELL")
+
+_SEGMENT_SUFFIX = ".journal"
+
+
+def _encode_string(__string: str | NoneType) -> bytes:
+    if __string is None:
+        return _STRING.pack(_NULL_STRING)
+
+    _bytes = __string.encode()
+
+    return _STRING.pack(len(_bytes)) + _bytes
+
+
+def _decode_string(__data: bytes, __offset: int) -> tuple[str | NoneType, int]:
+    (_size,) = _STRING.unpack_from(__data, __offset)
+    __offset += _STRING.size
+
+    if _size == _NULL_STRING:
+        return None, __offset
+
+    return __data[__offset:__offset + _size].decode(), __offset + _size
+
+
+def _encode(__record: StrategyResponse | Fill) -> bytes:
+    """
+    Encode the payload of a response or a fill.
+    """
+
+    if isinstance(__record, Fill):
+        _time_ns = NULL_INT if __record._time is None else _time_to_ns(__record._time)
+
+        return _FILL.pack(_KIND_FILL, _SIDE_CODES[__record._side], _time_ns, __record._price, __record._uid,
+                          __record._quantity, __record._remaining) + _encode_string(__record._ticker)
+
+    _uid = __record._uid
+
+    return _RESPONSE.pack(_KIND_RESPONSE, COMMAND_CODES[__record._command], _time_to_ns(__record._time),
+                          __record._price, NULL_INT if _uid is None else _uid) + \
+        _encode_string(__record._ticker) + _encode_string(__record._exchange)
+
+
+def _decode(__payload: bytes) -> StrategyResponse | Fill:
+    if __payload[0] == _KIND_FILL:
+        _, _side, _time_ns, _price, _uid, _quantity, _remaining = _FILL.unpack_from(__payload)
+        _ticker, _ = _decode_string(__payload, _FILL.size)
+
+        return Fill(_uid, _SIDES[_side], _quantity, _price, _remaining, _ticker, _ns_to_time(_time_ns))
+
+    _, _command, _time_ns, _price, _uid = _RESPONSE.unpack_from(__payload)
+    _ticker, _offset = _decode_string(__payload, _RESPONSE.size)
+    _exchange, _ = _decode_string(__payload, _offset)
+
+    return _RESPONSE_CLASSES[_command].fast(
+        time=_ns_to_time(_time_ns),
+        price=_price if _price == _price else None,
+        ticker=_ticker,
+        exchange=_exchange,
+        uid=None if _uid == NULL_INT else _uid
+    )
+
+
+def _segments(__directory: Path) -> list[tuple[int, Path]]:
+    """
+    `(first sequence number, path)` of the segments of a journal, in order.
+    """
+
+    return sorted((int(_path.stem), _path) for _path in __directory.glob(f"*{_SEGMENT_SUFFIX}") if _path.stem.isdigit())
+
+
+def _scan(__data: bytes) -> Iterator[tuple[int, int, int]]:
+    """
+    `(sequence number, payload offset, payload size)` of the complete records of a segment, a segment ends at its
+    first torn record.
+
+    Raises:
+        ValueError: If the segment header is not a valid journal segment header.
+    """
+
+    if len(__data) < _HEADER.size:
+        return
+
+    _magic, _record_size, _ = _HEADER.unpack_from(__data)
+
+    if _magic != JOURNAL_MAGIC:
+        raise ValueError(f"expected {JOURNAL_MAGIC} journal segment magic, got {_magic}.")
+
+    if _record_size != _RECORD.size:
+        raise ValueError(f"expected {_RECORD.size} byte record headers, got {_record_size} byte record headers.")
+
+    _offset = _HEADER.size
+    _end = len(__data)
+
+    while _offset + _RECORD.size <= _end:
+        _size, _crc, _sequence = _RECORD.unpack_from(__data, _offset)
+        _start = _offset + _RECORD.size
+
+        if _start + _size > _end or zlib.crc32(__data[_start:_start + _size]) != _crc:
+            return
+
+        yield _sequence, _start, _size
+
+        _offset = _start + _size
+
+
+def iter_journal(__directory: PathLike, start: int = 0) -> Iterator[tuple[int, StrategyResponse | Fill]]:
+    """
+    Read a journal sequentially, e.g. to recover or audit a bot. Every segment is read in a single read.
+
+    Args:
+        __directory (PathLike): journal directory.
+        start (int, optional): first sequence number read. Defaults to 0.
+
+    Yields:
+        tuple[int, StrategyResponse | Fill]: sequence number and record.
+    """
+
+    val_instance(__directory, PathLike)
+    val_instance(start, int)
+
+    _segments_ = _segments(Path(__directory))
+
+    for _index, (_first, _path) in enumerate(_segments_):
+        # segments ending before `start` are not read
+        if _index + 1 < len(_segments_) and _segments_[_index + 1][0] <= start:
+            continue
+
+        with open(_path, "rb") as f:
+            _data = f.read()
+
+        for _sequence, _offset, _size in _scan(_data):
+            if _sequence >= start:
+                yield _sequence, _decode(_data[_offset:_offset + _size])
+
+
+class Journal:
+    """
+    Append-only write-ahead journal of StrategyResponse and Fill records, written and fsynced by a background thread.
+
+        with Journal("journal", sync_every=256, sync_interval=dt.timedelta(milliseconds=5)) as journal:
+            MyBot(strategy, data_stream, journal=journal).run()
+
+        for sequence, record in iter_journal("journal"):
+            ...
+    """
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def appended(self) -> int:
+        """
+        Sequence number of the next record appended.
+        """
+
+        return self._appended
+
+    @property
+    def synced(self) -> int:
+        """
+        Sequence number below which every record is durable on disk.
+        """
+
+        return self._synced
+
+    def __init__(self, __directory: PathLike, sync_every: int | NoneType = 256, sync_interval: dt.timedelta | NoneType = dt.timedelta(milliseconds=5),
+                 segment_size: int = 64 << 20) -> None:
+        """
+        Open a journal, records are appended after the records already in the directory.
+
+        Args:
+            __directory (PathLike): journal directory, created if missing.
+            sync_every (int | NoneType, optional): fsync once `sync_every` records are not synced. Defaults to 256.
+            sync_interval (dt.timedelta | NoneType, optional): fsync at most `sync_interval` after a record is appended.
+                Defaults to 5 milliseconds. Without `sync_every` and `sync_interval` records are only fsynced when a segment
+                is rotated, by `sync()` and by `close()`.
+            segment_size (int, optional): size in bytes segments are rotated at. Defaults to 64 MiB.
+        """
+
+        val_instance(__directory, PathLike)
+        val_instance(sync_every, (int, NoneType))
+        val_instance(sync_interval, (dt.timedelta, NoneType))
+        val_instance(segment_size, int)
+
+        if not sync_every is None and sync_every < 1:
+            raise ValueError(f"expected `sync_every` greater than 0, got {sync_every}.")
+
+        self._directory = Path(__directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._sync_every = sync_every
+        self._sync_interval = None if sync_interval is None else sync_interval.total_seconds()
+        self._segment_size = segment_size
+
+        self._appended = self._recover()
+        self._written = self._synced = self._appended
+        self._file = None
+        self._segment_bytes = 0
+
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._idle = False
+        self._closing = False
+        # records `sync()` waits for
+        self._sync_to = 0
+        self._error = None
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _recover(self) -> int:
+        """
+        Truncate a torn record at the end of the last segment.
+
+        Returns:
+            int: sequence number of the next record.
+        """
+
+        _segments_ = _segments(self._directory)
+
+        if not _segments_:
+            return 0
+
+        _first, _path = _segments_[-1]
+
+        with open(_path, "rb") as f:
+            _data = f.read()
+
+        _next = _first
+        _end = _HEADER.size
+
+        for _sequence, _offset, _size in _scan(_data):
+            _next = _sequence + 1
+            _end = _offset + _size
+
+        if _end < len(_data):
+            with open(_path, "r+b") as f:
+                f.truncate(_end)
+
+        return _next
+
+    def append(self, record: StrategyResponse | Fill) -> int:
+        """
+        Queue a record, it is written and fsynced by the writer thread.
+
+        Args:
+            record (StrategyResponse | Fill): response or fill.
+
+        Raises:
+            Exception: The error of the writer thread, if it failed.
+
+        Returns:
+            int: sequence number of the record.
+        """
+
+        if not self._error is None:
+            raise self._error
+
+        with self._lock:
+            _sequence = self._appended
+            self._appended += 1
+            self._pending.append(record)
+
+        if self._idle:
+            with self._condition:
+                self._condition.notify_all()
+
+        return _sequence
+
+    def sync(self, sequence: int | NoneType = None, timeout: float | NoneType = None) -> bool:
+        """
+        Wait until a record, every record appended so far by default, is durable.
+
+        Args:
+            sequence (int | NoneType, optional): sequence number of the record. Defaults to None, the last record appended.
+            timeout (float | NoneType, optional): maximum seconds waited. Defaults to None, no timeout.
+
+        Raises:
+            Exception: The error of the writer thread, if it failed.
+
+        Returns:
+            bool: True if the record is durable, False if the timeout expired.
+        """
+
+        _target = self._appended if sequence is None else sequence + 1
+
+        with self._condition:
+            self._sync_to = max(self._sync_to, _target)
+            self._condition.notify_all()
+            _durable = self._condition.wait_for(lambda: self._synced >= _target or not self._error is None, timeout)
+
+        if not self._error is None:
+            raise self._error
+
+        return _durable
+
+    def close(self) -> None:
+        """
+        Write and fsync every queued record and stop the writer thread.
+
+        Raises:
+            Exception: The error of the writer thread, if it failed.
+        """
+
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+
+        self._thread.join()
+
+        if not self._error is None:
+            raise self._error
+
+    def _write(self) -> None:
+        """
+        Writer thread loop.
+        """
+
+        pending = self._pending
+        condition = self._condition
+        # monotonic time of the oldest record written and not synced
+        oldest = None
+
+        try:
+            while True:
+                with condition:
+                    # the flag is set before the queue is checked, an append either is seen here or sees the flag and notifies
+                    self._idle = True
+
+                    if not pending and not self._closing and self._sync_to <= self._synced:
+                        condition.wait(None if oldest is None or self._sync_interval is None else
+                                       max(0.0, oldest + self._sync_interval - _time.monotonic()))
+
+                    self._idle = False
+                    closing = self._closing
+                    sync_to = self._sync_to
+
+                _records = []
+
+                while pending:
+                    _records.append(pending.popleft())
+
+                if _records:
+                    self._write_records(_records)
+
+                    if oldest is None:
+                        oldest = _time.monotonic()
+
+                _unsynced = self._written - self._synced
+
+                if _unsynced and (
+                    closing or sync_to > self._synced
+                    or (not self._sync_every is None and _unsynced >= self._sync_every)
+                    or (not self._sync_interval is None and _time.monotonic() - oldest >= self._sync_interval)
+                ):
+                    self._sync()
+                    oldest = None
+
+                if closing and not pending:
+                    break
+        except BaseException as e:
+            self._error = e
+
+            with condition:
+                condition.notify_all()
+        finally:
+            if not self._file is None:
+                self._file.close()
+                self._file = None
+
+    def _write_records(self, records: list) -> None:
+        if self._file is None:
+            self._rotate()
+
+        _chunks = []
+        _sequence = self._written
+        _segment_bytes = self._segment_bytes
+
+        for _record in records:
+            _payload = _encode(_record)
+            _chunks.append(_RECORD.pack(len(_payload), zlib.crc32(_payload), _sequence))
+            _chunks.append(_payload)
+            _sequence += 1
+            _segment_bytes += _RECORD.size + len(_payload)
+
+            # the segment is rotated at the record reaching `segment_size`, even within a batch
+            if _segment_bytes >= self._segment_size:
+                self._write_chunks(_chunks, _sequence)
+                self._rotate()
+
+                _chunks = []
+                _segment_bytes = self._segment_bytes
+
+        if _chunks:
+            self._write_chunks(_chunks, _sequence)
+
+    def _write_chunks(self, chunks: list[bytes], sequence: int) -> None:
+        """
+        Write encoded records in a single write, `sequence` is the sequence number following the last one.
+        """
+
+        _data = b"".join(chunks)
+        self._file.write(_data)
+        self._segment_bytes += len(_data)
+        self._written = sequence
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+
+        with self._condition:
+            self._synced = self._written
+            self._condition.notify_all()
+
+    def _rotate(self) -> None:
+        """
+        Close the current segment, durably, and start a new one at the next sequence number.
+        """
+
+        if not self._file is None:
+            if self._written != self._synced:
+                self._sync()
+
+            self._file.close()
+
+        _path = self._directory / f"{self._written:020d}{_SEGMENT_SUFFIX}"
+        self._file = open(_path, "ab", buffering=0)
+
+        if not self._file.tell():
+            self._file.write(_HEADER.pack(JOURNAL_MAGIC, _RECORD.size, 0))
+            os.fsync(self._file.fileno())
+
+        self._segment_bytes = self._file.tell()
+
+
+class JournalingBot(Bot):
+    """
+    `brokers.base.Bot` appending every fill to a journal before passing it to its callback.
+
+        with Journal("journal") as journal:
+            broker = SimulatedBroker(JournalingBot(journal, on_fill))
+            MyBot(strategy, data_stream, journal=journal).run()
+    """
+
+    @property
+    def journal(self) -> Journal:
+        return self._journal
+
+    @property
+    def callback(self) -> Callable:
+        return self._journaled
+
+    @callback.setter
+    def callback(self, callback: Callable) -> None:
+        val_instance(callback, Callable)
+
+        self._callback = callback
+
+    @callback.deleter
+    def callback(self) -> None:
+        self._callback = lambda _: None
+
+    def __init__(self, journal: Journal, callback: Callable = lambda _: None) -> None:
+        """
+        Create a JournalingBot.
+
+        Args:
+            journal (Journal): journal the fills are appended to.
+            callback (Callable, optional): function of a fill called after it is appended, it may be a coroutine
+                function for asynchronous brokers. Defaults to ignoring fills.
+        """
+
+        val_instance(journal, Journal)
+
+        self._journal = journal
+        append = journal.append
+
+        def journaled(fill: Fill) -> object:
+            append(fill)
+
+            return self._callback(fill)
+
+        self._journaled = journaled
+
+        super().__init__(callback)
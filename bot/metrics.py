@@ -0,0 +1,314 @@
+"""
+Module that stores the opt-in instrumentation of `Bot.run`.
+
+Stage latencies are recorded in nanoseconds into fixed bucket log-linear histograms (HDR style): every power of two
+range is split into `2 ** (precision - 1)` linear buckets, so values are kept within a relative error of
+`2 ** (1 - precision)` with a fixed amount of memory, and recording a value is a few integer operations.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable
+
+from _utils.typing import PathLike
+from _utils.validate import val_instance
+
+
+# stages of `Bot.run` timed by BotMetrics
+STAGES = ("request", "feed", "next", "handle")
+
+# upper bounds (seconds) of the buckets exported to Prometheus
+PROMETHEUS_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                      1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    Fixed bucket log-linear histogram of non negative integer values (nanoseconds), values above `highest` are
+    recorded as `highest`.
+    """
+
+    __slots__ = ("_precision", "_sub", "_half", "_highest", "_counts", "_count", "_sum", "_min", "_max")
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> int:
+        return self._sum
+
+    @property
+    def min(self) -> int | None:
+        return self._min if self._count else None
+
+    @property
+    def max(self) -> int | None:
+        return self._max if self._count else None
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count else float("nan")
+
+    def __init__(self, precision: int = 7, highest: int = 1 << 40) -> None:
+        """
+        Create a LatencyHistogram.
+
+        Args:
+            precision (int, optional): significant bits kept, values are recorded within `2 ** (1 - precision)`. Defaults to 7, 1.6%.
+            highest (int, optional): highest trackable value. Defaults to 2 ** 40, about 18 minutes in nanoseconds.
+        """
+
+        val_instance(precision, int)
+        val_instance(highest, int)
+
+        if not 2 <= precision <= 16:
+            raise ValueError(f"expected `precision` between 2 and 16, got {precision}.")
+
+        self._precision = precision
+        self._sub = 1 << precision
+        self._half = self._sub >> 1
+        self._highest = highest
+        self._counts = [0] * (self._index(highest) + 1)
+        self._count = 0
+        self._sum = 0
+        self._min = highest
+        self._max = 0
+
+    def _index(self, value: int) -> int:
+        _shift = value.bit_length() - self._precision
+
+        if _shift <= 0:
+            return value
+
+        return _shift * self._half + (value >> _shift)
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """
+        Lowest and highest value of a bucket.
+        """
+
+        if index < self._sub:
+            return index, index
+
+        _shift = (index - self._sub) // self._half + 1
+        _mantissa = index - _shift * self._half
+
+        return _mantissa << _shift, ((_mantissa + 1) << _shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Record a value.
+
+        Args:
+            value (int): non negative integer value, e.g. nanoseconds.
+        """
+
+        if value > self._highest:
+            value = self._highest
+        elif value < 0:
+            value = 0
+
+        _shift = value.bit_length() - self._precision
+        self._counts[value if _shift <= 0 else _shift * self._half + (value >> _shift)] += 1
+        self._count += 1
+        self._sum += value
+
+        if value < self._min:
+            self._min = value
+
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, q: float) -> int | None:
+        """
+        Value below which `q` percent of the recorded values fall, within the precision of the histogram.
+
+        Args:
+            q (float): percentile between 0 and 100.
+
+        Returns:
+            int | None: highest value of the bucket of the percentile, None if nothing was recorded.
+        """
+
+        if not self._count:
+            return None
+
+        _rank = max(1, -(-self._count * q // 100))
+        _seen = 0
+
+        for _index, _count in enumerate(self._counts):
+            _seen += _count
+
+            if _seen >= _rank:
+                return min(self._bounds(_index)[1], self._max)
+
+        return self._max
+
+    def cumulative(self, bounds: Iterable[int]) -> list[int]:
+        """
+        Number of recorded values at or below each bound, bounds are rounded to bucket boundaries.
+
+        Args:
+            bounds (Iterable[int]): increasing bounds.
+
+        Returns:
+            list[int]
+        """
+
+        _counts = []
+        _seen = 0
+        _index = 0
+
+        for _bound in bounds:
+            _bound_index = self._index(min(int(_bound), self._highest))
+
+            while _index <= _bound_index:
+                _seen += self._counts[_index]
+                _index += 1
+
+            _counts.append(_seen)
+
+        return _counts
+
+    def reset(self) -> None:
+        self._counts = [0] * len(self._counts)
+        self._count = 0
+        self._sum = 0
+        self._min = self._highest
+        self._max = 0
+
+    def snapshot(self) -> dict:
+        """
+        Summary of the histogram: count, sum, min, max, mean and the 50th, 90th, 99th and 99.9th percentiles.
+        """
+
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9)
+        }
+
+
+class BotMetrics:
+    """
+    Instrumentation of a Bot: latency histograms of the `request`, `feed`, `next` and `handle` stages (nanoseconds),
+    fed and filtered tick counts, and the number of responses per command.
+
+    Chunked bots time `request_many()` as `request` and `next_many()` as `next` once per chunk and don't time `feed`.
+    """
+
+    @property
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        return self._histograms
+
+    @property
+    def fed(self) -> int:
+        return self._fed
+
+    @property
+    def filtered(self) -> int:
+        return self._filtered
+
+    @property
+    def responses(self) -> dict[str, int]:
+        return self._responses
+
+    def __init__(self, precision: int = 7) -> None:
+        """
+        Create BotMetrics.
+
+        Args:
+            precision (int, optional): significant bits kept by the histograms. Defaults to 7, 1.6%.
+        """
+
+        self._histograms = {_stage: LatencyHistogram(precision) for _stage in STAGES}
+        self._fed = 0
+        self._filtered = 0
+        self._responses = {"BUY": 0, "SELL": 0, "HOLD": 0}
+
+    def reset(self) -> None:
+        for _histogram in self._histograms.values():
+            _histogram.reset()
+
+        self._fed = 0
+        self._filtered = 0
+        self._responses = dict.fromkeys(self._responses, 0)
+
+    def snapshot(self) -> dict:
+        """
+        Dictionary of every metric.
+        """
+
+        return {
+            "stages": {_stage: _histogram.snapshot() for _stage, _histogram in self._histograms.items()},
+            "ticks": {"fed": self._fed, "filtered": self._filtered},
+            "responses": dict(self._responses)
+        }
+
+    def to_prometheus(self, prefix: str = "odin_bot") -> str:
+        """
+        Export every metric in the Prometheus text exposition format, latencies in seconds.
+
+        Args:
+            prefix (str, optional): metric name prefix. Defaults to "odin_bot".
+
+        Returns:
+            str
+        """
+
+        val_instance(prefix, str)
+
+        _lines = [
+            f"# HELP {prefix}_stage_seconds Latency of the stages of Bot.run.",
+            f"# TYPE {prefix}_stage_seconds histogram"
+        ]
+
+        for _stage, _histogram in self._histograms.items():
+            _counts = _histogram.cumulative(round(_bound * 1e9) for _bound in PROMETHEUS_BUCKETS)
+
+            for _bound, _count in zip(PROMETHEUS_BUCKETS, _counts):
+                _lines.append(f'{prefix}_stage_seconds_bucket{{stage="{_stage}",le="{_bound:g}"}} {_count}')
+
+            _lines.append(f'{prefix}_stage_seconds_bucket{{stage="{_stage}",le="+Inf"}} {_histogram.count}')
+            _lines.append(f'{prefix}_stage_seconds_sum{{stage="{_stage}"}} {_histogram.sum / 1e9:.9f}')
+            _lines.append(f'{prefix}_stage_seconds_count{{stage="{_stage}"}} {_histogram.count}')
+
+        _lines += [
+            f"# HELP {prefix}_ticks_total Ticks requested by Bot.run by feed outcome.",
+            f"# TYPE {prefix}_ticks_total counter",
+            f'{prefix}_ticks_total{{outcome="fed"}} {self._fed}',
+            f'{prefix}_ticks_total{{outcome="filtered"}} {self._filtered}',
+            f"# HELP {prefix}_responses_total Strategy responses by command.",
+            f"# TYPE {prefix}_responses_total counter"
+        ]
+
+        for _command, _count in self._responses.items():
+            _lines.append(f'{prefix}_responses_total{{command="{_command}"}} {_count}')
+
+        return "\n".join(_lines) + "\n"
+
+    def write_prometheus(self, __path: PathLike, prefix: str = "odin_bot") -> None:
+        """
+        Atomically write the Prometheus export to a file, e.g. for the node exporter textfile collector.
+
+        Args:
+            __path (PathLike): path to the file.
+            prefix (str, optional): metric name prefix. Defaults to "odin_bot".
+        """
+
+        val_instance(__path, PathLike)
+
+        _path = Path(__path)
+        _tmp = _path.with_name(_path.name + ".tmp")
+
+        with open(_tmp, "w") as f:
+            f.write(self.to_prometheus(prefix))
+
+        os.replace(_tmp, _path)
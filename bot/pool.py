@@ -0,0 +1,307 @@
+import datetime as dt
+import multiprocessing as mp
+import os
+import threading
+import time as _time
+from bisect import bisect
+from multiprocessing.connection import Connection, wait
+from types import NoneType
+from typing import Any, Callable
+from zlib import crc32
+from _utils.errors import RequiredOverwrite
+from _utils.validate import val_instance
+from bot.datastream import DataStream
+from strategy.base import Strategy
+from strategy.protocol.base import StrategyResponse
+
+
+class ConsistentHash:
+    """
+    Consistent hash ring mapping keys to nodes, adding or removing a node only moves the keys of that node.
+    """
+
+    @property
+    def nodes(self) -> tuple[int]:
+        return self._nodes
+
+    def __init__(self, nodes: int, replicas: int = 64) -> None:
+        """
+        Create a ConsistentHash ring.
+
+        Args:
+            nodes (int): number of nodes, keys are mapped to `0..nodes - 1`.
+            replicas (int, optional): virtual nodes per node. Defaults to 64.
+        """
+
+        val_instance(nodes, int)
+        val_instance(replicas, int)
+
+        if nodes < 1:
+            raise ValueError(f"expected `nodes` greater than 0, got {nodes}.")
+
+        self._nodes = tuple(range(nodes))
+
+        _ring = sorted((crc32(f"{_node}:{_replica}".encode()), _node)
+                       for _node in self._nodes for _replica in range(replicas))
+
+        self._hashes = [_hash for _hash, _ in _ring]
+        self._ring_nodes = [_node for _, _node in _ring]
+        self._cache: dict = {}
+
+    def __getitem__(self, __key: str) -> int:
+        try:
+            return self._cache[__key]
+        except KeyError:
+            _index = bisect(self._hashes, crc32(__key.encode())) % len(self._hashes)
+            _node = self._cache[__key] = self._ring_nodes[_index]
+
+            return _node
+
+
+def _worker(strategy_factory: Callable[[str], Strategy], conn: Connection) -> None:
+    """
+    BotPool worker loop, evaluates batches of `(ticker, args)` ticks and sends back batches of `(ticker, response)`.
+    A None batch shuts the worker down, exceptions are sent back and end the worker.
+    """
+
+    strategies: dict = {}
+
+    try:
+        while True:
+            batch = conn.recv()
+
+            if batch is None:
+                break
+
+            responses = []
+
+            for ticker, args in batch:
+                try:
+                    strategy = strategies[ticker]
+                except KeyError:
+                    strategy = strategies[ticker] = strategy_factory(ticker)
+
+                if strategy.__feed__(*args):
+                    responses.append((ticker, strategy.next(*args)))
+
+            if responses:
+                conn.send(responses)
+    except BaseException as e:
+        conn.send(e)
+    finally:
+        conn.send(None)
+        conn.close()
+
+
+class BotPool:
+    """
+    Multi symbol Bot, symbols are partitioned across worker processes by a consistent hash of their ticker.
+
+    The data stream returns `(ticker, *args)` datapoints, each worker keeps one Strategy per ticker created by
+    `strategy_factory(ticker)` and evaluates `__feed__(*args)` and `next(*args)`. Responses are streamed back over
+    pipes and handled by `handle(ticker, response)` on a single thread of the parent process.
+    Every ticker is evaluated by a single worker in order, so responses of a ticker are handled in order.
+    Ticks are sent to a worker once `batch_size` of them are pending, or at most `max_delay` after the oldest one
+    was requested so that quiet tickers are not held back.
+    """
+
+    @property
+    def data_stream(self) -> DataStream:
+        return self._data_stream
+
+    @data_stream.setter
+    def data_stream(self, data_stream: DataStream) -> None:
+        val_instance(data_stream, DataStream)
+
+        self._data_stream = data_stream
+
+    @data_stream.deleter
+    def data_stream(self) -> None:
+        raise AttributeError("Cannot delete `data_stream` attribute.")
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def max_delay(self) -> dt.timedelta | None:
+        return self._max_delay
+
+    def __init__(self, strategy_factory: Callable[[str], Strategy], data_stream: DataStream, workers: int | None = None, batch_size: int = 256,
+                 max_delay: dt.timedelta | None = dt.timedelta(milliseconds=5)) -> None:
+        """
+        Create a BotPool.
+
+        Args:
+            strategy_factory (Callable[[str], Strategy]): picklable function of a ticker returning a new Strategy.
+            data_stream (DataStream): data stream returning `(ticker, *args)` datapoints.
+            workers (int | None, optional): number of worker processes. Defaults to None, the number of cpus.
+            batch_size (int, optional): number of ticks sent to a worker at once. Defaults to 256.
+            max_delay (dt.timedelta | None, optional): send the pending ticks of a worker at most `max_delay` after the
+                oldest one was requested. Defaults to 5 milliseconds, None sends full batches only.
+        """
+
+        val_instance(strategy_factory, Callable)
+        val_instance(workers, (int, NoneType))
+        val_instance(batch_size, int)
+        val_instance(max_delay, (dt.timedelta, NoneType))
+
+        self._data_stream = None
+        self.data_stream = data_stream
+
+        self._strategy_factory = strategy_factory
+        self._workers = workers or os.cpu_count() or 1
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._ring = ConsistentHash(self._workers)
+        self._stopping = False
+
+    def stop(self) -> None:
+        """
+        Request a graceful shutdown, every tick already requested is evaluated and handled.
+        """
+
+        self._stopping = True
+
+    def run(self) -> None:
+        """
+        Run the pool until the data stream is exhausted (`StopIteration`) or `stop()` is called.
+        """
+
+        self._stopping = False
+
+        conns = []
+        processes = []
+
+        for _ in range(self._workers):
+            conn, worker_conn = mp.Pipe()
+            process = mp.Process(target=_worker, args=(
+                self._strategy_factory, worker_conn), daemon=True)
+            process.start()
+            worker_conn.close()
+
+            conns.append(conn)
+            processes.append(process)
+
+        errors = []
+        collector = threading.Thread(
+            target=self._collect, args=(list(conns), errors), daemon=True)
+        collector.start()
+
+        ring = self._ring
+        batch_size = self._batch_size
+        batches = [[] for _ in range(self._workers)]
+        # monotonic time by which the pending ticks of every worker are sent
+        deadlines = [0.0] * self._workers
+        delay = None if self._max_delay is None else self._max_delay.total_seconds()
+        clock = _time.monotonic
+        # batches are sent by this thread and by the flusher
+        lock = threading.Lock()
+        done = threading.Event()
+        flusher = None
+
+        if not delay is None:
+            flusher = threading.Thread(target=self._flush, args=(conns, batches, deadlines, delay, lock, done), daemon=True)
+            flusher.start()
+
+        try:
+            while not self._stopping and not errors:
+                try:
+                    data: Any = self._data_stream.request()
+                except StopIteration:
+                    break
+
+                node = ring[data[0]]
+
+                with lock:
+                    batch = batches[node]
+
+                    if not batch and not delay is None:
+                        deadlines[node] = clock() + delay
+
+                    batch.append((data[0], data[1:]))
+
+                    if len(batch) >= batch_size:
+                        try:
+                            conns[node].send(batch)
+                        except BrokenPipeError:
+                            # the worker failed, its error is raised once the pool has shut down
+                            break
+
+                        batches[node] = []
+        finally:
+            done.set()
+
+            if not flusher is None:
+                flusher.join()
+
+            for conn, batch in zip(conns, batches):
+                try:
+                    if batch and not errors:
+                        conn.send(batch)
+
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+
+            collector.join()
+
+            for process in processes:
+                process.join()
+
+        if errors:
+            raise errors[0]
+
+    def _flush(self, conns: list[Connection], batches: list[list], deadlines: list[float], delay: float,
+               lock: threading.Lock, done: threading.Event) -> None:
+        """
+        Send the pending ticks of every worker once their deadline has passed, until `done` is set.
+        """
+
+        timeout = delay
+
+        while not done.wait(timeout):
+            with lock:
+                now = _time.monotonic()
+                timeout = delay
+
+                for node, batch in enumerate(batches):
+                    if not batch:
+                        continue
+
+                    if deadlines[node] <= now:
+                        try:
+                            conns[node].send(batch)
+                        except (BrokenPipeError, OSError):
+                            # the worker failed, the pool shuts down once the error is collected
+                            pass
+
+                        batches[node] = []
+                    else:
+                        timeout = min(timeout, deadlines[node] - now)
+
+    def _collect(self, conns: list[Connection], errors: list) -> None:
+        """
+        Receive responses from the workers and handle them until every worker has shut down.
+        """
+
+        while conns:
+            for conn in wait(conns):
+                try:
+                    message = conn.recv()
+                except EOFError:
+                    message = None
+
+                if message is None:
+                    conns.remove(conn)
+                elif isinstance(message, BaseException):
+                    errors.append(message)
+                else:
+                    for ticker, response in message:
+                        try:
+                            self.handle(ticker, response)
+                        except BaseException as e:
+                            errors.append(e)
+
+    def handle(self, ticker: str, strategy_response: StrategyResponse) -> None:
+        raise RequiredOverwrite("`handle()` requires overwrite.")
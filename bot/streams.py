@@ -0,0 +1,268 @@
+"""
+Module that stores composable DataStream wrappers that bound the number of ticks reaching a strategy under bursts.
+
+Wrappers take a DataStream and are DataStreams themselves, so they can be stacked and passed to any Bot.
+Unkeyed streams return `(time, price[, volume])` datapoints, keyed streams `(symbol, time, price[, volume])` datapoints.
+A stream signals its end by raising `StopIteration` from `request()`.
+"""
+
+import datetime as dt
+import threading
+from collections import OrderedDict, deque
+from typing import Any
+
+import numpy as np
+
+from _utils.time import epoch_ns
+from _utils.validate import val_instance
+from bot.datastream import DataStream, TickChunk
+
+
+class StreamWrapper(DataStream):
+    """
+    Base class of DataStream wrappers.
+    """
+
+    @property
+    def stream(self) -> DataStream:
+        return self._stream
+
+    @property
+    def keyed(self) -> bool:
+        return self._keyed
+
+    def __init__(self, stream: DataStream, keyed: bool = False) -> None:
+        """
+        Wrap a DataStream.
+
+        Args:
+            stream (DataStream): wrapped stream.
+            keyed (bool, optional): datapoints start with their symbol and are processed per symbol. Defaults to False.
+        """
+
+        val_instance(stream, DataStream)
+        val_instance(keyed, bool)
+
+        super().__init__()
+
+        self._stream = stream
+        self._keyed = keyed
+
+
+class ConflatingStream(StreamWrapper):
+    """
+    Latest value conflation, the wrapped stream is drained on a background thread and only the latest datapoint
+    of each symbol (of the whole stream if unkeyed) waiting to be requested is kept.
+    Symbols are returned in the order they first became pending.
+    """
+
+    @property
+    def conflated(self) -> int:
+        return self._conflated
+
+    def __init__(self, stream: DataStream, keyed: bool = False) -> None:
+        super().__init__(stream, keyed)
+
+        self._pending = OrderedDict()
+        self._condition = threading.Condition()
+        self._conflated = 0
+        self._done = False
+        self._error = None
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        request = self._stream.request
+        keyed = self._keyed
+
+        try:
+            while True:
+                data: Any = request()
+
+                with self._condition:
+                    key = data[0] if keyed else None
+
+                    if key in self._pending:
+                        self._conflated += 1
+
+                    # replacing a pending value keeps its position
+                    self._pending[key] = data
+                    self._condition.notify()
+        except StopIteration:
+            pass
+        except BaseException as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def request(self) -> Any:
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending or self._done)
+
+            if self._pending:
+                return self._pending.popitem(last=False)[1]
+
+            if not self._error is None:
+                raise self._error
+
+            raise StopIteration
+
+    def request_many(self, max_n: int) -> TickChunk:
+        """
+        Return up to `max_n` of the pending datapoints at once, waiting only if none is pending.
+        """
+
+        val_instance(max_n, int)
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending or self._done)
+
+            if not self._pending:
+                if not self._error is None:
+                    raise self._error
+
+                raise StopIteration
+
+            datapoints = [self._pending.popitem(last=False)[1] for _ in range(min(max_n, len(self._pending)))]
+
+        symbols = [data[0] for data in datapoints] if self._keyed else None
+        offset = 1 if self._keyed else 0
+        times = [data[offset] if type(data[offset]) is int else epoch_ns(data[offset]) for data in datapoints]
+
+        return TickChunk(np.array(times, dtype=np.int64), [data[offset + 1] for data in datapoints], symbols)
+
+
+class BarStream(StreamWrapper):
+    """
+    Time bucketed OHLCV bar aggregation, returns `([symbol, ]start, open, high, low, close, volume)` bars once a tick
+    of a later bucket arrives (per symbol if keyed), open bars are returned when the wrapped stream ends.
+    Ticks without volume count as 0, bars start at the type of their ticks' times (datetime or int epoch ns).
+    """
+
+    @property
+    def interval(self) -> dt.timedelta:
+        return self._interval
+
+    def __init__(self, stream: DataStream, interval: dt.timedelta, keyed: bool = False) -> None:
+        """
+        Create a BarStream.
+
+        Args:
+            stream (DataStream): wrapped stream.
+            interval (dt.timedelta): bar length, buckets are aligned to the epoch.
+            keyed (bool, optional): datapoints start with their symbol and bars are built per symbol. Defaults to False.
+        """
+
+        val_instance(interval, dt.timedelta)
+
+        super().__init__(stream, keyed)
+
+        if interval <= dt.timedelta(0):
+            raise ValueError(f"expected a positive `interval`, got {interval}.")
+
+        self._interval = interval
+        self._interval_us = interval // dt.timedelta(microseconds=1)
+        # symbol -> [bucket, start, open, high, low, close, volume]
+        self._bars: dict = {}
+        self._ready = deque()
+        self._done = False
+
+    def _bar(self, key: Any, bar: list) -> tuple:
+        return (key, *bar[1:]) if self._keyed else tuple(bar[1:])
+
+    def request(self) -> tuple:
+        while not self._ready:
+            if self._done:
+                raise StopIteration
+
+            try:
+                data: Any = self._stream.request()
+            except StopIteration:
+                self._done = True
+
+                for key, bar in self._bars.items():
+                    self._ready.append(self._bar(key, bar))
+
+                self._bars.clear()
+
+                continue
+
+            if self._keyed:
+                key, time, price, *volume = data
+            else:
+                key = None
+                time, price, *volume = data
+
+            volume = volume[0] if volume else 0
+            _int = type(time) is int
+            _us = (time if _int else epoch_ns(time)) // 1000
+            bucket = _us // self._interval_us
+            bar = self._bars.get(key)
+
+            if not bar is None and bar[0] == bucket:
+                if price > bar[3]:
+                    bar[3] = price
+
+                if price < bar[4]:
+                    bar[4] = price
+
+                bar[5] = price
+                bar[6] += volume
+            else:
+                if not bar is None:
+                    self._ready.append(self._bar(key, bar))
+
+                # bars of int epoch ns ticks start at int epoch ns
+                start = bucket * self._interval_us * 1000 if _int else time - dt.timedelta(microseconds=_us % self._interval_us)
+                self._bars[key] = [bucket, start, price, price, price, price, volume]
+
+        return self._ready.popleft()
+
+
+class SamplingStream(StreamWrapper):
+    """
+    Sampling every `n` ticks, returns every `n`-th datapoint (of each symbol if keyed).
+    """
+
+    @property
+    def n(self) -> int:
+        return self._n
+
+    def __init__(self, stream: DataStream, n: int, keyed: bool = False) -> None:
+        """
+        Create a SamplingStream.
+
+        Args:
+            stream (DataStream): wrapped stream.
+            n (int): sampling period in ticks.
+            keyed (bool, optional): datapoints start with their symbol and are sampled per symbol. Defaults to False.
+        """
+
+        val_instance(n, int)
+
+        super().__init__(stream, keyed)
+
+        if n < 1:
+            raise ValueError(f"expected `n` greater than 0, got {n}.")
+
+        self._n = n
+        self._counts: dict = {}
+
+    def request(self) -> Any:
+        request = self._stream.request
+        counts = self._counts
+        keyed = self._keyed
+
+        while True:
+            data: Any = request()
+            key = data[0] if keyed else None
+            count = counts.get(key, 0) + 1
+
+            if count == self._n:
+                counts[key] = 0
+
+                return data
+
+            counts[key] = count
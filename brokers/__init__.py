@@ -1 +1,10 @@
-from brokers.base import DataStream, Broker
+from _utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "brokers.base": ("Bot", "Broker", "BrokerError", "BotError"),
+    "brokers.order": ("Order", "Fill"),
+    "brokers.asyncbroker": ("AsyncBroker", "BrokerConnection", "ConnectionPool"),
+    "brokers.mock": ("MockBroker", "MockConnection", "MockExchange"),
+    "brokers.simulated": ("SimulatedBroker", "OrderBook", "LatencyModel", "FixedLatency", "RandomLatency", "SlippageModel",
+                          "FixedSlippage", "VolumeSlippage")
+})
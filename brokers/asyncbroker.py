@@ -0,0 +1,436 @@
+"""
+Module that stores the asynchronous broker contract.
+
+Orders are queued by `AsyncBroker.submit()` without waiting for the broker, grouped into batches and sent over
+a pool of connections, so that several batches are in flight at once and throughput is bounded by the capacity
+of the broker rather than by round trips. Fills are reported by connections at any time and delivered to the
+`callback` of a `brokers.base.Bot`.
+"""
+
+import asyncio
+import inspect
+from types import MappingProxyType, NoneType
+from typing import Any, Awaitable, Callable, Mapping
+
+from _utils.errors import RequiredOverwrite
+from _utils.validate import val_instance
+from brokers.base import Bot, BrokerError
+from brokers.order import Fill, Order
+from strategy.protocol.base import StrategyResponse
+
+
+# marker put in the order queue to shut the batcher down
+_STOP = object()
+
+# errors after which a batch is sent again on a new connection
+RETRIED_ERRORS = (asyncio.TimeoutError, ConnectionError, OSError)
+
+
+class BrokerConnection:
+    """
+    Connection to a broker, implementations send batches of orders and report fills through `on_fill`.
+    A connection sends a single batch at a time.
+    """
+
+    def __init__(self, on_fill: Callable[[Fill], Any]) -> None:
+        """
+        Create a BrokerConnection.
+
+        Args:
+            on_fill (Callable[[Fill], Any]): function called from the event loop with every fill, at any time.
+        """
+
+        self._on_fill = on_fill
+
+    async def send(self, orders: list[Order]) -> list[BrokerError | NoneType]:
+        """
+        Send a batch of orders in a single round trip, orders already received (same `Order.key`) must not be executed twice.
+
+        Args:
+            orders (list[Order]): orders.
+
+        Raises:
+            ConnectionError: If the connection failed, the batch is sent again on another connection.
+
+        Returns:
+            list[BrokerError | NoneType]: None for every accepted order and the error of every rejected order.
+        """
+
+        raise RequiredOverwrite("`send()` requires overwrite.")
+
+    async def close(self) -> None:
+        pass
+
+
+class ConnectionPool:
+    """
+    Pool of up to `size` broker connections, created when needed and replaced when broken.
+    """
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __init__(self, connect: Callable[[], Awaitable[BrokerConnection]], size: int = 4) -> None:
+        """
+        Create a ConnectionPool.
+
+        Args:
+            connect (Callable[[], Awaitable[BrokerConnection]]): coroutine function opening a connection.
+            size (int, optional): maximum number of connections. Defaults to 4.
+        """
+
+        val_instance(connect, Callable)
+        val_instance(size, int)
+
+        if size < 1:
+            raise ValueError(f"expected `size` greater than 0, got {size}.")
+
+        self._connect = connect
+        self._size = size
+        self._idle: list[BrokerConnection] = []
+        self._connections: set = set()
+        # one permit per connection that is not in use
+        self._slots = asyncio.Semaphore(size)
+
+    async def acquire(self) -> BrokerConnection:
+        """
+        Acquire a connection, waiting while every connection is in use.
+        """
+
+        await self._slots.acquire()
+
+        if self._idle:
+            return self._idle.pop()
+
+        try:
+            connection = await self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._connections.add(connection)
+
+        return connection
+
+    async def release(self, connection: BrokerConnection, broken: bool = False) -> None:
+        """
+        Release an acquired connection, broken connections are closed and replaced by the next `acquire()`.
+        """
+
+        if broken:
+            self._connections.discard(connection)
+
+            try:
+                await connection.close()
+            except Exception:
+                pass
+        else:
+            self._idle.append(connection)
+
+        self._slots.release()
+
+    async def close(self) -> None:
+        """
+        Close every connection.
+        """
+
+        for connection in self._connections:
+            await connection.close()
+
+        self._connections.clear()
+        self._idle.clear()
+
+
+class AsyncBroker:
+    """
+    Asynchronous broker client, orders are pipelined in batches over a ConnectionPool.
+
+    Every submitted order stays in the in flight table, keyed by uid, until it is rejected, failed or completely filled.
+    Batches that time out or fail are sent again on a new connection after an exponential backoff,
+    up to `retries` times, and their orders fail with a BrokerError afterwards.
+
+        async with AsyncBroker(connect, bot) as broker:
+            for response in responses:
+                broker.submit(response)
+    """
+
+    @property
+    def bot(self) -> Bot | NoneType:
+        return self._bot
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return self._pool
+
+    @property
+    def in_flight(self) -> Mapping[tuple[int, str], Order]:
+        """
+        Read only view of the orders in flight by `(uid, side)` key.
+        """
+
+        return MappingProxyType(self._orders)
+
+    def __init__(self, connect: Callable[[Callable[[Fill], Any]], Awaitable[BrokerConnection]], bot: Bot | NoneType = None,
+                 pool_size: int = 4, batch_size: int = 64, linger: float = 0.0, timeout: float = 5.0, retries: int = 3,
+                 backoff: float = 0.05) -> None:
+        """
+        Create an AsyncBroker.
+
+        Args:
+            connect (Callable[[Callable[[Fill], Any]], Awaitable[BrokerConnection]]): coroutine function of the fill handler opening a connection.
+            bot (Bot | NoneType, optional): bot whose `callback` receives every fill, it may be a coroutine function. Defaults to None.
+            pool_size (int, optional): maximum number of connections, and of batches in flight. Defaults to 4.
+            batch_size (int, optional): maximum number of orders per batch. Defaults to 64.
+            linger (float, optional): seconds to wait for more orders before sending a batch that isn't full. Defaults to 0.0.
+            timeout (float, optional): seconds before a batch is considered lost. Defaults to 5.0.
+            retries (int, optional): number of times a lost batch is sent again. Defaults to 3.
+            backoff (float, optional): seconds before the first retry, doubled for every retry. Defaults to 0.05.
+        """
+
+        val_instance(connect, Callable)
+        val_instance(bot, (Bot, NoneType))
+        val_instance(batch_size, int)
+        val_instance(linger, (float, int))
+        val_instance(timeout, (float, int))
+        val_instance(retries, int)
+        val_instance(backoff, (float, int))
+
+        if batch_size < 1:
+            raise ValueError(f"expected `batch_size` greater than 0, got {batch_size}.")
+
+        self._connect = connect
+        self._bot = bot
+        self._pool = ConnectionPool(lambda: connect(self._on_fill), pool_size)
+        self._batch_size = batch_size
+        self._linger = linger
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+
+        # in flight table: uid -> order and acknowledgment future
+        self._orders: dict = {}
+        self._acks: dict = {}
+
+        self._queue = None
+        self._batcher = None
+        self._tasks: set = set()
+
+    async def __aenter__(self) -> "AsyncBroker":
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Start sending orders, must be called from the event loop the broker is used on.
+        """
+
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch())
+
+    async def close(self) -> None:
+        """
+        Send every queued order, wait for every batch and fill callback, and close the connections.
+        Orders still open stay in the in flight table.
+
+        Raises:
+            Exception: the first error raised by a fill callback, once the broker is closed.
+        """
+
+        if self._batcher is None:
+            return
+
+        self._queue.put_nowait(_STOP)
+        await self._batcher
+
+        errors = []
+
+        while self._tasks:
+            errors += [result for result in await asyncio.gather(*self._tasks, return_exceptions=True)
+                       if isinstance(result, BaseException)]
+
+        await self._pool.close()
+        self._batcher = None
+
+        if errors:
+            raise errors[0]
+
+    def submit(self, order: Order | StrategyResponse) -> asyncio.Future:
+        """
+        Queue an order without waiting for the broker.
+
+        Args:
+            order (Order | StrategyResponse): order, 'BUY' and 'SELL' responses are sent as market orders of one unit.
+
+        Raises:
+            BrokerError: If the broker isn't started or an order with the same uid and side is in flight.
+
+        Returns:
+            asyncio.Future: resolved with the order once it is accepted, raises the BrokerError of rejected or failed orders.
+        """
+
+        if isinstance(order, StrategyResponse):
+            order = Order.from_response(order)
+
+        val_instance(order, Order)
+
+        if self._batcher is None:
+            raise BrokerError("the broker isn't started, call `start()` first.")
+
+        key = order._uid, order._side
+
+        if key in self._orders:
+            raise BrokerError(f"a '{order._side}' order with uid {order._uid} is already in flight.")
+
+        ack = asyncio.get_running_loop().create_future()
+
+        self._orders[key] = order
+        self._acks[key] = ack
+        self._queue.put_nowait(order)
+
+        return ack
+
+    async def place_order(self, order: Order | StrategyResponse) -> Order:
+        """
+        Send an order and wait until it is accepted, see `submit()`.
+        """
+
+        return await self.submit(order)
+
+    async def _batch(self) -> None:
+        """
+        Group queued orders into batches and send each batch on its own task once a connection is available.
+        """
+
+        queue = self._queue
+        stopping = False
+
+        while not stopping:
+            item = await queue.get()
+
+            if item is _STOP:
+                break
+
+            batch = [item]
+
+            for _ in range(2 if self._linger > 0 else 1):
+                while len(batch) < self._batch_size and not queue.empty():
+                    item = queue.get_nowait()
+
+                    if item is _STOP:
+                        stopping = True
+                        break
+
+                    batch.append(item)
+
+                if stopping or len(batch) == self._batch_size or self._linger <= 0:
+                    break
+
+                await asyncio.sleep(self._linger)
+
+            # waiting for a connection bounds the number of batches in flight
+            connection = await self._pool.acquire()
+            self._track(self._send(connection, batch))
+
+    async def _send(self, connection: BrokerConnection, batch: list[Order]) -> None:
+        attempt = 0
+
+        while True:
+            try:
+                errors = await asyncio.wait_for(connection.send(batch), self._timeout)
+            except RETRIED_ERRORS as e:
+                await self._pool.release(connection, broken=True)
+                attempt += 1
+
+                if attempt > self._retries:
+                    for order in batch:
+                        self._reject(order, BrokerError(
+                            f"order {order._uid} failed after {self._retries} retries: {e!r}."))
+
+                    return
+
+                await asyncio.sleep(self._backoff * 2 ** (attempt - 1))
+                connection = await self._pool.acquire()
+
+                continue
+            except Exception as e:
+                await self._pool.release(connection, broken=True)
+
+                for order in batch:
+                    self._reject(order, BrokerError(f"order {order._uid} failed: {e!r}."))
+
+                return
+            except BaseException:
+                # cancellation and interrupts propagate, the batch may have been partly sent so its acks are cancelled
+                await self._pool.release(connection, broken=True)
+
+                for order in batch:
+                    self._orders.pop((order._uid, order._side), None)
+                    ack = self._acks.pop((order._uid, order._side), None)
+
+                    if not ack is None:
+                        ack.cancel()
+
+                raise
+
+            await self._pool.release(connection)
+
+            break
+
+        for order, error in zip(batch, errors):
+            if error is None:
+                ack = self._acks.get((order._uid, order._side))
+
+                if not ack is None and not ack.done():
+                    ack.set_result(order)
+            else:
+                self._reject(order, error)
+
+        # orders the connection returned no result for would never be acknowledged
+        for order in batch[len(errors):]:
+            self._reject(order, BrokerError(
+                f"order {order._uid} failed: expected {len(batch)} results from the broker, got {len(errors)}."))
+
+    def _reject(self, order: Order, error: BaseException) -> None:
+        key = order._uid, order._side
+        self._orders.pop(key, None)
+        ack = self._acks.pop(key, None)
+
+        if not ack is None and not ack.done():
+            ack.set_exception(error)
+            # rejections are reported through the future, which may never be awaited
+            ack.exception()
+
+    def _on_fill(self, fill: Fill) -> None:
+        """
+        Update the in flight table with a fill and pass it to the bot callback.
+        """
+
+        key = fill._uid, fill._side
+        order = self._orders.get(key)
+
+        if not order is None:
+            ack = self._acks[key]
+
+            # a fill may be reported before the acknowledgment of its batch
+            if not ack.done():
+                ack.set_result(order)
+
+            if fill._remaining <= 0:
+                del self._orders[key]
+                del self._acks[key]
+
+        if not self._bot is None:
+            result = self._bot.callback(fill)
+
+            if inspect.isawaitable(result):
+                self._track(result)
+
+    def _track(self, awaitable: Awaitable) -> None:
+        task = asyncio.ensure_future(awaitable)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,156 @@
+"""
+Module that stores an in process mock broker simulating round trip latency, for tests and benchmarks of AsyncBroker.
+"""
+
+import asyncio
+import random
+from types import NoneType
+from typing import Any, Callable
+
+from _utils.validate import val_instance
+from brokers.asyncbroker import AsyncBroker, BrokerConnection
+from brokers.base import Bot, BrokerError
+from brokers.order import Fill, Order
+
+
+class MockExchange:
+    """
+    Broker side state shared by MockConnection objects: marked prices, received order keys and processing capacity.
+    """
+
+    def __init__(self, capacity: int | NoneType = None) -> None:
+        """
+        Create a MockExchange.
+
+        Args:
+            capacity (int | NoneType, optional): maximum number of batches processed at once. Defaults to None, unlimited.
+        """
+
+        val_instance(capacity, (int, NoneType))
+
+        self.prices: dict = {}
+        self.received: set = set()
+        self.capacity = capacity
+        self._slots = None
+
+    @property
+    def slots(self) -> asyncio.Semaphore | NoneType:
+        # created on first use so that it belongs to the running event loop
+        if self._slots is None and not self.capacity is None:
+            self._slots = asyncio.Semaphore(self.capacity)
+
+        return self._slots
+
+
+class MockConnection(BrokerConnection):
+    """
+    Connection to a MockExchange, every batch takes `latency` (plus up to `jitter`) seconds, accepted orders are filled
+    in full half a latency later, limit orders at their price and market orders at the marked price of their ticker.
+    """
+
+    def __init__(self, on_fill: Callable[[Fill], Any], exchange: MockExchange, latency: float = 0.001, jitter: float = 0.0,
+                 failure_rate: float = 0.0, rng: random.Random | NoneType = None) -> None:
+        """
+        Create a MockConnection.
+
+        Args:
+            on_fill (Callable[[Fill], Any]): fill handler.
+            exchange (MockExchange): simulated broker.
+            latency (float, optional): round trip seconds. Defaults to 0.001.
+            jitter (float, optional): maximum random seconds added to every round trip. Defaults to 0.0.
+            failure_rate (float, optional): probability that a batch fails with a ConnectionError. Defaults to 0.0.
+            rng (random.Random | NoneType, optional): random number generator. Defaults to None, a new one.
+        """
+
+        super().__init__(on_fill)
+
+        self._exchange = exchange
+        self._latency = latency
+        self._jitter = jitter
+        self._failure_rate = failure_rate
+        self._rng = rng or random.Random()
+
+    async def send(self, orders: list[Order]) -> list[BrokerError | NoneType]:
+        _latency = self._latency + self._rng.random() * self._jitter
+        _slots = self._exchange.slots
+
+        if _slots is None:
+            await asyncio.sleep(_latency)
+        else:
+            async with _slots:
+                await asyncio.sleep(_latency)
+
+        if self._failure_rate and self._rng.random() < self._failure_rate:
+            raise ConnectionError("simulated connection failure.")
+
+        errors = []
+        fills = []
+
+        for order in orders:
+            # orders sent again after a lost acknowledgment are acknowledged but not executed twice
+            if (order._uid, order._side) in self._exchange.received:
+                errors.append(None)
+                continue
+
+            price = self._exchange.prices.get(order._ticker) if order.is_market else order._price
+
+            if price is None:
+                errors.append(BrokerError(f"no market price for ticker {order._ticker} of order {order._uid}."))
+                continue
+
+            self._exchange.received.add((order._uid, order._side))
+            errors.append(None)
+            fills.append(Fill(order._uid, order._side, order._quantity, price, 0.0, order._ticker, order._time))
+
+        if fills:
+            asyncio.get_running_loop().call_later(_latency / 2, self._fill, fills)
+
+        return errors
+
+    def _fill(self, fills: list[Fill]) -> None:
+        for fill in fills:
+            self._on_fill(fill)
+
+
+class MockBroker(AsyncBroker):
+    """
+    AsyncBroker connected to an in process MockExchange.
+    """
+
+    @property
+    def exchange(self) -> MockExchange:
+        return self._exchange
+
+    def __init__(self, bot: Bot | NoneType = None, latency: float = 0.001, jitter: float = 0.0, capacity: int | NoneType = None,
+                 failure_rate: float = 0.0, seed: int | NoneType = None, **kwargs) -> None:
+        """
+        Create a MockBroker.
+
+        Args:
+            bot (Bot | NoneType, optional): bot whose `callback` receives every fill. Defaults to None.
+            latency (float, optional): round trip seconds. Defaults to 0.001.
+            jitter (float, optional): maximum random seconds added to every round trip. Defaults to 0.0.
+            capacity (int | NoneType, optional): maximum number of batches the exchange processes at once. Defaults to None, unlimited.
+            failure_rate (float, optional): probability that a batch fails with a ConnectionError. Defaults to 0.0.
+            seed (int | NoneType, optional): seed of the simulated jitter and failures. Defaults to None.
+            kwargs: AsyncBroker arguments (`pool_size`, `batch_size`, `linger`, `timeout`, `retries`, `backoff`).
+        """
+
+        val_instance(latency, (float, int))
+        val_instance(jitter, (float, int))
+        val_instance(failure_rate, (float, int))
+
+        self._exchange = MockExchange(capacity)
+        rng = random.Random(seed)
+
+        async def connect(on_fill: Callable[[Fill], Any]) -> MockConnection:
+            return MockConnection(on_fill, self._exchange, latency, jitter, failure_rate, rng)
+
+        super().__init__(connect, bot, **kwargs)
+
+    def mark(self, ticker: str | NoneType, price: float) -> None:
+        """
+        Set the price market orders of a ticker are filled at.
+        """
+
+        self._exchange.prices[ticker] = price
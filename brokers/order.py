@@ -0,0 +1,231 @@
+"""
+Module that stores the orders sent to brokers and the fills they report.
+"""
+
+import datetime as dt
+import itertools
+from types import NoneType
+
+from _utils.validate import val_instance
+from strategy.protocol.base import StrategyResponse
+
+
+# order sides
+SIDES = ("BUY", "SELL")
+
+# uids generated for orders created from responses without uid, negative so they never collide with strategy uids
+_generated_uids = itertools.count(-1, -1)
+
+
+class Order:
+    """
+    Order of `quantity` units, a limit order if it has a price and a market order otherwise.
+    An order is identified by its uid and side (`key`), a BUY order and the SELL order closing it share the uid of their
+    responses. The key identifies the order across retries, brokers must treat it as an idempotency key.
+    """
+
+    __slots__ = ("_uid", "_side", "_quantity", "_price", "_ticker", "_exchange", "_time")
+
+    @property
+    def uid(self) -> int:
+        return self._uid
+
+    @property
+    def side(self) -> str:
+        return self._side
+
+    @property
+    def quantity(self) -> float:
+        return self._quantity
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @property
+    def ticker(self) -> str | NoneType:
+        return self._ticker
+
+    @property
+    def exchange(self) -> str | NoneType:
+        return self._exchange
+
+    @property
+    def time(self) -> dt.datetime | NoneType:
+        return self._time
+
+    @property
+    def key(self) -> tuple[int, str]:
+        """
+        `(uid, side)` identifying the order.
+        """
+
+        return self._uid, self._side
+
+    @property
+    def is_market(self) -> bool:
+        return self._price != self._price
+
+    def __init__(self, uid: int, side: str, quantity: float = 1.0, price: float | NoneType = None, ticker: str | NoneType = None,
+                 exchange: str | NoneType = None, time: dt.datetime | NoneType = None) -> None:
+        """
+        Create an Order.
+
+        Args:
+            uid (int): unique id of the order.
+            side (str): 'BUY' or 'SELL'.
+            quantity (float, optional): number of units. Defaults to 1.0.
+            price (float | NoneType, optional): limit price. Defaults to None, market order.
+            ticker (str | NoneType, optional): ticker. Defaults to None.
+            exchange (str | NoneType, optional): exchange. Defaults to None.
+            time (dt.datetime | NoneType, optional): time the order was created at. Defaults to None.
+        """
+
+        val_instance(uid, int)
+        val_instance(side, str)
+        val_instance(quantity, (float, int))
+        val_instance(price, (float, int, NoneType))
+        val_instance(ticker, (str, NoneType))
+        val_instance(exchange, (str, NoneType))
+        val_instance(time, (dt.datetime, NoneType))
+
+        side = side.upper()
+
+        if not side in SIDES:
+            raise ValueError(f"expected 'BUY' or 'SELL' `side`, got '{side}'.")
+
+        if not quantity > 0:
+            raise ValueError(f"expected a positive `quantity`, got {quantity}.")
+
+        self._uid = uid
+        self._side = side
+        self._quantity = float(quantity)
+        self._price = float("nan") if price is None else float(price)
+        self._ticker = ticker
+        self._exchange = exchange
+        self._time = time
+
+    @classmethod
+    def fast(cls, uid: int, side: str, quantity: float = 1.0, price: float | NoneType = None, ticker: str | NoneType = None,
+             exchange: str | NoneType = None, time: dt.datetime | NoneType = None) -> "Order":
+        """
+        Generate an Order without validating or normalizing its arguments, see `StrategyResponse.fast()`.
+        `side` must be 'BUY' or 'SELL' and `quantity` a positive float.
+        """
+
+        self = object.__new__(cls)
+
+        self._uid = uid
+        self._side = side
+        self._quantity = quantity
+        self._price = float("nan") if price is None else price
+        self._ticker = ticker
+        self._exchange = exchange
+        self._time = time
+
+        return self
+
+    @classmethod
+    def from_response(cls, response: StrategyResponse, quantity: float = 1.0, market: bool = True) -> "Order":
+        """
+        Create an Order from a 'BUY' or 'SELL' StrategyResponse.
+
+        Args:
+            response (StrategyResponse): response, responses without uid are given a negative generated uid.
+            quantity (float, optional): number of units. Defaults to 1.0.
+            market (bool, optional): send a market order, otherwise a limit order at the response price. Defaults to True.
+
+        Raises:
+            ValueError: If the response is a 'HOLD' response.
+
+        Returns:
+            Order
+        """
+
+        val_instance(response, StrategyResponse)
+
+        if not response.command in SIDES:
+            raise ValueError(f"expected a 'BUY' or 'SELL' response, got '{response.command}'.")
+
+        _time = response.time
+
+        return cls(
+            next(_generated_uids) if response.uid is None else response.uid,
+            response.command,
+            quantity,
+            None if market or response.price != response.price else response.price,
+            response.ticker,
+            response.exchange,
+            _time if isinstance(_time, dt.datetime) else None
+        )
+
+    def __repr__(self) -> str:
+        _price = "market" if self.is_market else f"@ {self._price}"
+
+        return f"Order[{self._uid}]({self._side} {self._quantity} {self._ticker} {_price})"
+
+
+class Fill:
+    """
+    Execution of `quantity` units of an order at `price`, `remaining` units of the order are left open.
+    """
+
+    __slots__ = ("_uid", "_side", "_quantity", "_price", "_remaining", "_ticker", "_time")
+
+    @property
+    def uid(self) -> int:
+        return self._uid
+
+    @property
+    def side(self) -> str:
+        return self._side
+
+    @property
+    def quantity(self) -> float:
+        return self._quantity
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @property
+    def remaining(self) -> float:
+        return self._remaining
+
+    @property
+    def ticker(self) -> str | NoneType:
+        return self._ticker
+
+    @property
+    def time(self) -> dt.datetime | NoneType:
+        return self._time
+
+    @property
+    def is_final(self) -> bool:
+        return self._remaining <= 0
+
+    def __init__(self, uid: int, side: str, quantity: float, price: float, remaining: float = 0.0, ticker: str | NoneType = None,
+                 time: dt.datetime | NoneType = None) -> None:
+        """
+        Create a Fill, fills are created by brokers and not validated.
+
+        Args:
+            uid (int): uid of the order.
+            side (str): side of the order.
+            quantity (float): number of units executed.
+            price (float): execution price.
+            remaining (float, optional): number of units of the order left open. Defaults to 0.0.
+            ticker (str | NoneType, optional): ticker of the order. Defaults to None.
+            time (dt.datetime | NoneType, optional): execution time. Defaults to None.
+        """
+
+        self._uid = uid
+        self._side = side
+        self._quantity = quantity
+        self._price = price
+        self._remaining = remaining
+        self._ticker = ticker
+        self._time = time
+
+    def __repr__(self) -> str:
+        return f"Fill[{self._uid}]({self._side} {self._quantity} {self._ticker} @ {self._price}, {self._remaining} remaining)"
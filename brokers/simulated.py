@@ -0,0 +1,460 @@
+"""
+Module that stores the simulated broker used by backtests.
+
+Every ticker has a price-time priority order book: resting limit orders are kept in heaps ordered by price and
+arrival sequence, cancellations are lazy (O(1), entries are skipped when they reach the top of the heap) and heaps are
+compacted when cancelled entries outnumber live ones. Market data ticks drive the simulation: orders become active
+after their latency, market orders execute at the tick price moved by the slippage model, and resting limit orders
+execute at their limit price once a tick trades through it. If ticks have a volume, each side of the book executes
+at most that volume per tick and orders are partially filled in priority order.
+"""
+
+import datetime as dt
+import heapq
+import random
+from collections import deque
+from types import NoneType
+
+from _utils.time import epoch_ns
+from _utils.validate import val_instance
+from brokers.base import Bot, Broker, BrokerError
+from brokers.order import SIDES, Fill, Order
+from strategy.protocol.base import StrategyResponse
+from strategy.protocol.batch import _ns_to_time
+
+
+# infinite volume of ticks without volume
+_INF = float("inf")
+
+
+class LatencyModel:
+    """
+    Delay between the submission of an order and its arrival in the order book, no delay by default.
+    """
+
+    def delay(self, order: Order) -> int:
+        """
+        Delay of an order in nanoseconds.
+        """
+
+        return 0
+
+
+class FixedLatency(LatencyModel):
+    """
+    Constant delay.
+    """
+
+    def __init__(self, latency: dt.timedelta) -> None:
+        val_instance(latency, dt.timedelta)
+
+        self._latency = latency // dt.timedelta(microseconds=1) * 1000
+
+    def delay(self, order: Order) -> int:
+        return self._latency
+
+
+class RandomLatency(LatencyModel):
+    """
+    Delay uniformly distributed between `low` and `high`.
+    """
+
+    def __init__(self, low: dt.timedelta, high: dt.timedelta, seed: int | NoneType = None) -> None:
+        val_instance(low, dt.timedelta)
+        val_instance(high, dt.timedelta)
+
+        if high < low:
+            raise ValueError(f"expected `high` greater than or equal to `low`, got {high} < {low}.")
+
+        self._low = low // dt.timedelta(microseconds=1) * 1000
+        self._high = high // dt.timedelta(microseconds=1) * 1000
+        self._rng = random.Random(seed)
+
+    def delay(self, order: Order) -> int:
+        return self._rng.randint(self._low, self._high)
+
+
+class SlippageModel:
+    """
+    Execution price of market orders, the tick price by default.
+    """
+
+    def price(self, side: str, price: float, quantity: float, volume: float) -> float:
+        """
+        Execution price of `quantity` units of a market order.
+
+        Args:
+            side (str): 'BUY' or 'SELL'.
+            price (float): tick price.
+            quantity (float): executed quantity.
+            volume (float): tick volume, 'inf' if unknown.
+
+        Returns:
+            float: execution price.
+        """
+
+        return price
+
+
+class FixedSlippage(SlippageModel):
+    """
+    Execution price moved against the order by a fraction of the price, e.g. 0.0001 for one basis point.
+    """
+
+    def __init__(self, fraction: float) -> None:
+        val_instance(fraction, (float, int))
+
+        self._fraction = fraction
+
+    def price(self, side: str, price: float, quantity: float, volume: float) -> float:
+        return price * (1 + self._fraction) if side == "BUY" else price * (1 - self._fraction)
+
+
+class VolumeSlippage(SlippageModel):
+    """
+    Execution price moved against the order by `impact` times the fraction of the tick volume executed.
+    """
+
+    def __init__(self, impact: float) -> None:
+        val_instance(impact, (float, int))
+
+        self._impact = impact
+
+    def price(self, side: str, price: float, quantity: float, volume: float) -> float:
+        _fraction = self._impact * quantity / volume if volume > 0 else 0.0
+
+        return price * (1 + _fraction) if side == "BUY" else price * (1 - _fraction)
+
+
+class _Resting:
+    """
+    Pending or open order with its remaining quantity, the book it is in and the time it entered it.
+    """
+
+    __slots__ = ("order", "remaining", "live", "book", "since")
+
+    def __init__(self, order: Order) -> None:
+        self.order = order
+        self.remaining = order._quantity
+        self.live = True
+        self.book = None
+        self.since = None
+
+
+class OrderBook:
+    """
+    Price-time priority order book of a ticker.
+    """
+
+    @property
+    def ticker(self) -> str | NoneType:
+        return self._ticker
+
+    @property
+    def best_bid(self) -> float | NoneType:
+        self._prune(self._bids)
+
+        return -self._bids[0][0] if self._bids else None
+
+    @property
+    def best_ask(self) -> float | NoneType:
+        self._prune(self._asks)
+
+        return self._asks[0][0] if self._asks else None
+
+    def __init__(self, ticker: str | NoneType = None) -> None:
+        self._ticker = ticker
+        # (-price, sequence, entry) and (price, sequence, entry) heaps of resting limit orders
+        self._bids: list = []
+        self._asks: list = []
+        # market orders waiting for a tick, in arrival order
+        self._market = deque()
+        self._live = 0
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return self._live
+
+    def add(self, entry: _Resting, sequence: int) -> None:
+        order = entry.order
+
+        if order.is_market:
+            self._market.append(entry)
+        elif order._side == "BUY":
+            heapq.heappush(self._bids, (-order._price, sequence, entry))
+        else:
+            heapq.heappush(self._asks, (order._price, sequence, entry))
+
+        self._live += 1
+
+    def remove(self, entry: _Resting) -> None:
+        """
+        Lazily remove an entry, compacting the book when removed entries outnumber live ones.
+        """
+
+        entry.live = False
+        self._live -= 1
+        self._dead += 1
+
+        if self._dead > 64 and self._dead > self._live:
+            self._bids = [_item for _item in self._bids if _item[2].live]
+            self._asks = [_item for _item in self._asks if _item[2].live]
+            self._market = deque(_entry for _entry in self._market if _entry.live)
+            heapq.heapify(self._bids)
+            heapq.heapify(self._asks)
+            self._dead = 0
+
+    def _prune(self, heap: list) -> None:
+        while heap and not heap[0][2].live:
+            heapq.heappop(heap)
+            self._dead -= 1
+
+
+class SimulatedBroker(Broker):
+    """
+    Broker executing orders against market data ticks, fills (partial fills included) are passed to the callback
+    of `bot` as they happen.
+
+        broker = SimulatedBroker(Bot(fills.append), latency=FixedLatency(dt.timedelta(milliseconds=5)))
+        broker.place_order(Buy(ticker="AAPL", uid=1))
+        broker.on_tick("AAPL", time, price, volume)
+    """
+
+    @property
+    def bot(self) -> Bot:
+        return self._bot
+
+    @property
+    def idle(self) -> bool:
+        """
+        Whether no order is pending or open.
+        """
+
+        return not self._entries
+
+    def __init__(self, bot: Bot, latency: LatencyModel | NoneType = None, slippage: SlippageModel | NoneType = None) -> None:
+        """
+        Create a SimulatedBroker.
+
+        Args:
+            bot (Bot): bot whose `callback` receives every fill.
+            latency (LatencyModel | NoneType, optional): latency model. Defaults to None, no latency.
+            slippage (SlippageModel | NoneType, optional): slippage model of market orders. Defaults to None, no slippage.
+        """
+
+        val_instance(bot, Bot)
+        val_instance(latency, (LatencyModel, NoneType))
+        val_instance(slippage, (SlippageModel, NoneType))
+
+        self._bot = bot
+        self._latency = latency or LatencyModel()
+        self._slippage = slippage or SlippageModel()
+        self._books: dict = {}
+        # (uid, side) -> entry of every pending or open order
+        self._entries: dict = {}
+        # ticker -> (activation time, sequence, entry) heap of orders not yet in the book
+        self._pending: dict = {}
+        self._sequence = 0
+        # time of the last tick, orders without time are submitted at it
+        self._now = 0
+
+    def book(self, ticker: str | NoneType) -> OrderBook:
+        """
+        Order book of a ticker.
+        """
+
+        try:
+            return self._books[ticker]
+        except KeyError:
+            _book = self._books[ticker] = OrderBook(ticker)
+
+            return _book
+
+    def place_order(self, order: Order | StrategyResponse, time: dt.datetime | int | NoneType = None) -> Order:
+        """
+        Submit an order, it reaches the order book after its latency and is executed by later ticks.
+
+        Args:
+            order (Order | StrategyResponse): order, 'BUY' and 'SELL' responses are sent as market orders of one unit.
+            time (dt.datetime | int | NoneType, optional): submission time, datetime or epoch nanoseconds. Defaults to None,
+                the time of the order, or of the last tick if it has none.
+
+        Raises:
+            BrokerError: If an order with the same uid is pending or open.
+
+        Returns:
+            Order: submitted order.
+        """
+
+        if isinstance(order, StrategyResponse):
+            order = Order.from_response(order)
+
+        key = order._uid, order._side
+
+        if key in self._entries:
+            raise BrokerError(f"a '{order._side}' order with uid {order._uid} is already open.")
+
+        if time is None:
+            time = self._now if order._time is None else epoch_ns(order._time)
+        elif not type(time) is int:
+            time = epoch_ns(time)
+
+        entry = self._entries[key] = _Resting(order)
+        self._sequence += 1
+
+        try:
+            pending = self._pending[order._ticker]
+        except KeyError:
+            pending = self._pending[order._ticker] = []
+
+        heapq.heappush(pending, (time + self._latency.delay(order), self._sequence, entry))
+
+        return order
+
+    def cancel(self, uid: int, side: str | NoneType = None) -> bool:
+        """
+        Cancel pending or open orders.
+
+        Args:
+            uid (int): uid of the order.
+            side (str | NoneType, optional): 'BUY' or 'SELL'. Defaults to None, the orders of both sides.
+
+        Returns:
+            bool: True if an order was cancelled, False if none was pending or open.
+        """
+
+        cancelled = False
+
+        for _side in SIDES if side is None else (side.upper(),):
+            entry = self._entries.pop((uid, _side), None)
+
+            if entry is None:
+                continue
+
+            if entry.book is None:
+                # skipped when it would have reached the book
+                entry.live = False
+            else:
+                entry.book.remove(entry)
+
+            cancelled = True
+
+        return cancelled
+
+    def on_tick(self, ticker: str | NoneType, time: dt.datetime | int, price: float, volume: float | NoneType = None) -> None:
+        """
+        Execute the orders of a ticker against a market data tick, ticks must be passed in time order.
+
+        Args:
+            ticker (str | NoneType): ticker.
+            time (dt.datetime | int): tick time, datetime (naive datetimes are read as UTC) or epoch nanoseconds.
+            price (float): tick price.
+            volume (float | NoneType, optional): tick volume. Defaults to None, unlimited.
+        """
+
+        if not type(time) is int:
+            time = epoch_ns(time)
+
+        self._now = time
+        book = self._books.get(ticker)
+        pending = self._pending.get(ticker)
+
+        if pending and pending[0][0] <= time:
+            if book is None:
+                book = self.book(ticker)
+
+            while pending and pending[0][0] <= time:
+                _, sequence, entry = heapq.heappop(pending)
+
+                if entry.live:
+                    entry.book = book
+                    entry.since = time
+                    book.add(entry, sequence)
+
+        if book is None or not book._live:
+            return
+
+        # volume left to each side of the book
+        available = {"BUY": _INF if volume is None else float(volume)}
+        available["SELL"] = available["BUY"]
+        fill_time = _ns_to_time(time)
+
+        if book._market:
+            _slippage = self._slippage.price
+            _volume = available["BUY"]
+            _market = deque()
+
+            for entry in book._market:
+                if not entry.live:
+                    book._dead -= 1
+                    continue
+
+                side = entry.order._side
+
+                if available[side] <= 0:
+                    _market.append(entry)
+                    continue
+
+                quantity = min(entry.remaining, available[side])
+                available[side] -= quantity
+
+                if not self._fill(book, entry, quantity, _slippage(side, price, quantity, _volume), fill_time):
+                    _market.append(entry)
+
+            book._market = _market
+
+        # resting orders execute at their limit price, orders entering the book at this tick at the tick price
+        bids = book._bids
+
+        while bids and available["BUY"] > 0:
+            _price, _, entry = bids[0]
+
+            if not entry.live:
+                heapq.heappop(bids)
+                book._dead -= 1
+            elif -_price >= price:
+                quantity = min(entry.remaining, available["BUY"])
+                available["BUY"] -= quantity
+
+                if self._fill(book, entry, quantity, price if entry.since == time else -_price, fill_time):
+                    heapq.heappop(bids)
+            else:
+                break
+
+        asks = book._asks
+
+        while asks and available["SELL"] > 0:
+            _price, _, entry = asks[0]
+
+            if not entry.live:
+                heapq.heappop(asks)
+                book._dead -= 1
+            elif _price <= price:
+                quantity = min(entry.remaining, available["SELL"])
+                available["SELL"] -= quantity
+
+                if self._fill(book, entry, quantity, price if entry.since == time else _price, fill_time):
+                    heapq.heappop(asks)
+            else:
+                break
+
+    def _fill(self, book: OrderBook, entry: _Resting, quantity: float, price: float, time: dt.datetime) -> bool:
+        """
+        Execute `quantity` units of an open order and pass the fill to the callback.
+
+        Returns:
+            bool: True if the order is completely filled and was removed from the book.
+        """
+
+        order = entry.order
+        entry.remaining -= quantity
+        done = entry.remaining <= 0
+
+        if done:
+            entry.live = False
+            book._live -= 1
+            del self._entries[order._uid, order._side]
+
+        self._bot.callback(Fill(order._uid, order._side, quantity, price, max(entry.remaining, 0.0), order._ticker, time))
+
+        return done
@@ -3,45 +3,38 @@ import datetime as dt
 from _utils.validate import val_instance
 
 from strategy import Strategy, Buy, Sell, Hold
+from strategy.filters import Session
+from strategy.indicators import SMA
 from bot import Bot, DataStream
 
 class SampleStrategy(Strategy):
-    def __init__(self) -> None:
+    # only feed ticks strictly between 9:00 and 12:00 (sessions include their start, hence 9:00:00.000001),
+    # compiled to integer comparisons and evaluated in bulk by backtests
+    feed_filter = Session(dt.time(9, 0, 0, 1), dt.time(12))
+    
+    def __init__(self, window: int = 20, hold: int = 20) -> None:
         """
         Create an instance of SampleStrategy.
+
+        Args:
+            window (int, optional): number of ticks of the moving average. Defaults to 20.
+            hold (int, optional): number of ticks to hold after a buy. Defaults to 20.
         """
         
-        # list of ticks
-        self._ticks: list[float] = []
+        # incrementally updated moving average of the last `window` ticks
+        self._sma: SMA = SMA(window)
+        
+        # moving average of the last `window` ticks when it was last compared
+        self._moving_average_last: float = None
         
-        # moving average of the last 20 ticks
-        self._moving_average_last_20: float = None
+        # number of ticks to hold after a buy
+        self._hold: int = hold
         
         # boolean to store whether a buy response has been returned
         self._buy_response_sent: bool = False
         # counter to store how many ticks the strategy has been holding
         self._hold_after_buy_counter: int = 0
 
-    def __feed__(self, time: dt.datetime, *args) -> bool:
-        """
-        Returns whether to call the next() method.
-
-        Args:
-            time (dt.datetime): The time of the datapoint.
-
-        Returns:
-            bool: True if the next() method should be called, False otherwise.
-        """
-        
-        # validate that a datetime has been passed
-        val_instance(time, dt.datetime) # this line can be removed for the sake of performance
-        
-        # get the time of the datapoint
-        _time: dt.time = time.time()
-        
-        # only feed if the time is between 9:00 and 12:00
-        return _time > dt.time(9) and _time < dt.time(12)
-    
     def next(self, time: dt.datetime, price: float) -> Buy | Sell | Hold:
         """
         Method to mimick the passing of the next tick.
@@ -58,38 +51,35 @@ class SampleStrategy(Strategy):
         val_instance(time, dt.datetime)
         val_instance(price, float)
         
-        # add out datapoint to the ticks
-        self._ticks.append(price)
+        # add our datapoint to the moving average, O(1) regardless of the window
+        moving_average_last: float = self._sma.update(price)
         
         # if there has not been a buy condition look for one
         if not self._buy_response_sent:
-            # if there aren't enough datapoints to calculate the moving average of the last 20 ticks then hold()
-            if len(self._ticks) < 20:
+            # if there aren't enough datapoints to calculate the moving average then hold()
+            if not self._sma.ready:
                 return Hold()
             else:
-                # calculate the moving average of the last 20 ticks
-                moving_average_last_20: float = sum(self._ticks[:20]) / 20
-                
                 # if this is the first time the moving average has been calculated then hold()
-                if self._moving_average_last_20 is None:
-                    self._moving_average_last_20 = moving_average_last_20
+                if self._moving_average_last is None:
+                    self._moving_average_last = moving_average_last
                     
                     return Hold()
                 else:
                     # if the moving average is greater than the moving average the last tick
-                    if moving_average_last_20 > self._moving_average_last_20:
+                    if moving_average_last > self._moving_average_last:
                         # update the moving average
-                        self._moving_average_last_20 = moving_average_last_20
+                        self._moving_average_last = moving_average_last
                         # store that a buy response has been sent
                         self._buy_response_sent = True
                         
                         # return a buy response
                         return Buy()
         else:
-            # if a buy response has been sent then hold() for 20 ticks
-            if self._hold_after_buy_counter > 20:
+            # if a buy response has been sent then hold() for `hold` ticks
+            if self._hold_after_buy_counter > self._hold:
                 # reset the strategy variables so that the strategy will buy again
-                self._moving_average_last_20 = None
+                self._moving_average_last = None
                 self._buy_response_sent = False
                 self._hold_after_buy_counter = 0
                 
@@ -98,10 +88,6 @@ class SampleStrategy(Strategy):
             
             # increment the hold counter
             self._hold_after_buy_counter += 1
-        
-        # if the lenght of the ticks is greater than 20, clear the last one
-        if len(self._ticks) > 20:
-            self._ticks.pop(0)
             
             
 class IBDataStream(DataStream):
@@ -1,2 +1,12 @@
-from strategy.protocol import StrategyResponse, Buy, Sell, Hold, response_from_dict, response_from_json, StrategyEvent, Trade, Trades
-from strategy.base import Strategy
\ No newline at end of file
+from _utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "strategy.protocol.base": ("StrategyResponse", "Buy", "Sell", "Hold", "HOLD", "response_from_dict", "response_from_json",
+                               "write_responses_jsonl", "iter_responses_jsonl", "StrategyEvent"),
+    "strategy.protocol.trade": ("Trade", "Trades"),
+    "strategy.protocol.batch": ("ResponseBatch",),
+    "strategy.protocol.binary": ("ResponseFile", "write_responses_binary"),
+    "strategy.base": ("Strategy",),
+    "strategy.vector": ("VectorStrategy",),
+    "strategy.buffer": ("TickBuffer", "TickHistory")
+})
@@ -1,12 +1,100 @@
+import pickle
+from typing import Any, Iterable
+
 from _utils.errors import RequiredOverwrite
 from strategy.protocol import StrategyResponse
 
 class Strategy:
+    # declarative feed filter applied by the default `__feed__()` to the time of the datapoint (the first argument,
+    # the second one after the symbol of keyed datapoints), see `strategy.filters`
+    feed_filter: "FeedFilter | None" = None
+    
     def __init__(self) -> None:
         pass
         
     def __feed__(self, *args) -> bool:
-        return True
+        if self.feed_filter is None:
+            return True
+        
+        # keyed datapoints `(symbol, time, price)` start with their symbol
+        return self.feed_filter(args[1] if type(args[0]) is str else args[0])
 
     def next(self, *args) -> StrategyResponse:
         raise RequiredOverwrite(f"`next()` requires overwrite.")
+
+    def next_many(self, times: "np.ndarray", prices: "np.ndarray", symbols: "np.ndarray | None" = None) -> Iterable[StrategyResponse]:
+        """
+        Batch form of `__feed__()` and `next()` used by chunked bots, returns the response of every fed tick in order.
+        Strategies opt in to batches by overwriting it, it defaults to `__feed__(*args)` and `next(*args)` per tick
+        with the same `(time, price)` or `(symbol, time, price)` arguments as unchunked bots (naive UTC datetimes).
+
+        Args:
+            times (np.ndarray): tick times, datetime64[ns] (UTC).
+            prices (np.ndarray): tick prices, float64.
+            symbols (np.ndarray | None, optional): tick symbols of keyed streams. Defaults to None.
+
+        Returns:
+            Iterable[StrategyResponse]: responses of the fed ticks.
+        """
+
+        feed = self.__feed__
+        next_ = self.next
+
+        # a declarative feed filter is evaluated over the whole chunk at once
+        if type(self).__feed__ is Strategy.__feed__ and not self.feed_filter is None:
+            import numpy as np
+
+            _indices = np.flatnonzero(self.feed_filter.mask(times))
+            times, prices = times[_indices], prices[_indices]
+            symbols = None if symbols is None else symbols[_indices]
+            feed = None
+
+        # converting a chunk at once is far cheaper than converting tick by tick
+        _times: list = times.astype("datetime64[us]").tolist()
+        _prices: list = prices.tolist()
+
+        if symbols is None:
+            if feed is None:
+                return [next_(time, price) for time, price in zip(_times, _prices)]
+
+            return [next_(time, price) for time, price in zip(_times, _prices) if feed(time, price)]
+
+        if feed is None:
+            return [next_(*args) for args in zip(symbols.tolist(), _times, _prices)]
+
+        return [next_(*args) for args in zip(symbols.tolist(), _times, _prices) if feed(*args)]
+
+    def __snapshot__(self) -> dict[str, Any]:
+        """
+        State of the strategy saved by checkpoints, by attribute name. Defaults to every instance attribute,
+        strategies holding unpicklable attributes (e.g. connections) should overwrite it with `__restore__()`.
+        """
+
+        return dict(vars(self))
+
+    def __restore__(self, state: dict[str, Any]) -> None:
+        """
+        Restore a state returned by `__snapshot__()`, defaults to setting every attribute.
+        """
+
+        vars(self).update(state)
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize the state of the strategy, see `__snapshot__()`.
+
+        Returns:
+            bytes
+        """
+
+        return pickle.dumps(self.__snapshot__(), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, snapshot: bytes) -> None:
+        """
+        Restore a state serialized by `snapshot()`.
+
+        Args:
+            snapshot (bytes): serialized state.
+        """
+
+        self.__restore__(pickle.loads(snapshot))
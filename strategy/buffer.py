@@ -0,0 +1,214 @@
+"""
+Module that stores the fixed capacity tick history buffers of strategies.
+"""
+
+import datetime as dt
+from typing import Any
+
+import numpy as np
+
+from _utils.time import epoch_ns
+from _utils.validate import val_instance
+
+
+class TickBuffer:
+    """
+    Fixed capacity circular buffer of tick times (epoch nanoseconds), prices and optionally volumes.
+
+    Every value is written twice, at its position and `capacity` positions later, so that the last `n` values
+    are always contiguous and returned as read only views without copying. Views reflect later writes,
+    copy them to keep a snapshot.
+    """
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def full(self) -> bool:
+        return self._size == self._capacity
+
+    def __init__(self, capacity: int, volume: bool = False) -> None:
+        """
+        Create a TickBuffer.
+
+        Args:
+            capacity (int): maximum number of ticks kept.
+            volume (bool, optional): keep tick volumes. Defaults to False.
+        """
+
+        val_instance(capacity, int)
+        val_instance(volume, bool)
+
+        if capacity < 1:
+            raise ValueError(f"expected `capacity` greater than 0, got {capacity}.")
+
+        self._capacity = capacity
+        self._time = np.zeros(2 * capacity, dtype=np.int64)
+        self._price = np.zeros(2 * capacity, dtype=np.float64)
+        self._volume = np.zeros(2 * capacity, dtype=np.float64) if volume else None
+        # position of the next write in [0, capacity)
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, time: dt.datetime | int, price: float, volume: float | None = None) -> None:
+        """
+        Append a tick, the oldest tick is overwritten if the buffer is full.
+
+        Args:
+            time (dt.datetime | int): tick time, datetime (naive datetimes are read as UTC) or epoch nanoseconds (int or numpy integer).
+            price (float): tick price.
+            volume (float | None, optional): tick volume, ignored if the buffer doesn't keep volumes. Defaults to None, 0.
+        """
+
+        # numpy integers are epoch nanoseconds too, e.g. times of a TickChunk
+        if not isinstance(time, (int, np.integer)):
+            time = epoch_ns(time)
+
+        _head = self._head
+        _mirror = _head + self._capacity
+
+        self._time[_head] = self._time[_mirror] = time
+        self._price[_head] = self._price[_mirror] = price
+
+        if not self._volume is None:
+            self._volume[_head] = self._volume[_mirror] = volume or 0.0
+
+        self._head = _head + 1 if _head + 1 < self._capacity else 0
+
+        if self._size < self._capacity:
+            self._size += 1
+
+    def extend(self, times: np.ndarray, prices: np.ndarray, volumes: np.ndarray | None = None) -> None:
+        """
+        Append ticks in bulk.
+
+        Args:
+            times (np.ndarray): tick times, datetime64 or epoch nanoseconds.
+            prices (np.ndarray): tick prices.
+            volumes (np.ndarray | None, optional): tick volumes. Defaults to None, 0.
+        """
+
+        times = np.asarray(times)
+
+        if np.issubdtype(times.dtype, np.datetime64):
+            times = times.astype("datetime64[ns]").view(np.int64)
+
+        prices = np.asarray(prices, dtype=np.float64)
+
+        # only the last `capacity` ticks can be kept
+        _count = len(times)
+        _skip = max(_count - self._capacity, 0)
+        _positions = (self._head + _skip + np.arange(_count - _skip)) % self._capacity
+
+        self._time[_positions] = self._time[_positions + self._capacity] = times[_skip:]
+        self._price[_positions] = self._price[_positions + self._capacity] = prices[_skip:]
+
+        if not self._volume is None:
+            _volumes = np.zeros(_count) if volumes is None else np.asarray(volumes, dtype=np.float64)
+            self._volume[_positions] = self._volume[_positions + self._capacity] = _volumes[_skip:]
+
+        self._head = (self._head + _count) % self._capacity
+        self._size = min(self._size + _count, self._capacity)
+
+    def clear(self) -> None:
+        """
+        Remove every tick.
+        """
+
+        self._head = 0
+        self._size = 0
+
+    def _last(self, _array: np.ndarray, n: int | None) -> np.ndarray:
+        n = self._size if n is None else min(n, self._size)
+        _stop = self._head + self._capacity
+
+        _view = _array[_stop - n:_stop]
+        _view.flags.writeable = False
+
+        return _view
+
+    def times(self, n: int | None = None) -> np.ndarray:
+        """
+        Last `n` tick times, oldest first.
+
+        Args:
+            n (int | None, optional): number of ticks. Defaults to None, every tick.
+
+        Returns:
+            np.ndarray: read only datetime64[ns] view.
+        """
+
+        return self._last(self._time, n).view("datetime64[ns]")
+
+    def prices(self, n: int | None = None) -> np.ndarray:
+        """
+        Last `n` tick prices, oldest first.
+
+        Args:
+            n (int | None, optional): number of ticks. Defaults to None, every tick.
+
+        Returns:
+            np.ndarray: read only float64 view.
+        """
+
+        return self._last(self._price, n)
+
+    def volumes(self, n: int | None = None) -> np.ndarray:
+        """
+        Last `n` tick volumes, oldest first.
+
+        Args:
+            n (int | None, optional): number of ticks. Defaults to None, every tick.
+
+        Raises:
+            ValueError: If the buffer doesn't keep volumes.
+
+        Returns:
+            np.ndarray: read only float64 view.
+        """
+
+        if self._volume is None:
+            raise ValueError("the buffer doesn't keep volumes, create it with `volume=True`.")
+
+        return self._last(self._volume, n)
+
+
+class TickHistory:
+    """
+    Declares a per instance TickBuffer on a Strategy subclass, created on first access:
+
+        class MyStrategy(Strategy):
+            history = TickHistory(256)
+    """
+
+    def __init__(self, capacity: int, volume: bool = False) -> None:
+        """
+        Declare a TickBuffer.
+
+        Args:
+            capacity (int): maximum number of ticks kept.
+            volume (bool, optional): keep tick volumes. Defaults to False.
+        """
+
+        val_instance(capacity, int)
+        val_instance(volume, bool)
+
+        self._capacity = capacity
+        self._volume = volume
+        self._name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type) -> "TickBuffer | TickHistory":
+        if instance is None:
+            return self
+
+        # stored in the instance dict, which takes precedence over this descriptor on later accesses
+        _buffer = instance.__dict__[self._name] = TickBuffer(self._capacity, self._volume)
+
+        return _buffer
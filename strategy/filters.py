@@ -0,0 +1,369 @@
+"""
+Module that stores the declarative feed filters of strategies.
+
+Filters accept a datetime or epoch nanoseconds per tick (`filter(time)`), compiled to comparisons against precomputed
+microseconds of the day, weekday bits and ordinals, and datetime64 arrays in bulk (`filter.mask(times)`), compiled to integer comparisons
+on the wall clock time of the ticks in microseconds since the epoch.
+
+A filter without timezone uses the wall clock of the datetimes it is given, and UTC for epoch nanoseconds and arrays.
+A filter with a timezone converts aware datetimes, naive datetimes and arrays are read as UTC.
+
+    class MyStrategy(Strategy):
+        feed_filter = Session(dt.time(9, 30), dt.time(16)) & Weekdays()
+"""
+
+import datetime as dt
+from types import NoneType
+from typing import Iterable
+
+import numpy as np
+
+from _utils.errors import RequiredOverwrite
+from _utils.validate import val_instance
+
+
+# microseconds in a day
+DAY_US = 86_400_000_000
+
+# ordinal of 1970-01-01
+_UNIX_ORDINAL = 719_163
+
+# weekday of 1970-01-01 (thursday)
+_UNIX_WEEKDAY = 3
+
+_HOUR_NS = 3_600_000_000_000
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_MICROSECOND = dt.timedelta(microseconds=1)
+
+
+def _wallclock(time: dt.datetime | int, tz: dt.tzinfo | None) -> dt.datetime:
+    """
+    Wall clock datetime of a tick.
+
+    Args:
+        time (dt.datetime | int): datetime or epoch nanoseconds.
+        tz (dt.tzinfo | None): timezone of the wall clock.
+
+    Returns:
+        dt.datetime: wall clock datetime.
+    """
+
+    if type(time) is int:
+        time = _EPOCH + dt.timedelta(microseconds=time // 1000)
+
+        return time if tz is None else time.astimezone(tz)
+
+    if tz is None:
+        return time
+
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=dt.timezone.utc)
+
+    return time.astimezone(tz)
+
+
+def _wallclock_us(time: dt.datetime) -> int:
+    """
+    Wall clock datetime in microseconds since the epoch.
+    """
+
+    return ((time.toordinal() - _UNIX_ORDINAL) * DAY_US
+            + ((time.hour * 60 + time.minute) * 60 + time.second) * 1_000_000
+            + time.microsecond)
+
+
+def _local_us_array(times: np.ndarray, tz: dt.tzinfo | None) -> np.ndarray:
+    """
+    Wall clock times of UTC datetime64 ticks in microseconds since the epoch.
+    Timezone offsets are computed once per distinct hour.
+
+    Args:
+        times (np.ndarray): datetime64 (UTC) or epoch nanoseconds.
+        tz (dt.tzinfo | None): timezone of the wall clock.
+
+    Returns:
+        np.ndarray: int64 wall clock microseconds.
+    """
+
+    _ns = np.asarray(times)
+
+    if np.issubdtype(_ns.dtype, np.datetime64):
+        _ns = _ns.astype("datetime64[ns]").view(np.int64)
+
+    _us = _ns // 1000
+
+    if tz is None:
+        return _us
+
+    _hours, _inverse = np.unique(_ns // _HOUR_NS, return_inverse=True)
+    _offsets = np.array([
+        dt.datetime.fromtimestamp(_hour * 3600, tz).utcoffset() // _MICROSECOND
+        for _hour in _hours.tolist()
+    ], dtype=np.int64)
+
+    return _us + _offsets[_inverse]
+
+
+class FeedFilter:
+    """
+    Base class of feed filters, filters are combined with `&`.
+    """
+
+    @property
+    def tz(self) -> dt.tzinfo | None:
+        return self._tz
+
+    def __init__(self, tz: dt.tzinfo | None = None) -> None:
+        val_instance(tz, (dt.tzinfo, NoneType))
+
+        self._tz = tz
+
+    def __call__(self, time: dt.datetime | int) -> bool:
+        """
+        Whether a tick passes the filter.
+
+        Args:
+            time (dt.datetime | int): tick time, datetime or epoch nanoseconds.
+
+        Returns:
+            bool: True if the tick passes the filter.
+        """
+
+        if self._tz is None and not type(time) is int:
+            return self._accept(time)
+
+        return self._accept(_wallclock(time, self._tz))
+
+    def mask(self, times: np.ndarray) -> np.ndarray:
+        """
+        Whether each tick passes the filter, without changing the state of stateful filters.
+
+        Args:
+            times (np.ndarray): tick times, datetime64 (UTC) or epoch nanoseconds.
+
+        Returns:
+            np.ndarray: boolean mask.
+        """
+
+        return self._mask(_local_us_array(times, self._tz))
+
+    def __and__(self, __o: "FeedFilter") -> "AllFilters":
+        val_instance(__o, FeedFilter)
+
+        return AllFilters(self, __o)
+
+    def _accept(self, time: dt.datetime) -> bool:
+        raise RequiredOverwrite(f"`_accept()` requires overwrite.")
+
+    def _mask(self, local_us: np.ndarray) -> np.ndarray:
+        raise RequiredOverwrite(f"`_mask()` requires overwrite.")
+
+
+class AllFilters(FeedFilter):
+    """
+    Ticks passing every filter, filters are evaluated in order and later filters only see ticks earlier filters accepted.
+    """
+
+    @property
+    def filters(self) -> tuple[FeedFilter]:
+        return self._filters
+
+    def __init__(self, *filters: FeedFilter) -> None:
+        for _filter in filters:
+            val_instance(_filter, FeedFilter)
+
+        super().__init__()
+
+        # nested combinations are flattened
+        _filters = []
+
+        for _filter in filters:
+            _filters += list(_filter.filters) if isinstance(_filter, AllFilters) else [_filter]
+
+        self._filters = tuple(_filters)
+
+    def __call__(self, time: dt.datetime | int) -> bool:
+        for _filter in self._filters:
+            if not _filter(time):
+                return False
+
+        return True
+
+    def mask(self, times: np.ndarray) -> np.ndarray:
+        times = np.asarray(times)
+        _mask = np.ones(len(times), dtype=bool)
+
+        for _filter in self._filters:
+            _indices = np.flatnonzero(_mask)
+            _mask[_indices] = _filter.mask(times[_indices])
+
+        return _mask
+
+
+class Session(FeedFilter):
+    """
+    Ticks between `start` (inclusive) and `end` (exclusive) wall clock times, sessions crossing midnight
+    (`start` after `end`) are supported.
+    """
+
+    def __init__(self, start: dt.time, end: dt.time, tz: dt.tzinfo | None = None) -> None:
+        """
+        Create a Session filter.
+
+        Args:
+            start (dt.time): start of the session.
+            end (dt.time): end of the session.
+            tz (dt.tzinfo | None, optional): timezone of the session. Defaults to None.
+        """
+
+        val_instance(start, dt.time)
+        val_instance(end, dt.time)
+
+        super().__init__(tz)
+
+        self._start = ((start.hour * 60 + start.minute) * 60 + start.second) * 1_000_000 + start.microsecond
+        self._end = ((end.hour * 60 + end.minute) * 60 + end.second) * 1_000_000 + end.microsecond
+
+    def _accept(self, time: dt.datetime) -> bool:
+        _time = ((time.hour * 60 + time.minute) * 60 + time.second) * 1_000_000 + time.microsecond
+
+        if self._start <= self._end:
+            return self._start <= _time < self._end
+
+        return _time >= self._start or _time < self._end
+
+    def _mask(self, local_us: np.ndarray) -> np.ndarray:
+        _time = local_us % DAY_US
+
+        if self._start <= self._end:
+            return (_time >= self._start) & (_time < self._end)
+
+        return (_time >= self._start) | (_time < self._end)
+
+
+class Weekdays(FeedFilter):
+    """
+    Ticks on the given weekdays (0: monday, 6: sunday).
+    """
+
+    def __init__(self, weekdays: Iterable[int] = (0, 1, 2, 3, 4), tz: dt.tzinfo | None = None) -> None:
+        """
+        Create a Weekdays filter.
+
+        Args:
+            weekdays (Iterable[int], optional): accepted weekdays. Defaults to (0, 1, 2, 3, 4), monday to friday.
+            tz (dt.tzinfo | None, optional): timezone of the weekdays. Defaults to None.
+        """
+
+        super().__init__(tz)
+
+        self._weekdays = np.zeros(7, dtype=bool)
+
+        for _weekday in weekdays:
+            val_instance(_weekday, int)
+
+            if not 0 <= _weekday <= 6:
+                raise ValueError(f"expected weekdays between 0 and 6, got {_weekday}.")
+
+            self._weekdays[_weekday] = True
+
+        # bit `i` is set if weekday `i` is accepted
+        self._bits = sum(1 << _weekday for _weekday in range(7) if self._weekdays[_weekday])
+
+    def _accept(self, time: dt.datetime) -> bool:
+        return bool(self._bits >> time.weekday() & 1)
+
+    def _mask(self, local_us: np.ndarray) -> np.ndarray:
+        return self._weekdays[(local_us // DAY_US + _UNIX_WEEKDAY) % 7]
+
+
+class Holidays(FeedFilter):
+    """
+    Ticks not on the given dates.
+    """
+
+    def __init__(self, dates: Iterable[dt.date], tz: dt.tzinfo | None = None) -> None:
+        """
+        Create a Holidays filter.
+
+        Args:
+            dates (Iterable[dt.date]): rejected dates.
+            tz (dt.tzinfo | None, optional): timezone of the dates. Defaults to None.
+        """
+
+        super().__init__(tz)
+
+        _days = []
+
+        for _date in dates:
+            val_instance(_date, dt.date)
+
+            _days.append(_date.toordinal() - _UNIX_ORDINAL)
+
+        self._ordinals = frozenset(_day + _UNIX_ORDINAL for _day in _days)
+        self._days_array = np.array(sorted(_days), dtype=np.int64)
+
+    def _accept(self, time: dt.datetime) -> bool:
+        return not time.toordinal() in self._ordinals
+
+    def _mask(self, local_us: np.ndarray) -> np.ndarray:
+        return ~np.isin(local_us // DAY_US, self._days_array)
+
+
+class Throttle(FeedFilter):
+    """
+    Ticks at least `interval` after the last accepted tick.
+
+    Throttle keeps the time of the last accepted tick, declare it per instance (in `__init__`)
+    when a Strategy class has several instances.
+    """
+
+    @property
+    def interval(self) -> dt.timedelta:
+        return self._interval
+
+    def __init__(self, interval: dt.timedelta) -> None:
+        """
+        Create a Throttle filter.
+
+        Args:
+            interval (dt.timedelta): minimum interval between accepted ticks.
+        """
+
+        val_instance(interval, dt.timedelta)
+
+        super().__init__()
+
+        self._interval = interval
+        self._interval_us = interval // _MICROSECOND
+        self._last = None
+
+    def reset(self) -> None:
+        """
+        Forget the last accepted tick.
+        """
+
+        self._last = None
+
+    def _accept(self, time: dt.datetime) -> bool:
+        _time = _wallclock_us(time)
+
+        if self._last is None or _time - self._last >= self._interval_us:
+            self._last = _time
+
+            return True
+
+        return False
+
+    def _mask(self, local_us: np.ndarray) -> np.ndarray:
+        _mask = np.zeros(len(local_us), dtype=bool)
+
+        # times are sorted, jump to the first tick at least `interval` after each accepted tick
+        _index = 0
+
+        while _index < len(local_us):
+            _mask[_index] = True
+            _index = int(np.searchsorted(local_us, local_us[_index] + self._interval_us, side="left"))
+
+        return _mask
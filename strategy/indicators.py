@@ -0,0 +1,442 @@
+"""
+Module that stores incrementally updated rolling indicators.
+
+Every indicator is updated in O(1) per value regardless of its window through `update()`, and can be warmed up
+from arrays through `update_many()`. Values are 'nan' until the indicator is `ready`.
+"""
+
+from collections import deque
+from typing import Iterable
+
+from _utils.errors import RequiredOverwrite
+from _utils.validate import val_instance
+
+
+# nan reference
+nan = float("nan")
+
+
+def _values(__values: Iterable) -> Iterable:
+    # iterating python floats is much faster than iterating numpy scalars
+    return __values.tolist() if hasattr(__values, "tolist") else __values
+
+
+def _neumaier(__sum: float, __compensation: float, __value: float) -> tuple[float, float]:
+    # compensated (Neumaier) summation, `__compensation` accumulates the low order bits lost by `__sum`
+    _sum = __sum + __value
+
+    if abs(__sum) >= abs(__value):
+        return _sum, __compensation + ((__sum - _sum) + __value)
+
+    return _sum, __compensation + ((__value - _sum) + __sum)
+
+
+def _check_window(window: int) -> None:
+    val_instance(window, int)
+
+    if window < 1:
+        raise ValueError(f"expected `window` greater than 0, got {window}.")
+
+
+class Indicator:
+    """
+    Base class of incrementally updated indicators.
+    """
+
+    __slots__ = ("_value",)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        return self._value == self._value
+
+    def update(self, value: float) -> float:
+        """
+        Update the indicator with a value.
+
+        Args:
+            value (float): new value.
+
+        Returns:
+            float: indicator value, 'nan' if not ready.
+        """
+
+        raise RequiredOverwrite(f"`update()` requires overwrite.")
+
+    def update_many(self, *values: Iterable[float]) -> float:
+        """
+        Update the indicator with every value of one or more arrays (e.g. prices and volumes), in order.
+
+        Args:
+            values (Iterable[float]): arrays of values, one per `update()` argument.
+
+        Returns:
+            float: indicator value, 'nan' if not ready.
+        """
+
+        _update = self.update
+
+        if len(values) == 1:
+            for _value in _values(values[0]):
+                _update(_value)
+        else:
+            for _args in zip(*[_values(_v) for _v in values]):
+                _update(*_args)
+
+        return self._value
+
+
+class SMA(Indicator):
+    """
+    Simple moving average over the last `window` values.
+    """
+
+    __slots__ = ("_window", "_buffer", "_sum", "_compensation")
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+
+        self._window = window
+        self._buffer = deque(maxlen=window)
+        # compensated running sum, the values leaving the window don't accumulate floating point drift
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._value = nan
+
+    def update(self, value: float) -> float:
+        _buffer = self._buffer
+        _sum, _compensation = self._sum, self._compensation
+
+        if len(_buffer) == self._window:
+            _sum, _compensation = _neumaier(_sum, _compensation, -_buffer[0])
+
+        _buffer.append(value)
+        self._sum, self._compensation = _neumaier(_sum, _compensation, value)
+
+        if len(_buffer) == self._window:
+            self._value = (self._sum + self._compensation) / self._window
+
+        return self._value
+
+
+class EMA(Indicator):
+    """
+    Exponential moving average with smoothing `2 / (window + 1)`, seeded with the first value
+    and ready after `window` values.
+    """
+
+    __slots__ = ("_window", "_alpha", "_count", "_ema")
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+
+        self._window = window
+        self._alpha = 2 / (window + 1)
+        self._count = 0
+        self._ema = nan
+        self._value = nan
+
+    def update(self, value: float) -> float:
+        if self._count:
+            self._ema += self._alpha * (value - self._ema)
+        else:
+            self._ema = value
+
+        self._count += 1
+
+        if self._count >= self._window:
+            self._value = self._ema
+
+        return self._value
+
+
+class RollingMax(Indicator):
+    """
+    Maximum of the last `window` values, kept with a monotonic deque.
+    """
+
+    __slots__ = ("_window", "_deque", "_index")
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def __init__(self, window: int) -> None:
+        _check_window(window)
+
+        self._window = window
+        # (index, value) pairs with decreasing values
+        self._deque = deque()
+        self._index = 0
+        self._value = nan
+
+    def _dominates(self, __new: float, __old: float) -> bool:
+        return __new >= __old
+
+    def update(self, value: float) -> float:
+        _deque = self._deque
+        _dominates = self._dominates
+
+        while _deque and _dominates(value, _deque[-1][1]):
+            _deque.pop()
+
+        _deque.append((self._index, value))
+        self._index += 1
+
+        if _deque[0][0] <= self._index - 1 - self._window:
+            _deque.popleft()
+
+        if self._index >= self._window:
+            self._value = _deque[0][1]
+
+        return self._value
+
+
+class RollingMin(RollingMax):
+    """
+    Minimum of the last `window` values, kept with a monotonic deque.
+    """
+
+    __slots__ = ()
+
+    def _dominates(self, __new: float, __old: float) -> bool:
+        return __new <= __old
+
+
+class RollingVariance(Indicator):
+    """
+    Variance of the last `window` values, updated with Welford's method.
+    """
+
+    __slots__ = ("_window", "_ddof", "_buffer", "_mean", "_m2")
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def mean(self) -> float:
+        return self._mean if len(self._buffer) == self._window else nan
+
+    @property
+    def std(self) -> float:
+        return self._value ** 0.5
+
+    def __init__(self, window: int, ddof: int = 1) -> None:
+        """
+        Create a RollingVariance.
+
+        Args:
+            window (int): number of values.
+            ddof (int, optional): delta degrees of freedom, 1 for the sample variance and 0 for the population variance. Defaults to 1.
+        """
+
+        _check_window(window)
+        val_instance(ddof, int)
+
+        if window <= ddof:
+            raise ValueError(f"expected `window` greater than `ddof`, got {window}.")
+
+        self._window = window
+        self._ddof = ddof
+        self._buffer = deque(maxlen=window)
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._value = nan
+
+    def update(self, value: float) -> float:
+        _buffer = self._buffer
+
+        if len(_buffer) == self._window:
+            _old = _buffer[0]
+            _mean = self._mean + (value - _old) / self._window
+            self._m2 += (value - _old) * (value - _mean + _old - self._mean)
+            self._mean = _mean
+        else:
+            _delta = value - self._mean
+            self._mean += _delta / (len(_buffer) + 1)
+            self._m2 += _delta * (value - self._mean)
+
+        _buffer.append(value)
+
+        if len(_buffer) == self._window:
+            # the running sum of squares can drift slightly below 0
+            self._value = max(self._m2, 0.0) / (self._window - self._ddof)
+
+        return self._value
+
+
+class VWAP(Indicator):
+    """
+    Volume weighted average price, cumulative or over the last `window` values.
+    """
+
+    __slots__ = ("_window", "_buffer", "_pv", "_volume")
+
+    @property
+    def window(self) -> int | None:
+        return self._window
+
+    def __init__(self, window: int | None = None) -> None:
+        """
+        Create a VWAP.
+
+        Args:
+            window (int | None, optional): number of values. Defaults to None, cumulative.
+        """
+
+        if not window is None:
+            _check_window(window)
+
+        self._window = window
+        self._buffer = deque(maxlen=window) if not window is None else None
+        self._pv = 0.0
+        self._volume = 0.0
+        self._value = nan
+
+    def update(self, value: float, volume: float = 1.0) -> float:
+        """
+        Update the VWAP with a price and its volume.
+
+        Args:
+            value (float): price.
+            volume (float, optional): volume. Defaults to 1.0.
+
+        Returns:
+            float: VWAP, 'nan' if not ready.
+        """
+
+        _buffer = self._buffer
+
+        if not _buffer is None:
+            if len(_buffer) == self._window:
+                _pv, _volume = _buffer[0]
+                self._pv -= _pv
+                self._volume -= _volume
+
+            _buffer.append((value * volume, volume))
+
+        self._pv += value * volume
+        self._volume += volume
+
+        if self._volume > 0 and (_buffer is None or len(_buffer) == self._window):
+            self._value = self._pv / self._volume
+
+        return self._value
+
+
+class RSI(Indicator):
+    """
+    Relative strength index over `window` changes with Wilder's smoothing.
+    """
+
+    __slots__ = ("_window", "_previous", "_count", "_gain", "_loss")
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def __init__(self, window: int = 14) -> None:
+        _check_window(window)
+
+        self._window = window
+        self._previous = nan
+        self._count = 0
+        self._gain = 0.0
+        self._loss = 0.0
+        self._value = nan
+
+    def update(self, value: float) -> float:
+        if self._previous != self._previous:
+            self._previous = value
+
+            return self._value
+
+        _change = value - self._previous
+        _gain = _change if _change > 0 else 0.0
+        _loss = -_change if _change < 0 else 0.0
+        self._previous = value
+
+        if self._count < self._window:
+            # the first averages are simple averages of the first `window` changes
+            self._count += 1
+            self._gain += (_gain - self._gain) / self._count
+            self._loss += (_loss - self._loss) / self._count
+        else:
+            self._gain += (_gain - self._gain) / self._window
+            self._loss += (_loss - self._loss) / self._window
+
+        if self._count == self._window:
+            if self._loss == 0:
+                self._value = 100.0 if self._gain > 0 else 50.0
+            else:
+                self._value = 100 - 100 / (1 + self._gain / self._loss)
+
+        return self._value
+
+
+class ATR(Indicator):
+    """
+    Average true range over `window` values with Wilder's smoothing.
+    """
+
+    __slots__ = ("_window", "_close", "_count", "_atr")
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    def __init__(self, window: int = 14) -> None:
+        _check_window(window)
+
+        self._window = window
+        self._close = nan
+        self._count = 0
+        self._atr = 0.0
+        self._value = nan
+
+    def update(self, value: float, low: float | None = None, close: float | None = None) -> float:
+        """
+        Update the ATR with a bar, or with a tick if only `value` is given.
+
+        Args:
+            value (float): high of the bar, or tick price.
+            low (float | None, optional): low of the bar. Defaults to None, `value`.
+            close (float | None, optional): close of the bar. Defaults to None, `value`.
+
+        Returns:
+            float: ATR, 'nan' if not ready.
+        """
+
+        _high = value
+        _low = value if low is None else low
+        _close = value if close is None else close
+
+        if self._close == self._close:
+            _range = max(_high, self._close) - min(_low, self._close)
+        else:
+            _range = _high - _low
+
+        self._close = _close
+
+        if self._count < self._window:
+            self._count += 1
+            self._atr += (_range - self._atr) / self._count
+        else:
+            self._atr += (_range - self._atr) / self._window
+
+        if self._count == self._window:
+            self._value = self._atr
+
+        return self._value
@@ -1,2 +1,10 @@
-from strategy.protocol.base import *
-from strategy.protocol.trade import *
\ No newline at end of file
+from _utils.lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "strategy.protocol.base": ("nan", "JSONL_BUFFER_SIZE", "JSONL_BLOCK_SIZE", "LOCAL_TIMEZONE", "StrategyEvent", "StrategyResponse",
+                               "response_from_dict", "response_from_json", "write_responses_jsonl", "iter_responses_jsonl",
+                               "Hold", "Buy", "Sell", "HOLD"),
+    "strategy.protocol.trade": ("TRADE_DTYPE", "Trade", "Trades"),
+    "strategy.protocol.batch": ("COMMANDS", "COMMAND_CODES", "NULL_INT", "NULL_CODE", "ResponseBatch"),
+    "strategy.protocol.binary": ("RECORD_MAGIC", "HEADER_SIZE", "RECORD_DTYPE", "write_responses_binary", "ResponseFile")
+})
@@ -2,18 +2,43 @@ import datetime as dt
 from math import isnan
 from pathlib import Path
 from types import NoneType
-from typing import SupportsInt
+from typing import IO, Iterable, Iterator, SupportsInt
+import gzip
+import io
 import json
 
+from _utils.errors import ReadOnlyPropertyError
 from _utils.typing import PathLike
 from _utils.validate import LogWarning, val_instance
-from _utils.time import parse_time
+from _utils.time import now, parse_time
 
 # nan reference
 nan = float("nan")
 
-# local timezone
-LOCAL_TIMEZONE = dt.datetime.now(dt.timezone.utc).astimezone().tzinfo
+# buffer size of JSON Lines file handles
+JSONL_BUFFER_SIZE = 1 << 20
+
+# number of lines joined into a single write by `write_responses_jsonl`
+JSONL_BLOCK_SIZE = 1024
+
+# local timezone (`LOCAL_TIMEZONE`), detected on first use
+_local_timezone: dt.tzinfo | NoneType = None
+
+
+def _get_local_timezone() -> dt.tzinfo:
+    global _local_timezone
+
+    if _local_timezone is None:
+        _local_timezone = dt.datetime.now(dt.timezone.utc).astimezone().tzinfo
+
+    return _local_timezone
+
+
+def __getattr__(name: str) -> object:
+    if name == "LOCAL_TIMEZONE":
+        return _get_local_timezone()
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 # todo: implement strategyevent
@@ -23,6 +48,8 @@ class StrategyEvent:
 
 
 class StrategyResponse:
+    __slots__ = ("_time", "_price", "_command", "_ticker", "_exchange", "_uid")
+
     @property
     def time(self) -> dt.datetime | dt.time | dt.date | NoneType:
         return self._time
@@ -34,7 +61,7 @@ class StrategyResponse:
         if not _time is None:
             if isinstance(_time, str):
                 if _time in ("now", "auto"):
-                    self._time = dt.datetime.now(tz=LOCAL_TIMEZONE)
+                    self._time = now(_get_local_timezone())
                 else:
                     self._time = parse_time(_time)
             else:
@@ -144,10 +171,11 @@ class StrategyResponse:
 
     @uid.setter
     def uid(self, _uid: int | NoneType) -> None:
-        val_instance(_uid, (int, SupportsInt, NoneType))
+        # `SupportsInt` is a runtime protocol and slow to check, so it is checked last
+        val_instance(_uid, (int, NoneType, SupportsInt))
 
         if not _uid is None:
-            if isinstance(_uid, SupportsInt):
+            if not type(_uid) is int:
                 _uid = int(_uid)
 
             self._uid = _uid
@@ -186,6 +214,35 @@ class StrategyResponse:
         self.exchange = exchange
         self.uid = uid
 
+    @classmethod
+    def fast(cls, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, command: str = "HOLD", ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> "StrategyResponse":
+        """
+        Generate a StrategyResponse object without validating or normalizing its arguments.
+        Designed for trusted callers on hot paths, arguments must already be in the form the property setters produce.
+
+        Args:
+            time (dt.datetime | dt.time | dt.date | NoneType, optional): time of order creation. Defaults to None, if None represented as 'nan'.
+            price (float | int | NoneType, optional): price at order creation. Defaults to None, if None represented as 'nan'.
+            command (str, optional): 'BUY', 'SELL' or 'HOLD' (upper case). Defaults to 'HOLD'.
+            ticker (str | NoneType, optional): upper case ticker of stock to be bought. Defaults to None.
+            exchange (str | NoneType, optional): upper case exchange at which the stock is to be bought. Defaults to None.
+            uid (int | NoneType, optional): unique id used to pair with 'sell' and 'hold' commands. Defaults to None, will not be paired.
+
+        Returns:
+            StrategyResponse
+        """
+
+        self = object.__new__(cls)
+
+        self._time = nan if time is None else time
+        self._price = nan if price is None else price
+        self._command = command
+        self._ticker = ticker
+        self._exchange = exchange
+        self._uid = uid
+
+        return self
+
     def __hash__(self) -> int:
         return self._uid
 
@@ -203,7 +260,7 @@ class StrategyResponse:
     def __str__(self) -> str:
         _str = ""
 
-        if not self._time is None:
+        if isinstance(self._time, (dt.datetime, dt.time, dt.date)):
             _str += f"{self._time.isoformat()} "
 
         _str += f"{self._command}"
@@ -238,8 +295,11 @@ class StrategyResponse:
             "uid": self.uid
         }
 
-        if not self.time is None:
+        # a missing time is stored as 'nan', which has no isoformat
+        if isinstance(self.time, (dt.datetime, dt.time, dt.date)):
             __dict["time"] = self.time.isoformat()
+        else:
+            __dict["time"] = None
 
         if not isnan(self.price):
             __dict["price"] = self.price
@@ -274,7 +334,10 @@ class StrategyResponse:
 
         __json = Path(__json)
 
-        __json.mkdir(parents=True, exist_ok=exist_ok)
+        if __json.exists() and not exist_ok:
+            raise FileExistsError(f"'{__json}' already exists.")
+
+        __json.parent.mkdir(parents=True, exist_ok=True)
 
         with open(__json, "w") as f:
             json.dump(self.__dict__(), f, allow_nan=allow_nan, indent=indent)
@@ -294,31 +357,13 @@ def response_from_dict(__dict: dict) -> StrategyResponse:
 
     val_instance(__dict, dict)
 
-    if "time" in __dict:
-        _time = __dict["time"]
-
-    if "price" in __dict:
-        _price = __dict["price"]
-
-    if "command" in __dict:
-        _command = __dict["command"]
-
-    if "ticker" in __dict:
-        _ticker = __dict["ticker"]
-
-    if "exchange" in __dict:
-        _exchange = __dict["exchange"]
-
-    if "uid" in __dict:
-        _uid = __dict["uid"]
-
     return StrategyResponse(
-        time=_time,
-        price=_price,
-        command=_command,
-        ticker=_ticker,
-        exchange=_exchange,
-        uid=_uid
+        time=__dict.get("time"),
+        price=__dict.get("price"),
+        command=__dict.get("command"),
+        ticker=__dict.get("ticker"),
+        exchange=__dict.get("exchange"),
+        uid=__dict.get("uid")
     )
 
 
@@ -340,6 +385,84 @@ def response_from_json(__json: PathLike) -> StrategyResponse:
         return response_from_dict(json.load(f))
 
 
+def _open_jsonl(__jsonl: PathLike, mode: str) -> IO:
+    """
+    Open a JSON Lines file in text mode with a large buffer, '.gz' files are opened through gzip.
+    """
+
+    if str(__jsonl).endswith(".gz"):
+        return gzip.open(__jsonl, mode + "t", encoding="utf-8")
+
+    return open(__jsonl, mode, encoding="utf-8", buffering=JSONL_BUFFER_SIZE)
+
+
+def write_responses_jsonl(responses: Iterable[StrategyResponse], __jsonl: PathLike | IO, append: bool = False, allow_nan: bool = True) -> int:
+    """
+    Write StrategyResponse objects to a JSON Lines file, one `as_dict()` object per line.
+    Lines are written in blocks through a single buffered file handle.
+
+    Args:
+        responses (Iterable[StrategyResponse]): responses to be written, consumed once.
+        __jsonl (PathLike | IO): path to be stored at ('.gz' paths are gzip compressed) or an open text or binary file object
+            (e.g. `gzip.open()` or a zstd stream writer), file objects are not closed.
+        append (bool, optional): append to `__jsonl` instead of overwriting it, ignored for file objects. Defaults to False.
+        allow_nan (bool, optional): allow 'NaN' values in the json (responses without a price). Defaults to True.
+
+    Returns:
+        int: number of responses written.
+    """
+
+    val_instance(append, bool)
+    val_instance(allow_nan, bool)
+
+    if isinstance(__jsonl, PathLike):
+        with _open_jsonl(__jsonl, "a" if append else "w") as f:
+            return write_responses_jsonl(responses, f, allow_nan=allow_nan)
+
+    _encode = json.JSONEncoder(allow_nan=allow_nan, separators=(",", ":")).encode
+    _text = isinstance(__jsonl, io.TextIOBase)
+    _lines = []
+    _count = 0
+
+    for _response in responses:
+        _lines.append(_encode(_response.__dict__()))
+        _count += 1
+
+        if len(_lines) == JSONL_BLOCK_SIZE:
+            _block = "\n".join(_lines) + "\n"
+            __jsonl.write(_block if _text else _block.encode("utf-8"))
+            _lines.clear()
+
+    if _lines:
+        _block = "\n".join(_lines) + "\n"
+        __jsonl.write(_block if _text else _block.encode("utf-8"))
+
+    return _count
+
+
+def iter_responses_jsonl(__jsonl: PathLike | IO) -> Iterator[StrategyResponse]:
+    """
+    Lazily read StrategyResponse objects from a JSON Lines file, blank lines are skipped.
+
+    Args:
+        __jsonl (PathLike | IO): path to the file ('.gz' paths are gzip decompressed) or an open text or binary file object,
+            file objects are not closed.
+
+    Yields:
+        StrategyResponse
+    """
+
+    if isinstance(__jsonl, PathLike):
+        with _open_jsonl(__jsonl, "r") as f:
+            yield from iter_responses_jsonl(f)
+
+        return
+
+    for _line in __jsonl:
+        if _line.strip():
+            yield response_from_dict(json.loads(_line))
+
+
 class Hold(StrategyResponse):
     """
     Generate a StrategyResponse object desgined to represent a 'hold' order.
@@ -352,9 +475,23 @@ class Hold(StrategyResponse):
         uid (int | NoneType, optional): unique id used to pair with 'sell' and 'hold' commands. Defaults to None, will not be paired.
     """
 
+    __slots__ = ()
+
     def __init__(self, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> None:
         super().__init__(time, price, "HOLD", ticker, exchange, uid)
 
+    @classmethod
+    def fast(cls, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> "Hold":
+        """
+        Generate a Hold object without validating or normalizing its arguments, see `StrategyResponse.fast()`.
+        """
+
+        # a hold without payload is always the interned instance
+        if time is None and price is None and ticker is None and exchange is None and uid is None:
+            return HOLD
+
+        return super().fast(time, price, "HOLD", ticker, exchange, uid)
+
 
 class Buy(StrategyResponse):
     """
@@ -368,9 +505,19 @@ class Buy(StrategyResponse):
         uid (int | NoneType, optional): unique id used to pair with 'sell' and 'hold' commands. Defaults to None, will not be paired.
     """
 
+    __slots__ = ()
+
     def __init__(self, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> None:
         super().__init__(time, price, "BUY", ticker, exchange, uid)
 
+    @classmethod
+    def fast(cls, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> "Buy":
+        """
+        Generate a Buy object without validating or normalizing its arguments, see `StrategyResponse.fast()`.
+        """
+
+        return super().fast(time, price, "BUY", ticker, exchange, uid)
+
 
 class Sell(StrategyResponse):
     """
@@ -384,5 +531,43 @@ class Sell(StrategyResponse):
         uid (int | NoneType, optional): unique id used to pair with 'sell' and 'hold' commands. Defaults to None, will not be paired.
     """
 
+    __slots__ = ()
+
     def __init__(self, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> None:
         super().__init__(time, price, "SELL", ticker, exchange, uid)
+
+    @classmethod
+    def fast(cls, time: dt.datetime | dt.time | dt.date | NoneType = None, price: float | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None, uid: int | NoneType = None) -> "Sell":
+        """
+        Generate a Sell object without validating or normalizing its arguments, see `StrategyResponse.fast()`.
+        """
+
+        return super().fast(time, price, "SELL", ticker, exchange, uid)
+
+
+class _InternedHold(Hold):
+    """
+    Read only Hold without payload, shared by every caller through `HOLD`.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, __name: str, __value) -> None:
+        raise ReadOnlyPropertyError("the interned `HOLD` response is read only.")
+
+    def __delattr__(self, __name: str) -> None:
+        raise ReadOnlyPropertyError("the interned `HOLD` response is read only.")
+
+    def __reduce__(self) -> str:
+        return "HOLD"
+
+
+# interned hold response without payload, prefer `return HOLD` over `return Hold()` on hot paths
+HOLD = object.__new__(_InternedHold)
+
+object.__setattr__(HOLD, "_time", nan)
+object.__setattr__(HOLD, "_price", nan)
+object.__setattr__(HOLD, "_command", "HOLD")
+object.__setattr__(HOLD, "_ticker", None)
+object.__setattr__(HOLD, "_exchange", None)
+object.__setattr__(HOLD, "_uid", None)
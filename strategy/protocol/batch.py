@@ -0,0 +1,401 @@
+"""
+Module that stores the columnar `ResponseBatch` container.
+"""
+
+import datetime as dt
+from types import NoneType
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from _utils.time import epoch_ns
+from _utils.validate import val_instance
+from strategy.protocol.base import StrategyResponse, Hold, Buy, Sell
+
+
+# command codes, index matches the integer codes accepted by `StrategyResponse.command`
+COMMANDS = ("HOLD", "BUY", "SELL")
+COMMAND_CODES = {_command: _code for _code, _command in enumerate(COMMANDS)}
+
+# response classes indexed by command code
+_RESPONSE_CLASSES = (Hold, Buy, Sell)
+
+# sentinel stored in integer columns for missing values, equal to the underlying value of `NaT`
+NULL_INT = np.iinfo(np.int64).min
+
+# sentinel stored in dictionary encoded columns for missing values
+NULL_CODE = -1
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _time_to_ns(_time: dt.datetime | dt.date | float) -> int:
+    """
+    Convert a `StrategyResponse.time` value to epoch nanoseconds.
+    Naive datetimes and dates are read as UTC, like `epoch_ns()`.
+
+    Args:
+        _time (dt.datetime | dt.date | float): response time, 'nan' if missing.
+
+    Raises:
+        ValueError: If `_time` is a `dt.time`, which can't be placed on the epoch.
+
+    Returns:
+        int: epoch nanoseconds, `NULL_INT` if missing.
+    """
+
+    if isinstance(_time, dt.datetime):
+        return epoch_ns(_time)
+
+    if isinstance(_time, dt.date):
+        return _time_to_ns(dt.datetime.combine(_time, dt.time()))
+
+    if isinstance(_time, dt.time):
+        raise ValueError(
+            f"`dt.time` response times can't be stored in a `ResponseBatch`, got '{_time}'.")
+
+    return NULL_INT
+
+
+def _ns_to_time(_ns: int) -> dt.datetime | NoneType:
+    """
+    Convert epoch nanoseconds to an aware UTC datetime.
+
+    Args:
+        _ns (int): epoch nanoseconds.
+
+    Returns:
+        dt.datetime | NoneType: aware UTC datetime, None if missing.
+    """
+
+    if _ns == NULL_INT:
+        return None
+
+    return _EPOCH + dt.timedelta(microseconds=_ns // 1000)
+
+
+class ResponseBatch:
+    """
+    Columnar container of StrategyResponse objects.
+
+    Responses are stored as NumPy columns: `time` (datetime64[ns]), `price` (float64), `command` (uint8, see `COMMANDS`),
+    `uid` (int64, `NULL_INT` if missing) and dictionary encoded `ticker` and `exchange` (int32 codes into
+    `tickers` and `exchanges`, `NULL_CODE` if missing).
+
+    Times are stored as instants, naive datetimes are read as UTC and converted back as aware UTC datetimes.
+    """
+
+    @property
+    def time(self) -> np.ndarray:
+        return self._time
+
+    @property
+    def price(self) -> np.ndarray:
+        return self._price
+
+    @property
+    def command(self) -> np.ndarray:
+        return self._command
+
+    @property
+    def uid(self) -> np.ndarray:
+        return self._uid
+
+    @property
+    def ticker(self) -> np.ndarray:
+        return self._ticker
+
+    @property
+    def exchange(self) -> np.ndarray:
+        return self._exchange
+
+    @property
+    def tickers(self) -> tuple[str]:
+        return self._tickers
+
+    @property
+    def exchanges(self) -> tuple[str]:
+        return self._exchanges
+
+    def __init__(self, time: np.ndarray, price: np.ndarray, command: np.ndarray, uid: np.ndarray, ticker: np.ndarray, exchange: np.ndarray, tickers: tuple[str] = (), exchanges: tuple[str] = ()) -> None:
+        """
+        Create a ResponseBatch from its columns, columns are used as is (not copied).
+        Use `ResponseBatch.from_responses()` to create a ResponseBatch from StrategyResponse objects.
+
+        Args:
+            time (np.ndarray): response times, converted to datetime64[ns].
+            price (np.ndarray): response prices, 'nan' if missing.
+            command (np.ndarray): command codes, see `COMMANDS`.
+            uid (np.ndarray): response uids, `NULL_INT` if missing.
+            ticker (np.ndarray): codes into `tickers`, `NULL_CODE` if missing.
+            exchange (np.ndarray): codes into `exchanges`, `NULL_CODE` if missing.
+            tickers (tuple[str], optional): ticker dictionary. Defaults to ().
+            exchanges (tuple[str], optional): exchange dictionary. Defaults to ().
+
+        Raises:
+            ValueError: If the columns don't have the same length.
+        """
+
+        self._time = np.asarray(time, dtype="datetime64[ns]")
+        self._price = np.asarray(price, dtype=np.float64)
+        self._command = np.asarray(command, dtype=np.uint8)
+        self._uid = np.asarray(uid, dtype=np.int64)
+        self._ticker = np.asarray(ticker, dtype=np.int32)
+        self._exchange = np.asarray(exchange, dtype=np.int32)
+        self._tickers = tuple(tickers)
+        self._exchanges = tuple(exchanges)
+
+        _len = len(self._time)
+
+        for _column in (self._price, self._command, self._uid, self._ticker, self._exchange):
+            if len(_column) != _len:
+                raise ValueError(
+                    f"expected columns of equal length, got {len(_column)} and {_len}.")
+
+    @classmethod
+    def empty(cls) -> "ResponseBatch":
+        """
+        Generate an empty ResponseBatch.
+
+        Returns:
+            ResponseBatch
+        """
+
+        return cls([], [], [], [], [], [])
+
+    @classmethod
+    def from_responses(cls, responses: Iterable[StrategyResponse]) -> "ResponseBatch":
+        """
+        Generate a ResponseBatch from StrategyResponse objects.
+
+        Args:
+            responses (Iterable[StrategyResponse]): responses, consumed once.
+
+        Returns:
+            ResponseBatch
+        """
+
+        _times, _prices, _commands, _uids, _tickers, _exchanges = [], [], [], [], [], []
+        _ticker_codes: dict = {}
+        _exchange_codes: dict = {}
+
+        for _response in responses:
+            val_instance(_response, StrategyResponse)
+
+            _times.append(_time_to_ns(_response._time))
+            _prices.append(_response._price)
+            _commands.append(COMMAND_CODES[_response._command])
+            _uids.append(NULL_INT if _response._uid is None else _response._uid)
+
+            if _response._ticker is None:
+                _tickers.append(NULL_CODE)
+            else:
+                _tickers.append(_ticker_codes.setdefault(
+                    _response._ticker, len(_ticker_codes)))
+
+            if _response._exchange is None:
+                _exchanges.append(NULL_CODE)
+            else:
+                _exchanges.append(_exchange_codes.setdefault(
+                    _response._exchange, len(_exchange_codes)))
+
+        return cls(
+            time=np.array(_times, dtype=np.int64).view("datetime64[ns]"),
+            price=np.array(_prices, dtype=np.float64),
+            command=np.array(_commands, dtype=np.uint8),
+            uid=np.array(_uids, dtype=np.int64),
+            ticker=np.array(_tickers, dtype=np.int32),
+            exchange=np.array(_exchanges, dtype=np.int32),
+            tickers=_ticker_codes,
+            exchanges=_exchange_codes
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Iterable["ResponseBatch"]) -> "ResponseBatch":
+        """
+        Concatenate ResponseBatch objects, ticker and exchange dictionaries are merged.
+
+        Args:
+            batches (Iterable[ResponseBatch]): batches to be concatenated.
+
+        Returns:
+            ResponseBatch
+        """
+
+        batches = list(batches)
+
+        for _batch in batches:
+            val_instance(_batch, ResponseBatch)
+
+        if not batches:
+            return cls.empty()
+
+        _tickers, _ticker_columns = _merge_dictionaries(
+            [(_batch._tickers, _batch._ticker) for _batch in batches])
+        _exchanges, _exchange_columns = _merge_dictionaries(
+            [(_batch._exchanges, _batch._exchange) for _batch in batches])
+
+        return cls(
+            time=np.concatenate([_batch._time for _batch in batches]),
+            price=np.concatenate([_batch._price for _batch in batches]),
+            command=np.concatenate([_batch._command for _batch in batches]),
+            uid=np.concatenate([_batch._uid for _batch in batches]),
+            ticker=np.concatenate(_ticker_columns),
+            exchange=np.concatenate(_exchange_columns),
+            tickers=_tickers,
+            exchanges=_exchanges
+        )
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    def __getitem__(self, __key: int | slice | np.ndarray) -> "StrategyResponse | ResponseBatch":
+        """
+        Index the batch.
+
+        Args:
+            __key (int | slice | np.ndarray): integer index, slice, boolean mask or index array.
+
+        Returns:
+            StrategyResponse | ResponseBatch: StrategyResponse for an integer index, ResponseBatch otherwise (slices are views).
+        """
+
+        if isinstance(__key, (int, np.integer)):
+            return self._response(int(__key))
+
+        return self.__class__(
+            time=self._time[__key],
+            price=self._price[__key],
+            command=self._command[__key],
+            uid=self._uid[__key],
+            ticker=self._ticker[__key],
+            exchange=self._exchange[__key],
+            tickers=self._tickers,
+            exchanges=self._exchanges
+        )
+
+    def __iter__(self) -> Iterator[StrategyResponse]:
+        _columns = zip(
+            self._time.view(np.int64).tolist(),
+            self._price.tolist(),
+            self._command.tolist(),
+            self._uid.tolist(),
+            self._ticker.tolist(),
+            self._exchange.tolist()
+        )
+
+        for _time, _price, _command, _uid, _ticker, _exchange in _columns:
+            yield _RESPONSE_CLASSES[_command].fast(
+                time=_ns_to_time(_time),
+                price=_price if _price == _price else None,
+                ticker=None if _ticker == NULL_CODE else self._tickers[_ticker],
+                exchange=None if _exchange == NULL_CODE else self._exchanges[_exchange],
+                uid=None if _uid == NULL_INT else _uid
+            )
+
+    def _response(self, __index: int) -> StrategyResponse:
+        # missing values are passed as None so that payload-less holds resolve to `HOLD`
+        _ticker = int(self._ticker[__index])
+        _exchange = int(self._exchange[__index])
+        _uid = int(self._uid[__index])
+        _price = float(self._price[__index])
+
+        return _RESPONSE_CLASSES[self._command[__index]].fast(
+            time=_ns_to_time(int(self._time.view(np.int64)[__index])),
+            price=_price if _price == _price else None,
+            ticker=None if _ticker == NULL_CODE else self._tickers[_ticker],
+            exchange=None if _exchange == NULL_CODE else self._exchanges[_exchange],
+            uid=None if _uid == NULL_INT else _uid
+        )
+
+    def to_responses(self) -> list[StrategyResponse]:
+        """
+        Convert the batch to a list of StrategyResponse objects.
+
+        Returns:
+            list[StrategyResponse]
+        """
+
+        return list(self)
+
+    def mask(self, command: str | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None) -> np.ndarray:
+        """
+        Generate a boolean mask of the responses matching every given criteria.
+
+        Args:
+            command (str | int | NoneType, optional): 'buy', 'sell' or 'hold' or their integer codes. Defaults to None, any command.
+            ticker (str | NoneType, optional): ticker. Defaults to None, any ticker.
+            exchange (str | NoneType, optional): exchange. Defaults to None, any exchange.
+
+        Returns:
+            np.ndarray: boolean mask.
+        """
+
+        val_instance(command, (str, int, NoneType))
+        val_instance(ticker, (str, NoneType))
+        val_instance(exchange, (str, NoneType))
+
+        _mask = np.ones(len(self), dtype=bool)
+
+        if not command is None:
+            if isinstance(command, str):
+                if not command.upper() in COMMAND_CODES:
+                    raise ValueError(
+                        f"expected 'HOLD', 'BUY', or 'SELL' for `command` got '{command}'.")
+
+                command = COMMAND_CODES[command.upper()]
+
+            _mask &= self._command == command
+
+        if not ticker is None:
+            _mask &= self._ticker == _code(self._tickers, ticker.upper())
+
+        if not exchange is None:
+            _mask &= self._exchange == _code(self._exchanges, exchange.upper())
+
+        return _mask
+
+    def filter(self, command: str | int | NoneType = None, ticker: str | NoneType = None, exchange: str | NoneType = None) -> "ResponseBatch":
+        """
+        Generate a ResponseBatch of the responses matching every given criteria, see `ResponseBatch.mask()`.
+
+        Returns:
+            ResponseBatch
+        """
+
+        return self[self.mask(command=command, ticker=ticker, exchange=exchange)]
+
+
+def _code(_dictionary: tuple[str], _value: str) -> int:
+    """
+    Get the code of a value in a dictionary, a code matching no row if the value isn't in it.
+    """
+
+    try:
+        return _dictionary.index(_value)
+    except ValueError:
+        return -2
+
+
+def _merge_dictionaries(_encoded: list[tuple[tuple[str], np.ndarray]]) -> tuple[tuple[str], list[np.ndarray]]:
+    """
+    Merge dictionary encoded columns into a single dictionary.
+
+    Args:
+        _encoded (list[tuple[tuple[str], np.ndarray]]): dictionaries and their code columns.
+
+    Returns:
+        tuple[tuple[str], list[np.ndarray]]: merged dictionary and re-coded columns.
+    """
+
+    _codes: dict = {}
+    _columns = []
+
+    for _dictionary, _column in _encoded:
+        # the last entry of the remap maps `NULL_CODE` to itself
+        _remap = np.array([_codes.setdefault(_value, len(_codes))
+                          for _value in _dictionary] + [NULL_CODE], dtype=np.int32)
+
+        _columns.append(_remap[_column])
+
+    return tuple(_codes), _columns
@@ -0,0 +1,240 @@
+"""
+Module that stores the fixed width binary record format for StrategyResponse logs.
+
+A response log is made of two files:
+
+    - the record file: a 16 byte header (`RECORD_MAGIC`, record size) followed by `RECORD_DTYPE` records.
+    - the symbol file (`<record file>.symbols`): json side table of the tickers and exchanges the record codes refer to.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from _utils.typing import PathLike
+from _utils.validate import val_instance
+from strategy.protocol.base import StrategyResponse
+from strategy.protocol.batch import ResponseBatch, _merge_dictionaries
+
+
+# magic bytes at the start of every record file
+RECORD_MAGIC = b"ODINRSP1"
+
+# record file header: magic, record size, reserved
+_HEADER = struct.Struct("<8sII")
+HEADER_SIZE = _HEADER.size
+
+# fixed width response record, padded to 40 bytes so that every 8 byte field stays aligned
+RECORD_DTYPE = np.dtype({
+    "names": ["time", "price", "uid", "ticker", "exchange", "command"],
+    "formats": ["<M8[ns]", "<f8", "<i8", "<i4", "<i4", "u1"],
+    "offsets": [0, 8, 16, 24, 28, 32],
+    "itemsize": 40
+})
+
+
+def _symbols_path(__path: PathLike) -> Path:
+    return Path(str(__path) + ".symbols")
+
+
+def _read_symbols(__path: PathLike) -> tuple[tuple[str], tuple[str]]:
+    """
+    Read the ticker and exchange side table of a record file, empty if there is none.
+    """
+
+    _path = _symbols_path(__path)
+
+    if not _path.exists():
+        return (), ()
+
+    with open(_path, "r") as f:
+        _symbols = json.load(f)
+
+    return tuple(_symbols["tickers"]), tuple(_symbols["exchanges"])
+
+
+def _write_symbols(__path: PathLike, tickers: tuple[str], exchanges: tuple[str]) -> None:
+    """
+    Atomically replace the ticker and exchange side table of a record file.
+    """
+
+    _path = _symbols_path(__path)
+    _tmp = _path.with_name(_path.name + ".tmp")
+
+    with open(_tmp, "w") as f:
+        json.dump({"tickers": list(tickers), "exchanges": list(exchanges)}, f)
+
+    os.replace(_tmp, _path)
+
+
+def _read_header(f) -> None:
+    """
+    Validate the header of an open record file.
+
+    Raises:
+        ValueError: If the header is not a valid record file header.
+    """
+
+    _header = f.read(HEADER_SIZE)
+
+    if len(_header) != HEADER_SIZE:
+        raise ValueError("expected a response record file, the header is truncated.")
+
+    _magic, _record_size, _ = _HEADER.unpack(_header)
+
+    if _magic != RECORD_MAGIC:
+        raise ValueError(
+            f"expected {RECORD_MAGIC} response record file magic, got {_magic}.")
+
+    if _record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(
+            f"expected {RECORD_DTYPE.itemsize} byte records, got {_record_size} byte records.")
+
+
+def write_responses_binary(responses: Iterable[StrategyResponse] | ResponseBatch, __path: PathLike, append: bool = False) -> int:
+    """
+    Write StrategyResponse objects to a fixed width binary record file, see `RECORD_DTYPE`.
+    Responses are encoded in a single array and written in a single sequential write.
+
+    Args:
+        responses (Iterable[StrategyResponse] | ResponseBatch): responses to be written.
+        __path (PathLike): path to the record file, the side table is stored at `<__path>.symbols`.
+        append (bool, optional): append to an existing record file instead of overwriting it. Defaults to False.
+
+    Returns:
+        int: number of responses written.
+    """
+
+    val_instance(__path, PathLike)
+    val_instance(append, bool)
+
+    if not isinstance(responses, ResponseBatch):
+        responses = ResponseBatch.from_responses(responses)
+
+    _path = Path(__path)
+    append = append and _path.exists()
+
+    if append:
+        with open(_path, "rb") as f:
+            _read_header(f)
+
+        _tickers, _exchanges = _read_symbols(_path)
+    else:
+        _tickers, _exchanges = (), ()
+
+    # existing dictionaries come first so that codes already on disk stay valid
+    _tickers, (_, _ticker) = _merge_dictionaries(
+        [(_tickers, np.empty(0, dtype=np.int32)), (responses.tickers, responses.ticker)])
+    _exchanges, (_, _exchange) = _merge_dictionaries(
+        [(_exchanges, np.empty(0, dtype=np.int32)), (responses.exchanges, responses.exchange)])
+
+    _records = np.zeros(len(responses), dtype=RECORD_DTYPE)
+    _records["time"] = responses.time
+    _records["price"] = responses.price
+    _records["uid"] = responses.uid
+    _records["ticker"] = _ticker
+    _records["exchange"] = _exchange
+    _records["command"] = responses.command
+
+    # the side table is written first, records never refer to codes missing from it
+    _write_symbols(_path, _tickers, _exchanges)
+
+    with open(_path, "ab" if append else "wb") as f:
+        if not append:
+            f.write(_HEADER.pack(RECORD_MAGIC, RECORD_DTYPE.itemsize, 0))
+
+        f.write(_records.tobytes())
+
+    return len(_records)
+
+
+class ResponseFile:
+    """
+    Memory mapped reader of a binary record file written by `write_responses_binary()`.
+    Records are exposed without copying and support random access by index.
+    """
+
+    @property
+    def records(self) -> np.ndarray:
+        return self._records
+
+    @property
+    def tickers(self) -> tuple[str]:
+        return self._tickers
+
+    @property
+    def exchanges(self) -> tuple[str]:
+        return self._exchanges
+
+    def __init__(self, __path: PathLike) -> None:
+        """
+        Open a binary record file.
+
+        Args:
+            __path (PathLike): path to the record file.
+
+        Raises:
+            ValueError: If the file is not a valid record file.
+        """
+
+        val_instance(__path, PathLike)
+
+        self._path = Path(__path)
+
+        with open(self._path, "rb") as f:
+            _read_header(f)
+
+        _size = self._path.stat().st_size - HEADER_SIZE
+
+        # trailing bytes of a partially written record are ignored
+        _count = _size // RECORD_DTYPE.itemsize
+
+        if _count:
+            self._records = np.memmap(
+                self._path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(_count,))
+        else:
+            self._records = np.empty(0, dtype=RECORD_DTYPE)
+
+        self._tickers, self._exchanges = _read_symbols(self._path)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, __key: int | slice | np.ndarray) -> "StrategyResponse | ResponseBatch":
+        """
+        Index the records.
+
+        Args:
+            __key (int | slice | np.ndarray): integer index, slice, boolean mask or index array.
+
+        Returns:
+            StrategyResponse | ResponseBatch: StrategyResponse for an integer index, ResponseBatch otherwise (slices are views of the file).
+        """
+
+        return self.to_batch()[__key]
+
+    def __iter__(self) -> Iterator[StrategyResponse]:
+        return iter(self.to_batch())
+
+    def to_batch(self) -> ResponseBatch:
+        """
+        Generate a ResponseBatch whose columns are views of the memory mapped records.
+
+        Returns:
+            ResponseBatch
+        """
+
+        return ResponseBatch(
+            time=self._records["time"],
+            price=self._records["price"],
+            command=self._records["command"],
+            uid=self._records["uid"],
+            ticker=self._records["ticker"],
+            exchange=self._records["exchange"],
+            tickers=self._tickers,
+            exchanges=self._exchanges
+        )
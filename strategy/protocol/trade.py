@@ -1,5 +1,388 @@
+"""
+Module that stores the position book pairing BUY responses with later SELL responses.
+
+A trade is one unit bought by a BUY response and sold by a later SELL response, paired by uid if the SELL has one
+and first in first out per ticker (among BUY responses without uid) otherwise. HOLD responses with a uid keep the trade
+open and, like every response with a price, mark the price of their ticker.
+
+BUY and SELL responses without a price are valued at the marked price of their ticker, they are ignored (no trade is
+opened or closed) while the ticker has no marked price, so missing prices never reach the cost or PnL sums.
+"""
+
+import datetime as dt
+from collections import deque
+from types import NoneType
+from typing import Iterable
+
+import numpy as np
+
+from _utils.validate import val_instance
+from strategy.protocol.base import StrategyResponse
+from strategy.protocol.batch import COMMAND_CODES, NULL_CODE, NULL_INT, ResponseBatch, _ns_to_time, _time_to_ns
+
+
+# closed trade record
+TRADE_DTYPE = np.dtype([
+    ("uid", "<i8"),
+    ("ticker", "<i4"),
+    ("entry_time", "<M8[ns]"),
+    ("entry_price", "<f8"),
+    ("exit_time", "<M8[ns]"),
+    ("exit_price", "<f8"),
+    ("pnl", "<f8")
+])
+
+# TRADE_DTYPE with integer times, closed trades are buffered as tuples and converted in bulk through it
+_TRADE_INT_DTYPE = np.dtype([(_name, "<i8" if _format == np.dtype("<M8[ns]") else _format)
+                             for _name, (_format, _) in TRADE_DTYPE.fields.items()])
+
+_BUY = COMMAND_CODES["BUY"]
+_SELL = COMMAND_CODES["SELL"]
+
+
 class Trade:
-    pass
+    """
+    Trade of one unit, open until its exit is set.
+    """
+
+    __slots__ = ("_uid", "_ticker", "_entry_ns", "_entry_price", "_exit_ns", "_exit_price")
+
+    @property
+    def uid(self) -> int | NoneType:
+        return self._uid
+
+    @property
+    def ticker(self) -> str | NoneType:
+        return self._ticker
+
+    @property
+    def entry_time(self) -> dt.datetime | NoneType:
+        return _ns_to_time(self._entry_ns)
+
+    @property
+    def entry_price(self) -> float:
+        return self._entry_price
+
+    @property
+    def exit_time(self) -> dt.datetime | NoneType:
+        return _ns_to_time(self._exit_ns)
+
+    @property
+    def exit_price(self) -> float:
+        return self._exit_price
+
+    @property
+    def is_open(self) -> bool:
+        return self._exit_price != self._exit_price
+
+    @property
+    def pnl(self) -> float:
+        """
+        Realized PnL, 'nan' while the trade is open.
+        """
+
+        return self._exit_price - self._entry_price
+
+    def __init__(self, uid: int | NoneType, ticker: str | NoneType, entry_ns: int, entry_price: float) -> None:
+        """
+        Open a Trade.
+
+        Args:
+            uid (int | NoneType): uid of the BUY response.
+            ticker (str | NoneType): ticker of the BUY response.
+            entry_ns (int): entry time in epoch nanoseconds, `NULL_INT` if missing.
+            entry_price (float): entry price.
+        """
+
+        self._uid = uid
+        self._ticker = ticker
+        self._entry_ns = entry_ns
+        self._entry_price = entry_price
+        self._exit_ns = NULL_INT
+        self._exit_price = float("nan")
+
+    def __repr__(self) -> str:
+        _uid = "" if self._uid is None else f"[{self._uid}]"
+        _exit = "open" if self.is_open else f"{self._exit_price}"
+
+        return f"Trade{_uid}({self._ticker}: {self._entry_price} -> {_exit})"
+
+    def unrealized(self, price: float) -> float:
+        """
+        PnL of the trade if it was closed at `price`.
+        """
+
+        return price - self._entry_price
+
+
+class _TickerBook:
+    """
+    Open trades and PnL of a ticker.
+    """
+
+    __slots__ = ("code", "open", "fifo", "cost", "mark", "realized")
+
+    def __init__(self, code: int) -> None:
+        self.code = code
+        # open trades in entry order, used as an ordered set
+        self.open: dict = {}
+        # open trades without uid, closed first in first out
+        self.fifo = deque()
+        self.cost = 0.0
+        self.mark = float("nan")
+        self.realized = 0.0
+
 
 class Trades:
-    pass
\ No newline at end of file
+    """
+    Indexed position book: open trades are indexed by uid and by ticker, PnL is updated incrementally
+    and closed trades are stored as `TRADE_DTYPE` columns. Every update is O(1).
+    """
+
+    @property
+    def tickers(self) -> tuple[str]:
+        return tuple(self._tickers)
+
+    @property
+    def closed(self) -> np.ndarray:
+        """
+        Closed trades (`TRADE_DTYPE`) in exit order, ticker codes refer to `tickers`.
+        """
+
+        if self._pending:
+            self._closed = np.concatenate((self._closed, np.array(self._pending, dtype=_TRADE_INT_DTYPE).view(TRADE_DTYPE)))
+            self._pending = []
+
+        return self._closed
+
+    @property
+    def open_count(self) -> int:
+        return self._open_count
+
+    def __init__(self, tickers: Iterable[str] = ()) -> None:
+        """
+        Create an empty Trades book.
+
+        Args:
+            tickers (Iterable[str], optional): initial ticker dictionary, e.g. `ResponseBatch.tickers` to keep its codes. Defaults to ().
+        """
+
+        self._tickers: list[str] = []
+        self._books: dict = {None: _TickerBook(NULL_CODE)}
+
+        for ticker in tickers:
+            self._book(ticker)
+
+        self._by_uid: dict = {}
+        self._open_count = 0
+        self._closed = np.empty(0, dtype=TRADE_DTYPE)
+        # closed trades not yet converted to `TRADE_DTYPE` records
+        self._pending: list[tuple] = []
+
+    def _book(self, ticker: str | NoneType) -> _TickerBook:
+        try:
+            return self._books[ticker]
+        except KeyError:
+            val_instance(ticker, str)
+
+            book = self._books[ticker] = _TickerBook(len(self._tickers))
+            self._tickers.append(ticker)
+
+            return book
+
+    def get(self, uid: int) -> Trade | NoneType:
+        """
+        Open trade of a uid.
+
+        Args:
+            uid (int): uid of the BUY response.
+
+        Returns:
+            Trade | NoneType: open trade, None if there is none.
+        """
+
+        return self._by_uid.get(uid)
+
+    def open_trades(self, ticker: str | NoneType = None) -> list[Trade]:
+        """
+        Open trades in entry order.
+
+        Args:
+            ticker (str | NoneType, optional): ticker. Defaults to None, every ticker.
+
+        Returns:
+            list[Trade]
+        """
+
+        if ticker is None:
+            return [trade for book in self._books.values() for trade in book.open]
+
+        book = self._books.get(ticker)
+
+        return [] if book is None else list(book.open)
+
+    def mark(self, ticker: str | NoneType, price: float) -> None:
+        """
+        Set the price open trades of a ticker are valued at.
+
+        Args:
+            ticker (str | NoneType): ticker.
+            price (float): price.
+        """
+
+        self._book(ticker).mark = price
+
+    def realized(self, ticker: str | NoneType = None) -> float:
+        """
+        Realized PnL of the closed trades.
+
+        Args:
+            ticker (str | NoneType, optional): ticker. Defaults to None, every ticker.
+
+        Returns:
+            float
+        """
+
+        if ticker is None:
+            return sum(book.realized for book in self._books.values())
+
+        book = self._books.get(ticker)
+
+        return 0.0 if book is None else book.realized
+
+    def unrealized(self, ticker: str | NoneType = None) -> float:
+        """
+        Unrealized PnL of the open trades at the marked prices.
+
+        Args:
+            ticker (str | NoneType, optional): ticker. Defaults to None, every ticker.
+
+        Returns:
+            float: 'nan' if a ticker with open trades has no marked price.
+        """
+
+        if ticker is None:
+            return sum(len(book.open) * book.mark - book.cost for book in self._books.values() if book.open)
+
+        book = self._books.get(ticker)
+
+        return 0.0 if book is None or not book.open else len(book.open) * book.mark - book.cost
+
+    def update(self, response: StrategyResponse) -> Trade | NoneType:
+        """
+        Apply a response to the book.
+
+        Args:
+            response (StrategyResponse): response.
+
+        Raises:
+            ValueError: If a BUY response has the uid of an open trade.
+
+        Returns:
+            Trade | NoneType: trade opened or closed by the response, None otherwise.
+        """
+
+        return self._apply(
+            COMMAND_CODES[response._command],
+            _time_to_ns(response._time),
+            response._price,
+            response._uid,
+            response._ticker
+        )
+
+    def update_batch(self, batch: ResponseBatch) -> None:
+        """
+        Apply the responses of a ResponseBatch to the book, in order.
+
+        Args:
+            batch (ResponseBatch): responses.
+
+        Raises:
+            ValueError: If a BUY response has the uid of an open trade.
+        """
+
+        val_instance(batch, ResponseBatch)
+
+        _tickers = batch.tickers
+        _apply = self._apply
+
+        for command, time, price, uid, ticker in zip(
+            batch.command.tolist(),
+            batch.time.view(np.int64).tolist(),
+            batch.price.tolist(),
+            batch.uid.tolist(),
+            batch.ticker.tolist()
+        ):
+            _apply(command, time, price, None if uid == NULL_INT else uid, None if ticker == NULL_CODE else _tickers[ticker])
+
+    def _apply(self, command: int, time: int, price: float, uid: int | NoneType, ticker: str | NoneType) -> Trade | NoneType:
+        book = self._books.get(ticker) or self._book(ticker)
+
+        if price == price:
+            book.mark = price
+
+        if command == _BUY:
+            if price != price:
+                price = book.mark
+
+                if price != price:
+                    return None
+
+            trade = Trade(uid, ticker, time, price)
+
+            if uid is None:
+                book.fifo.append(trade)
+            elif uid in self._by_uid:
+                raise ValueError(f"expected a new uid for a 'BUY' response, trade {uid} is already open.")
+            else:
+                self._by_uid[uid] = trade
+
+            book.open[trade] = None
+            book.cost += price
+            self._open_count += 1
+
+            return trade
+
+        if command == _SELL:
+            if uid is None:
+                trade = book.fifo[0] if book.fifo else None
+            else:
+                trade = self._by_uid.get(uid)
+
+            if trade is None:
+                return None
+
+            # a SELL with uid closes its trade even if its ticker differs
+            entry_book = book if trade._ticker == ticker else self._books[trade._ticker]
+
+            if price != price:
+                price = entry_book.mark
+
+                if price != price:
+                    return None
+
+            if uid is None:
+                book.fifo.popleft()
+            else:
+                del self._by_uid[uid]
+
+            trade._exit_ns = time
+            trade._exit_price = price
+
+            del entry_book.open[trade]
+            entry_book.cost -= trade._entry_price
+            entry_book.realized += price - trade._entry_price
+            self._open_count -= 1
+            self._pending.append((
+                NULL_INT if trade._uid is None else trade._uid,
+                entry_book.code,
+                trade._entry_ns,
+                trade._entry_price,
+                time,
+                price,
+                price - trade._entry_price
+            ))
+
+            return trade
+
+        return None
@@ -0,0 +1,134 @@
+"""
+Module that stores the VectorStrategy base, strategies whose signals are generated over whole arrays of ticks.
+"""
+
+import datetime as dt
+from collections import deque
+
+import numpy as np
+
+from _utils.errors import RequiredOverwrite
+from _utils.time import epoch_ns
+from strategy.base import Strategy
+from strategy.protocol.base import StrategyResponse, Hold, Buy, Sell
+from strategy.protocol.batch import ResponseBatch, NULL_INT, NULL_CODE
+
+
+# response classes indexed by command code
+_RESPONSE_CLASSES = (Hold, Buy, Sell)
+
+
+class VectorStrategy(Strategy):
+    """
+    Strategy whose signals are generated over arrays of ticks by `generate(times, prices)`, returning a command code
+    (0: 'HOLD', 1: 'BUY', 2: 'SELL') per tick.
+
+    The command of a tick may only depend on that tick and the `lookback` ticks before it, so that drivers can evaluate
+    `generate()` over arbitrary chunks. Backtests evaluate `feed_mask()` and `generate()` over whole chunks,
+    live bots call `next()` which evaluates `generate()` over the last `lookback + 1` fed ticks.
+    """
+
+    # number of preceding ticks `generate()` needs to compute the command of a tick
+    lookback: int = 0
+
+    def generate(self, times: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """
+        Generate the command code of every tick.
+
+        Args:
+            times (np.ndarray): tick times, datetime64[ns] (UTC).
+            prices (np.ndarray): tick prices, float64.
+
+        Returns:
+            np.ndarray: command codes (uint8) of the same length as `times`.
+        """
+
+        raise RequiredOverwrite(f"`generate()` requires overwrite.")
+
+    def feed_mask(self, times: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """
+        Batch form of `__feed__()`, whether each tick is fed to the strategy.
+        Defaults to the mask of `feed_filter`, or every tick if there is none.
+
+        Args:
+            times (np.ndarray): tick times, datetime64[ns] (UTC).
+            prices (np.ndarray): tick prices, float64.
+
+        Returns:
+            np.ndarray: boolean mask of the same length as `times`.
+        """
+
+        if self.feed_filter is None:
+            return np.ones(len(times), dtype=bool)
+
+        return self.feed_filter.mask(times)
+
+    def next(self, time: dt.datetime, price: float) -> StrategyResponse:
+        """
+        Per tick fallback for live trading, evaluates `generate()` over the last `lookback + 1` ticks.
+
+        Args:
+            time (dt.datetime): time of the datapoint, naive datetimes are read as UTC.
+            price (float): price of the datapoint.
+
+        Returns:
+            StrategyResponse: response of the tick.
+        """
+
+        # the window is created lazily so that subclasses don't need to call `super().__init__()`
+        if getattr(self, "_times", None) is None:
+            self._times: deque = deque(maxlen=self.lookback + 1)
+            self._prices: deque = deque(maxlen=self.lookback + 1)
+
+        self._times.append(epoch_ns(time))
+        self._prices.append(price)
+
+        _commands = self.generate(
+            np.array(self._times, dtype=np.int64).view("datetime64[ns]"),
+            np.array(self._prices, dtype=np.float64)
+        )
+
+        return _RESPONSE_CLASSES[int(_commands[-1])].fast(time, price)
+
+    def next_many(self, times: np.ndarray, prices: np.ndarray, symbols: np.ndarray | None = None) -> ResponseBatch:
+        """
+        Batch form of `next()`, evaluates `feed_mask()` over the chunk and `generate()` over the fed ticks preceded by
+        the last `lookback` fed ticks, which are kept across chunks.
+
+        Args:
+            times (np.ndarray): tick times, datetime64[ns] (UTC).
+            prices (np.ndarray): tick prices, float64.
+            symbols (np.ndarray | None, optional): ignored, a VectorStrategy follows a single symbol. Defaults to None.
+
+        Returns:
+            ResponseBatch: responses of the fed ticks, 'HOLD' included.
+        """
+
+        if getattr(self, "_times", None) is None:
+            self._times: deque = deque(maxlen=self.lookback + 1)
+            self._prices: deque = deque(maxlen=self.lookback + 1)
+
+        times = np.asarray(times).astype("datetime64[ns]")
+        prices = np.asarray(prices, dtype=np.float64)
+
+        _indices = np.flatnonzero(self.feed_mask(times, prices))
+        times, prices = times[_indices], prices[_indices]
+
+        # the window keeps `lookback + 1` ticks for `next()`, only the last `lookback` precede the chunk
+        _warmup = min(len(self._times), self.lookback)
+        _times = np.concatenate((np.array(self._times, dtype=np.int64)[len(self._times) - _warmup:].view("datetime64[ns]"), times))
+        _prices = np.concatenate((np.array(self._prices, dtype=np.float64)[len(self._prices) - _warmup:], prices))
+
+        commands = np.asarray(self.generate(_times, _prices), dtype=np.uint8)[_warmup:]
+
+        self._times.extend(times[-self.lookback - 1:].view(np.int64).tolist())
+        self._prices.extend(prices[-self.lookback - 1:].tolist())
+
+        return ResponseBatch(
+            time=times,
+            price=prices,
+            command=commands,
+            uid=np.full(len(times), NULL_INT, dtype=np.int64),
+            ticker=np.full(len(times), NULL_CODE, dtype=np.int32),
+            exchange=np.full(len(times), NULL_CODE, dtype=np.int32)
+        )
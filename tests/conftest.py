@@ -0,0 +1,95 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from backtest import TickData, write_ticks
+from bot import Bot, DataStream
+
+
+class ListStream(DataStream):
+    """
+    DataStream over a list of datapoints, without `seek()`.
+    """
+
+    def __init__(self, data: list, keyed: bool = False) -> None:
+        super().__init__()
+
+        self._data = iter(data)
+        self.keyed = keyed
+
+    def request(self):
+        return next(self._data)
+
+
+class CrashingStream(DataStream):
+    """
+    DataStream raising RuntimeError after `n` datapoints, a crash of the process running the bot.
+    """
+
+    def __init__(self, stream: DataStream, n: int) -> None:
+        super().__init__()
+
+        self._stream = stream
+        self._n = n
+        self.keyed = stream.keyed
+
+    def request(self):
+        if self._n == 0:
+            raise RuntimeError("crash")
+
+        self._n -= 1
+
+        return self._stream.request()
+
+
+class RecordingBot(Bot):
+    """
+    Bot recording the `summary()` of every response.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.responses = []
+
+    def handle(self, strategy_response) -> None:
+        if not strategy_response is None:
+            self.responses.append(summary(strategy_response))
+
+
+def summary(strategy_response) -> tuple | None:
+    """
+    `(command, price)` of a response, prices as strings so that nan prices compare equal.
+    """
+
+    return None if strategy_response is None else (strategy_response.command, str(strategy_response.price))
+
+
+def make_ticks(n: int = 2000, seed: int = 0) -> TickData:
+    """
+    Random walk ticks one second apart from 8:50 UTC, every tenth time repeated.
+    """
+
+    _rng = np.random.default_rng(seed)
+    _seconds = np.arange(n) - np.arange(n) // 10
+    _times = np.datetime64("2024-01-02T08:50") + _seconds * np.timedelta64(1, "s")
+
+    return TickData(_times, 100 + np.cumsum(_rng.normal(0, 0.05, n)))
+
+
+@pytest.fixture
+def ticks() -> TickData:
+    return make_ticks()
+
+
+@pytest.fixture
+def tick_path(tmp_path, ticks):
+    _path = tmp_path / "ticks.bin"
+    write_ticks(ticks, _path)
+
+    return _path
+
+
+def datapoints(data: TickData) -> list[tuple[dt.datetime, float]]:
+    return list(zip(data.time.astype("datetime64[us]").tolist(), data.price.tolist()))
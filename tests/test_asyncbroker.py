@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from brokers import Bot, MockBroker
+from brokers.asyncbroker import AsyncBroker, BrokerConnection
+from brokers.base import BrokerError
+from brokers.order import Order
+from strategy import Buy, Sell
+
+
+class _Connection(BrokerConnection):
+    """
+    Connection accepting every order, returning `results` results per batch if given.
+    """
+
+    def __init__(self, on_fill, results: int | None = None, block: asyncio.Event | None = None) -> None:
+        super().__init__(on_fill)
+
+        self._results = results
+        self._block = block
+
+    async def send(self, orders):
+        if not self._block is None:
+            await self._block.wait()
+
+        return [None] * (len(orders) if self._results is None else self._results)
+
+
+def _broker(**kwargs) -> AsyncBroker:
+    async def connect(on_fill):
+        return _Connection(on_fill, **kwargs)
+
+    return AsyncBroker(connect, batch_size=4, linger=0.01)
+
+
+def test_accepted():
+    async def main():
+        async with _broker() as broker:
+            return await asyncio.gather(*(broker.submit(Order(_uid, "BUY")) for _uid in range(10)))
+
+    assert [_order.uid for _order in asyncio.run(main())] == list(range(10))
+
+
+def test_missing_results_are_rejected():
+    async def main():
+        async with _broker(results=2) as broker:
+            return await asyncio.gather(*(broker.submit(Order(_uid, "BUY")) for _uid in range(4)), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert [_result.uid for _result in results[:2]] == [0, 1]
+    assert all(isinstance(_result, BrokerError) for _result in results[2:])
+
+
+def test_cancellation_propagates():
+    async def main():
+        broker = _broker(block=asyncio.Event())
+        await broker.start()
+
+        ack = broker.submit(Order(1, "BUY"))
+
+        # the batch is waiting for the broker
+        while not broker._tasks:
+            await asyncio.sleep(0.001)
+
+        await asyncio.sleep(0.01)
+
+        (task,) = broker._tasks
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert ack.cancelled()
+        assert broker.in_flight == {}
+
+    asyncio.run(main())
+
+
+def test_buy_and_sell_with_the_same_uid():
+    fills = []
+
+    async def main():
+        async with MockBroker(Bot(fills.append), batch_size=1) as broker:
+            broker.mark("A", 100.0)
+
+            buy = await broker.submit(Buy(ticker="A", uid=5))
+            sell = await broker.submit(Sell(ticker="A", uid=5))
+
+            # the fills are reported after the acknowledgments
+            while len(fills) < 2:
+                await asyncio.sleep(0.001)
+
+            assert broker.in_flight == {}
+
+            return buy, sell
+
+    buy, sell = asyncio.run(main())
+
+    assert (buy.key, sell.key) == ((5, "BUY"), (5, "SELL"))
+    assert [(_fill.uid, _fill.side) for _fill in fills] == [(5, "BUY"), (5, "SELL")]
+
+
+def test_same_uid_and_side_in_flight():
+    async def main():
+        async with _broker() as broker:
+            ack = broker.submit(Order(1, "BUY"))
+
+            with pytest.raises(BrokerError):
+                broker.submit(Order(1, "BUY"))
+
+            await ack
+
+    asyncio.run(main())
@@ -0,0 +1,31 @@
+import datetime as dt
+
+from _utils.time import epoch_ns
+from strategy import Buy, Sell
+from strategy.protocol.batch import ResponseBatch, _ns_to_time, _time_to_ns
+
+
+def test_naive_times_are_utc():
+    _naive = dt.datetime(2024, 1, 2, 9, 30, 0, 123_456)
+    _aware = _naive.replace(tzinfo=dt.timezone.utc)
+
+    assert _time_to_ns(_naive) == _time_to_ns(_aware) == epoch_ns(_naive)
+    assert _time_to_ns(dt.date(2024, 1, 2)) == epoch_ns(dt.datetime(2024, 1, 2))
+    assert _ns_to_time(_time_to_ns(_naive)) == _aware
+
+
+def test_aware_times():
+    _time = dt.datetime(2024, 1, 2, 9, 30, tzinfo=dt.timezone(dt.timedelta(hours=-5)))
+
+    assert _ns_to_time(_time_to_ns(_time)) == _time
+
+
+def test_round_trip():
+    _responses = [Buy(dt.datetime(2024, 1, 2, 9, 30), 101.5, "AAPL"), Sell(None, 102.0, "AAPL", "NASDAQ", 7)]
+    _batch = ResponseBatch.from_responses(_responses)
+    _responses[0].time = _responses[0].time.replace(tzinfo=dt.timezone.utc)
+
+    assert _batch.time.view("int64")[0] == epoch_ns(dt.datetime(2024, 1, 2, 9, 30))
+    assert [(_r.command, str(_r.time), _r.price, _r.ticker, _r.exchange, _r.uid) for _r in _batch] == [
+        (_r.command, str(_r.time), _r.price, _r.ticker, _r.exchange, _r.uid) for _r in _responses
+    ]
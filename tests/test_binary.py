@@ -0,0 +1,81 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from strategy import Buy, Hold, ResponseFile, Sell, write_responses_binary
+from strategy.protocol.binary import HEADER_SIZE, RECORD_DTYPE
+
+
+_UTC = dt.timezone.utc
+_TIME = dt.datetime(2024, 1, 2, 9, 30, tzinfo=_UTC)
+_FIRST = [Buy(_TIME, 101.5, "AAPL", "NASDAQ", 1), Sell(_TIME + dt.timedelta(seconds=1), 102.0, "AAPL", "NASDAQ", 1)]
+_SECOND = [Buy(_TIME + dt.timedelta(seconds=2), 55.25, "MSFT", "NYSE", 2), Hold(_TIME + dt.timedelta(seconds=3), 55.0, "AAPL", uid=3)]
+
+
+def _fields(response) -> tuple:
+    return response.command, response.time, str(response.price), response.ticker, response.exchange, response.uid
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "responses.bin"
+
+    assert write_responses_binary(_FIRST + _SECOND, path) == 4
+    assert path.stat().st_size == HEADER_SIZE + 4 * RECORD_DTYPE.itemsize
+
+    responses = ResponseFile(path)
+
+    assert [_fields(_r) for _r in responses] == [_fields(_r) for _r in _FIRST + _SECOND]
+    assert _fields(responses[2]) == _fields(_SECOND[0])
+
+
+def test_append_keeps_symbol_codes(tmp_path):
+    path = tmp_path / "responses.bin"
+
+    write_responses_binary(_FIRST, path)
+    tickers = ResponseFile(path).tickers
+    write_responses_binary(_SECOND, path, append=True)
+    responses = ResponseFile(path)
+
+    assert len(responses) == 4
+    assert responses.tickers[:len(tickers)] == tickers
+    assert [_fields(_r) for _r in responses] == [_fields(_r) for _r in _FIRST + _SECOND]
+
+
+def test_append_creates_the_file(tmp_path):
+    path = tmp_path / "responses.bin"
+
+    write_responses_binary(_FIRST, path, append=True)
+
+    assert [_fields(_r) for _r in ResponseFile(path)] == [_fields(_r) for _r in _FIRST]
+
+
+def test_slices_are_views_of_the_file(tmp_path):
+    path = tmp_path / "responses.bin"
+    write_responses_binary(_FIRST + _SECOND, path)
+    responses = ResponseFile(path)
+
+    assert isinstance(responses.records, np.memmap)
+    assert np.shares_memory(responses[1:3].price, responses.records)
+    assert [_fields(_r) for _r in responses[1:3]] == [_fields(_r) for _r in (_FIRST + _SECOND)[1:3]]
+
+
+def test_partial_record_is_ignored(tmp_path):
+    path = tmp_path / "responses.bin"
+    write_responses_binary(_FIRST, path)
+
+    with open(path, "ab") as f:
+        f.write(b"\0" * (RECORD_DTYPE.itemsize // 2))
+
+    assert len(ResponseFile(path)) == 2
+
+
+def test_invalid_header(tmp_path):
+    path = tmp_path / "responses.bin"
+    path.write_bytes(b"not a record file")
+
+    with pytest.raises(ValueError):
+        ResponseFile(path)
+
+    with pytest.raises(ValueError):
+        write_responses_binary(_FIRST, path, append=True)
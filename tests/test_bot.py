@@ -0,0 +1,67 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from backtest import ReplayStream
+from bot import Bot, BotMetrics, Checkpoint, Journal, iter_journal
+from sample import SampleStrategy
+from tests.conftest import ListStream, RecordingBot, datapoints
+
+
+def _strategy_responses(ticks) -> list:
+    strategy = SampleStrategy(5, 5)
+    responses = [strategy.next(*_args) for _args in datapoints(ticks) if strategy.__feed__(*_args)]
+
+    return [(_r.command, str(_r.price)) for _r in responses if not _r is None]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 64])
+@pytest.mark.parametrize("metrics", [False, True])
+@pytest.mark.parametrize("checkpoint", [False, True])
+def test_run_ends_at_end_of_stream(ticks, tick_path, tmp_path, chunk_size, metrics, checkpoint):
+    bot = RecordingBot(SampleStrategy(5, 5), ReplayStream(tick_path), chunk_size=chunk_size,
+                       metrics=BotMetrics() if metrics else None,
+                       checkpoint=Checkpoint(tmp_path / "bot.ckpt") if checkpoint else None)
+
+    assert bot.run() is None
+    assert bot.responses == _strategy_responses(ticks)
+
+    if metrics:
+        assert bot.metrics.fed + bot.metrics.filtered == len(ticks)
+
+    # the data stream and `handle()` are restored
+    assert type(bot.data_stream) is ReplayStream
+    assert not "handle" in vars(bot)
+
+
+def test_run_of_empty_stream():
+    RecordingBot(SampleStrategy(), ListStream([])).run()
+
+
+def test_run_with_journal(ticks, tmp_path):
+    with Journal(tmp_path) as journal:
+        bot = RecordingBot(SampleStrategy(5, 5), ListStream(datapoints(ticks)), journal=journal)
+        bot.run()
+
+    assert [_record.command for _, _record in iter_journal(tmp_path)] == \
+        [_command for _command, _ in bot.responses if _command != "HOLD"]
+
+
+def test_errors_propagate():
+    class _FailingBot(Bot):
+        def handle(self, strategy_response) -> None:
+            raise RuntimeError("handle")
+
+    data = [(dt.datetime(2024, 1, 2, 9, 0, _second), 1.0) for _second in range(10)]
+
+    with pytest.raises(RuntimeError):
+        _FailingBot(SampleStrategy(1, 1), ListStream(data)).run()
+
+
+def test_replay_chunks_are_views_of_the_file(ticks, tick_path):
+    stream = ReplayStream(tick_path)
+    chunk = stream.request_many(100)
+
+    assert np.shares_memory(chunk.times, stream.file.records) and np.shares_memory(chunk.prices, stream.file.records)
+    assert chunk.times.tolist() == ticks.time[:100].astype("datetime64[ns]").tolist()
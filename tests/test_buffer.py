@@ -0,0 +1,72 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from strategy import Strategy, TickBuffer, TickHistory
+
+
+_UTC = dt.timezone.utc
+_TIMES = np.datetime64("2024-01-02T09:00") + np.arange(10) * np.timedelta64(1, "s")
+_PRICES = 100.0 + np.arange(10)
+
+
+def test_last_ticks():
+    buffer = TickBuffer(4, volume=True)
+
+    for _time, _price in zip(_TIMES.astype("datetime64[us]").tolist(), _PRICES):
+        buffer.append(_time, _price, 2.0)
+
+    assert buffer.full and len(buffer) == 4
+    assert buffer.times().tolist() == _TIMES[-4:].astype("datetime64[ns]").tolist()
+    assert buffer.prices(2).tolist() == _PRICES[-2:].tolist()
+    assert buffer.volumes(10).tolist() == [2.0] * 4
+
+    with pytest.raises(ValueError):
+        buffer.prices()[0] = 0.0
+
+
+@pytest.mark.parametrize("convert", [
+    lambda _ns: _ns,
+    lambda _ns: np.int64(_ns),
+    lambda _ns: dt.datetime.fromtimestamp(_ns / 1e9, _UTC),
+    lambda _ns: dt.datetime.fromtimestamp(_ns / 1e9, _UTC).replace(tzinfo=None)
+])
+def test_append_times(convert):
+    buffer = TickBuffer(3)
+
+    for _ns, _price in zip(_TIMES.astype("datetime64[ns]").view(np.int64).tolist(), _PRICES):
+        buffer.append(convert(_ns), _price)
+
+    assert buffer.times().tolist() == _TIMES[-3:].astype("datetime64[ns]").tolist()
+
+
+def test_extend_matches_append():
+    appended = TickBuffer(4)
+    extended = TickBuffer(4)
+
+    for _time, _price in zip(_TIMES.astype("datetime64[ns]").view(np.int64), _PRICES):
+        appended.append(_time, _price)
+
+    extended.append(_TIMES[0].astype("datetime64[ns]").view(np.int64), _PRICES[0])
+    extended.extend(_TIMES[1:], _PRICES[1:])
+
+    assert extended.times().tolist() == appended.times().tolist()
+    assert extended.prices().tolist() == appended.prices().tolist()
+
+    with pytest.raises(ValueError):
+        extended.volumes()
+
+
+def test_tick_history_per_instance():
+    class HistoryStrategy(Strategy):
+        history = TickHistory(5)
+
+        def next(self, datapoint):
+            return None
+
+    first, second = HistoryStrategy(), HistoryStrategy()
+    first.history.append(0, 1.0)
+
+    assert isinstance(HistoryStrategy.history, TickHistory)
+    assert len(first.history) == 1 and len(second.history) == 0
@@ -0,0 +1,119 @@
+import os
+
+import pytest
+
+from backtest import ReplayStream
+from bot import Checkpoint, CheckpointStream
+from sample import SampleStrategy
+from tests.conftest import CrashingStream, ListStream, RecordingBot, datapoints
+
+
+def _run(stream, checkpoint=None, strategy=None, chunk_size=None) -> RecordingBot:
+    bot = RecordingBot(strategy or SampleStrategy(5, 5), stream, chunk_size=chunk_size, checkpoint=checkpoint)
+    bot.run()
+
+    return bot
+
+
+def test_run_ends_at_end_of_stream(tick_path, tmp_path):
+    checkpoint = Checkpoint(tmp_path / "bot.ckpt", every=100)
+
+    assert _run(ReplayStream(tick_path), checkpoint).responses == _run(ReplayStream(tick_path)).responses
+    # the final checkpoint reflects every tick
+    assert checkpoint.load()[3] == len(ReplayStream(tick_path))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 64])
+@pytest.mark.parametrize("every", [1, 37])
+def test_restart_equivalence(tick_path, tmp_path, every, chunk_size):
+    full = _run(ReplayStream(tick_path)).responses
+
+    checkpoint = Checkpoint(tmp_path / "bot.ckpt", every=every)
+
+    crashed = RecordingBot(SampleStrategy(5, 5), CrashingStream(ReplayStream(tick_path), 1000), checkpoint=checkpoint)
+
+    with pytest.raises(RuntimeError):
+        crashed.run()
+
+    restarted = _run(ReplayStream(tick_path), Checkpoint(tmp_path / "bot.ckpt", every=every), chunk_size=chunk_size).responses
+
+    # the restarted bot returns the responses of the ticks after the last checkpoint, those of the ticks evaluated
+    # between the last checkpoint and the crash are returned again
+    assert restarted == full[len(full) - len(restarted):]
+    assert len(crashed.responses) + len(restarted) - len(full) < every
+
+    if every == 1:
+        assert crashed.responses + restarted == full
+
+
+def test_restart_without_seek(ticks, tmp_path):
+    full = _run(ListStream(datapoints(ticks))).responses
+
+    with pytest.raises(RuntimeError):
+        _run(CrashingStream(ListStream(datapoints(ticks)), 1234), Checkpoint(tmp_path / "bot.ckpt", every=1))
+
+    restarted = _run(ListStream(datapoints(ticks)), Checkpoint(tmp_path / "bot.ckpt", every=1)).responses
+
+    assert restarted == full[len(full) - len(restarted):]
+
+
+def test_torn_tail(tmp_path):
+    path = tmp_path / "bot.ckpt"
+    strategy = SampleStrategy(5, 5)
+    checkpoint = Checkpoint(path, every=1)
+
+    for _tick in range(1, 4):
+        strategy._hold_after_buy_counter = _tick
+        checkpoint.save(strategy, _tick, 1, _tick)
+
+    checkpoint.close()
+    _size = os.path.getsize(path)
+
+    # a record torn by a crash while it was written
+    strategy._hold_after_buy_counter = 4
+    checkpoint = Checkpoint(path, every=1)
+    checkpoint.load()
+    checkpoint.save(strategy, 4, 1, 4)
+    checkpoint.close()
+
+    with open(path, "r+b") as f:
+        f.truncate(_size + (os.path.getsize(path) - _size) // 2)
+
+    restored = SampleStrategy(5, 5)
+    assert Checkpoint(path).restore(restored) == (3, 1, 3)
+    assert restored._hold_after_buy_counter == 3
+    # the torn record is truncated so that records are appended after the last complete one
+    assert os.path.getsize(path) == _size
+
+
+def test_corrupt_tail(tmp_path):
+    path = tmp_path / "bot.ckpt"
+    checkpoint = Checkpoint(path, every=1)
+    strategy = SampleStrategy(5, 5)
+
+    checkpoint.save(strategy, 1, 1, 1)
+    checkpoint.save(strategy, 2, 1, 2)
+    checkpoint.close()
+
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        _last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([_last[0] ^ 0xFF]))
+
+    assert Checkpoint(path).load()[1:] == (1, 1, 1)
+
+
+def test_not_a_checkpoint(tmp_path):
+    path = tmp_path / "bot.ckpt"
+    path.write_bytes(b"x" * 64)
+
+    with pytest.raises(ValueError):
+        Checkpoint(path).load()
+
+
+def test_stream_reraises_stop_iteration(tmp_path):
+    stream = CheckpointStream(ListStream([]), SampleStrategy(5, 5), Checkpoint(tmp_path / "bot.ckpt"))
+
+    with pytest.raises(StopIteration):
+        stream.request()
@@ -0,0 +1,82 @@
+import datetime as dt
+
+import pytest
+
+from bot import FanOutBot
+from sample import SampleStrategy
+from strategy import Hold, Strategy
+from strategy.filters import Session
+from tests.conftest import ListStream, datapoints, make_ticks, summary
+
+
+class _EveryOther(SampleStrategy):
+    """
+    SampleStrategy with its own `__feed__()`.
+    """
+
+    def __feed__(self, time, *args) -> bool:
+        return time.second % 2 == 0
+
+
+class _KeyedStrategy(Strategy):
+    feed_filter = Session(dt.time(9), dt.time(10))
+
+    def next(self, symbol, time, price):
+        return Hold()
+
+
+class _RecordingFanOutBot(FanOutBot):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.responses = []
+
+    def handle(self, name, strategy_response) -> None:
+        self.responses.append((name, summary(strategy_response)))
+
+
+def _strategies() -> dict:
+    return {
+        "fast": SampleStrategy(5, 5),
+        "slow": SampleStrategy(40, 10),
+        "other": _EveryOther(10, 3),
+        "fast_again": SampleStrategy(5, 5)
+    }
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+@pytest.mark.parametrize("batch_size", [1, 7, 256])
+def test_modes_match_serial(mode, batch_size):
+    _data = datapoints(make_ticks(3000))
+
+    serial = _RecordingFanOutBot(_strategies(), ListStream(_data))
+    serial.run()
+
+    bot = _RecordingFanOutBot(_strategies(), ListStream(_data), mode=mode, workers=3, batch_size=batch_size)
+    bot.run()
+
+    # the SampleStrategy instances share their filter, _EveryOther evaluates its own `__feed__()`
+    assert serial.filters == 1
+    assert bot.responses == serial.responses
+
+
+def test_serial_matches_separate_strategies():
+    _data = datapoints(make_ticks(3000))
+
+    bot = _RecordingFanOutBot(_strategies(), ListStream(_data))
+    bot.run()
+
+    for name, strategy in _strategies().items():
+        expected = [(name, summary(strategy.next(*_args))) for _args in _data if strategy.__feed__(*_args)]
+
+        assert [_response for _response in bot.responses if _response[0] == name] == expected
+
+
+@pytest.mark.parametrize("mode", ["serial", "thread"])
+def test_keyed_filters(mode):
+    _data = [(_symbol, _time, _price) for _time, _price in datapoints(make_ticks(2000)) for _symbol in ("A", "B")]
+
+    bot = _RecordingFanOutBot([_KeyedStrategy()], ListStream(_data, keyed=True), mode=mode)
+    bot.run()
+
+    assert len(bot.responses) == sum(9 <= _time.hour < 10 for _, _time, _ in _data)
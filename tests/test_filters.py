@@ -0,0 +1,78 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from sample import SampleStrategy
+from strategy import Strategy, Hold
+from strategy.filters import Holidays, Session, Throttle, Weekdays
+
+
+_TIMES = np.datetime64("2024-01-05T07:00") + np.arange(0, 4 * 86_400, 877) * np.timedelta64(1, "s")
+
+_FILTERS = [
+    Session(dt.time(9), dt.time(12)),
+    Session(dt.time(22), dt.time(2)),
+    Session(dt.time(9), dt.time(12), tz=dt.timezone(dt.timedelta(hours=-5))),
+    Weekdays(),
+    Holidays([dt.date(2024, 1, 8)]),
+    Session(dt.time(9), dt.time(17)) & Weekdays()
+]
+
+
+@pytest.mark.parametrize("feed_filter", _FILTERS)
+def test_call_matches_mask(feed_filter):
+    _datetimes = _TIMES.astype("datetime64[us]").tolist()
+    _ns = _TIMES.astype("datetime64[ns]").view(np.int64).tolist()
+
+    _mask = feed_filter.mask(_TIMES).tolist()
+
+    assert [feed_filter(_time) for _time in _datetimes] == _mask
+    assert [feed_filter(_time) for _time in _ns] == _mask
+
+
+def test_session_bounds():
+    session = Session(dt.time(9), dt.time(12))
+
+    assert session(dt.datetime(2024, 1, 2, 9))
+    assert session(dt.datetime(2024, 1, 2, 11, 59, 59, 999_999))
+    assert not session(dt.datetime(2024, 1, 2, 8, 59, 59, 999_999))
+    assert not session(dt.datetime(2024, 1, 2, 12))
+
+
+def test_throttle():
+    throttle = Throttle(dt.timedelta(seconds=10))
+    _start = dt.datetime(2024, 1, 2, 9)
+
+    assert [throttle(_start + dt.timedelta(seconds=_s)) for _s in (0, 5, 10, 15, 21)] == [True, False, True, False, True]
+
+
+class _SessionStrategy(Strategy):
+    feed_filter = Session(dt.time(9), dt.time(12))
+
+    def next(self, *args):
+        return Hold()
+
+
+def test_keyed_feed():
+    strategy = _SessionStrategy()
+
+    assert strategy.__feed__(dt.datetime(2024, 1, 2, 10), 1.0)
+    assert strategy.__feed__("AAPL", dt.datetime(2024, 1, 2, 10), 1.0)
+    assert not strategy.__feed__("AAPL", dt.datetime(2024, 1, 2, 13), 1.0)
+
+
+def test_keyed_next_many():
+    strategy = _SessionStrategy()
+    _symbols = np.array(["A", "B"] * (len(_TIMES) // 2) + ["A"] * (len(_TIMES) % 2), dtype=object)
+
+    assert len(strategy.next_many(_TIMES, np.ones(len(_TIMES)), _symbols)) == int(strategy.feed_filter.mask(_TIMES).sum())
+
+
+def test_sample_session_excludes_its_bounds():
+    strategy = SampleStrategy()
+
+    assert not strategy.__feed__(dt.datetime(2024, 1, 2, 9), 1.0)
+    assert strategy.__feed__(dt.datetime(2024, 1, 2, 9, 0, 0, 1), 1.0)
+    assert strategy.__feed__(dt.datetime(2024, 1, 2, 11, 59, 59, 999_999), 1.0)
+    assert not strategy.__feed__(dt.datetime(2024, 1, 2, 12), 1.0)
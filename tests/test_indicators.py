@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+import pytest
+
+from strategy.indicators import ATR, EMA, RSI, SMA, VWAP, RollingMax, RollingMin, RollingVariance
+
+
+_RNG = np.random.default_rng(0)
+_PRICES = 100 + np.cumsum(_RNG.normal(0, 0.5, 500))
+_VOLUMES = _RNG.uniform(1, 10, 500)
+
+
+def _updates(indicator, *values) -> list:
+    return [indicator.update(*_args) for _args in zip(*[_v.tolist() for _v in values])]
+
+
+def _windows(values: np.ndarray, window: int) -> np.ndarray:
+    return np.lib.stride_tricks.sliding_window_view(values, window)
+
+
+@pytest.mark.parametrize("indicator, reference", [
+    (SMA(20), lambda _v: _v.mean(axis=1)),
+    (RollingMax(20), lambda _v: _v.max(axis=1)),
+    (RollingMin(20), lambda _v: _v.min(axis=1)),
+    (RollingVariance(20), lambda _v: _v.var(axis=1, ddof=1)),
+    (RollingVariance(20, ddof=0), lambda _v: _v.var(axis=1))
+])
+def test_rolling_indicators(indicator, reference):
+    values = _updates(indicator, _PRICES)
+
+    assert all(_value != _value for _value in values[:19])
+    assert values[19:] == pytest.approx(reference(_windows(_PRICES, 20)).tolist(), rel=1e-9)
+
+
+def test_ema():
+    ema = EMA(10)
+    values = _updates(ema, _PRICES)
+    expected = _PRICES[0]
+
+    for _price, _value in zip(_PRICES.tolist()[1:], values[1:]):
+        expected += 2 / 11 * (_price - expected)
+
+    assert values[-1] == pytest.approx(expected)
+    assert all(_value != _value for _value in values[:9]) and ema.ready
+
+
+def test_vwap():
+    values = _updates(VWAP(20), _PRICES, _VOLUMES)
+    pv = _windows(_PRICES * _VOLUMES, 20).sum(axis=1) / _windows(_VOLUMES, 20).sum(axis=1)
+
+    assert values[19:] == pytest.approx(pv.tolist())
+    assert VWAP().update_many(_PRICES, _VOLUMES) == pytest.approx((_PRICES * _VOLUMES).sum() / _VOLUMES.sum())
+
+
+def test_rsi_bounds():
+    rsi = RSI(14)
+
+    assert all(0 <= _value <= 100 for _value in _updates(rsi, _PRICES)[15:])
+    assert RSI(3).update_many(np.arange(10.0)) == 100.0
+    assert RSI(3).update_many(np.full(10, 5.0)) == 50.0
+
+
+def test_atr_of_ticks_and_bars():
+    assert ATR(5).update_many(np.full(10, 5.0)) == 0.0
+    assert ATR(2).update_many([3.0, 4.0], [1.0, 2.0], [2.0, 3.0]) == pytest.approx(2.0)
+
+
+def test_update_many_matches_update():
+    for indicator_class in (SMA, EMA, RollingMax, RollingVariance, RSI, ATR):
+        assert indicator_class(14).update_many(_PRICES) == _updates(indicator_class(14), _PRICES)[-1]
+
+
+def test_sma_does_not_drift():
+    # large offsets with small increments lose low order bits in an uncompensated running sum
+    values = 1e9 + _RNG.normal(0, 1e-3, 200_000)
+    sma = SMA(50)
+    sma.update_many(values)
+
+    assert sma.value == math.fsum(values[-50:].tolist()) / 50
+
+
+def test_window_validation():
+    with pytest.raises(ValueError):
+        SMA(0)
+
+    with pytest.raises(ValueError):
+        RollingVariance(1)
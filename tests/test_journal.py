@@ -0,0 +1,133 @@
+import datetime as dt
+import os
+
+import pytest
+
+from backtest import ReplayStream
+from bot import Journal, JournalingBot, iter_journal
+from brokers import Fill, Order, SimulatedBroker
+from sample import SampleStrategy
+from strategy import Buy, Hold, Sell
+from tests.conftest import RecordingBot
+
+
+def _responses(n: int) -> list:
+    return [(Buy if _i % 2 == 0 else Sell)(dt.datetime(2024, 1, 2, 9, 0, _i % 60), 100.0 + _i, "AAPL", uid=_i)
+            for _i in range(n)]
+
+
+def _summary(record) -> tuple:
+    if isinstance(record, Fill):
+        return "FILL", record.uid, record.side, record.quantity, record.price, record.remaining, record.ticker, record.time
+
+    return record.command, record.time, record.price, record.ticker, record.exchange, record.uid
+
+
+def test_round_trip(tmp_path):
+    _records = _responses(10) + [Fill(1, "BUY", 2.0, 101.5, 0.0, "AAPL", dt.datetime(2024, 1, 2, tzinfo=dt.timezone.utc))]
+
+    with Journal(tmp_path) as journal:
+        assert [journal.append(_record) for _record in _records] == list(range(len(_records)))
+        assert journal.sync(timeout=10)
+
+    _read = list(iter_journal(tmp_path))
+
+    assert [_sequence for _sequence, _ in _read] == list(range(len(_records)))
+    # naive times are read as UTC
+    assert [_summary(_record) for _, _record in _read][:2] == [
+        ("BUY", dt.datetime(2024, 1, 2, 9, tzinfo=dt.timezone.utc), 100.0, "AAPL", None, 0),
+        ("SELL", dt.datetime(2024, 1, 2, 9, 0, 1, tzinfo=dt.timezone.utc), 101.0, "AAPL", None, 1)
+    ]
+    assert _summary(_read[-1][1]) == _summary(_records[-1])
+    assert [_sequence for _sequence, _ in iter_journal(tmp_path, start=7)] == list(range(7, len(_records)))
+
+
+def test_torn_tail(tmp_path):
+    with Journal(tmp_path) as journal:
+        for _record in _responses(5):
+            journal.append(_record)
+
+    (_path,) = tmp_path.glob("*.journal")
+    _size = os.path.getsize(_path)
+
+    # a record torn by a crash while it was written
+    with open(_path, "ab") as f:
+        f.write(b"\x30\x00\x00\x00\x12\x34")
+
+    with Journal(tmp_path) as journal:
+        assert os.path.getsize(_path) == _size
+        assert journal.append(Hold(price=1.0)) == 5
+
+    assert [_sequence for _sequence, _ in iter_journal(tmp_path)] == list(range(6))
+
+
+def test_corrupt_tail(tmp_path):
+    with Journal(tmp_path) as journal:
+        for _record in _responses(5):
+            journal.append(_record)
+
+    (_path,) = tmp_path.glob("*.journal")
+
+    with open(_path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        _last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([_last[0] ^ 0xFF]))
+
+    with Journal(tmp_path) as journal:
+        assert journal.appended == 4
+
+    assert [_sequence for _sequence, _ in iter_journal(tmp_path)] == list(range(4))
+
+
+@pytest.mark.parametrize("sync_every", [None, 1000])
+def test_rotation_within_batch(tmp_path, sync_every):
+    _segment_size = 1024
+
+    with Journal(tmp_path, sync_every=sync_every, sync_interval=None, segment_size=_segment_size) as journal:
+        # a single batch of records many times the segment size
+        for _record in _responses(200):
+            journal.append(_record)
+
+    _segments = sorted(tmp_path.glob("*.journal"))
+    _read = list(iter_journal(tmp_path))
+    _record_size = (os.path.getsize(_segments[0]) - 16) // int(_segments[1].stem)
+
+    assert len(_segments) >= 200 * _record_size // _segment_size
+    # every segment but the last ends at the first record reaching the segment size
+    assert all(_segment_size <= os.path.getsize(_path) < _segment_size + _record_size for _path in _segments[:-1])
+    assert [_sequence for _sequence, _ in _read] == list(range(200))
+
+
+def test_bot_journals_orders_and_fills(tmp_path, tick_path):
+    fills = []
+
+    class _TradingBot(RecordingBot):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+
+            self.broker = SimulatedBroker(JournalingBot(self.journal, fills.append))
+            self.uid = 0
+            self.orders = 0
+
+        def handle(self, strategy_response) -> None:
+            super().handle(strategy_response)
+
+            if not strategy_response is None and strategy_response.command != "HOLD":
+                self.uid += 1
+                self.orders += 1
+                self.broker.place_order(Order(self.uid, strategy_response.command, ticker=None))
+                self.broker.on_tick(None, dt.datetime(2024, 1, 2), 100.0)
+
+    with Journal(tmp_path / "journal") as journal:
+        bot = _TradingBot(SampleStrategy(5, 5), ReplayStream(tick_path), journal=journal)
+        bot.run()
+
+    _records = [_record for _, _record in iter_journal(tmp_path / "journal")]
+    _orders = [_record for _record in _records if not isinstance(_record, Fill)]
+
+    assert bot.orders > 0
+    # 'HOLD' responses are not journaled
+    assert [_record.command for _record in _orders] == [_command for _command, _ in bot.responses if _command != "HOLD"]
+    assert [_summary(_record) for _record in _records if isinstance(_record, Fill)] == [_summary(_fill) for _fill in fills]
+    assert len(fills) == bot.orders
@@ -0,0 +1,71 @@
+import datetime as dt
+import gzip
+import io
+
+import pytest
+
+from strategy import Buy, Hold, Sell, iter_responses_jsonl, write_responses_jsonl
+from strategy.protocol import base
+
+
+_UTC = dt.timezone.utc
+_RESPONSES = [
+    Buy(dt.datetime(2024, 1, 2, 9, 30, tzinfo=_UTC), 101.5, "AAPL", uid=1),
+    Sell(dt.datetime(2024, 1, 2, 9, 31, 0, 250_000, tzinfo=_UTC), 102.0, "AAPL", "NASDAQ", 1),
+    Hold(),
+    Buy(None, None, "MSFT", uid=2)
+]
+
+
+def _fields(response) -> tuple:
+    return response.command, str(response.time), str(response.price), response.ticker, response.exchange, response.uid
+
+
+@pytest.mark.parametrize("name", ["responses.jsonl", "responses.jsonl.gz"])
+def test_path_round_trip(tmp_path, name):
+    path = tmp_path / name
+
+    assert write_responses_jsonl(iter(_RESPONSES), path) == len(_RESPONSES)
+    assert [_fields(_r) for _r in iter_responses_jsonl(path)] == [_fields(_r) for _r in _RESPONSES]
+
+    if name.endswith(".gz"):
+        with gzip.open(path, "rt") as f:
+            assert len(f.readlines()) == len(_RESPONSES)
+
+
+def test_append(tmp_path):
+    path = tmp_path / "responses.jsonl"
+
+    write_responses_jsonl(_RESPONSES[:2], path)
+    write_responses_jsonl(_RESPONSES[2:], path, append=True)
+
+    assert [_fields(_r) for _r in iter_responses_jsonl(str(path))] == [_fields(_r) for _r in _RESPONSES]
+
+
+@pytest.mark.parametrize("buffer", [io.StringIO, io.BytesIO])
+def test_file_object_round_trip(buffer):
+    f = buffer()
+
+    write_responses_jsonl(_RESPONSES, f)
+    f.seek(0)
+
+    assert [_fields(_r) for _r in iter_responses_jsonl(f)] == [_fields(_r) for _r in _RESPONSES]
+    assert not f.closed
+
+
+def test_blocks_and_blank_lines(monkeypatch):
+    monkeypatch.setattr(base, "JSONL_BLOCK_SIZE", 3)
+    responses = [Buy(None, float(_i), uid=_i) for _i in range(10)]
+    f = io.StringIO()
+
+    assert write_responses_jsonl(responses, f) == 10
+
+    lines = f.getvalue().splitlines()
+    f = io.StringIO("\n" + "\n\n".join(lines) + "\n\n")
+
+    assert [_fields(_r) for _r in iter_responses_jsonl(f)] == [_fields(_r) for _r in responses]
+
+
+def test_nan_prices():
+    with pytest.raises(ValueError):
+        write_responses_jsonl([Hold()], io.StringIO(), allow_nan=False)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from bot.metrics import PROMETHEUS_BUCKETS, BotMetrics, LatencyHistogram
+
+
+_VALUES = np.random.default_rng(0).lognormal(10, 2, 20_000).astype(np.int64).tolist()
+
+
+def _nearest_rank(values: list, q: float) -> int:
+    return sorted(values)[int(max(1, -(-len(values) * q // 100))) - 1]
+
+
+@pytest.mark.parametrize("precision", [2, 7, 12])
+@pytest.mark.parametrize("q", [0, 1, 25, 50, 90, 99, 99.9, 100])
+def test_percentiles_within_precision(precision, q):
+    histogram = LatencyHistogram(precision)
+
+    for _value in _VALUES:
+        histogram.record(_value)
+
+    expected = _nearest_rank(_VALUES, q)
+
+    assert expected <= histogram.percentile(q) <= expected * (1 + 2 ** (1 - precision))
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram(4)
+
+    for _value in range(16):
+        histogram.record(_value)
+
+    assert [histogram.percentile(_q) for _q in (1, 50, 100)] == [0, 7, 15]
+
+
+def test_summary():
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) is None and histogram.min is None
+
+    for _value in (-5, 10, 1 << 50):
+        histogram.record(_value)
+
+    assert (histogram.count, histogram.min, histogram.max) == (3, 0, 1 << 40)
+    assert histogram.sum == 10 + (1 << 40)
+    assert histogram.snapshot()["p999"] == 1 << 40
+
+    histogram.reset()
+
+    assert histogram.count == 0 and histogram.percentile(99) is None
+
+
+def test_cumulative_counts():
+    histogram = LatencyHistogram()
+
+    for _value in _VALUES:
+        histogram.record(_value)
+
+    # bounds rounded to bucket boundaries are exact at the highest value of a bucket
+    bounds = [(1 << _shift) - 1 for _shift in range(8, 30, 3)]
+    counts = histogram.cumulative(bounds)
+
+    assert counts == sorted(counts)
+    assert counts == [sum(_value <= _bound for _value in _VALUES) for _bound in bounds]
+
+
+def test_prometheus(tmp_path):
+    metrics = BotMetrics()
+    metrics.histograms["next"].record(3_000)
+    metrics.write_prometheus(tmp_path / "bot.prom", prefix="test")
+    text = (tmp_path / "bot.prom").read_text()
+
+    assert 'test_stage_seconds_bucket{stage="next",le="2.5e-06"} 0' in text
+    assert 'test_stage_seconds_bucket{stage="next",le="5e-06"} 1' in text
+    assert 'test_stage_seconds_count{stage="next"} 1' in text
+    assert text.count("_bucket{") == 4 * (len(PROMETHEUS_BUCKETS) + 1)
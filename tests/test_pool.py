@@ -0,0 +1,90 @@
+import datetime as dt
+import threading
+
+from bot import BotPool, DataStream
+from strategy import Hold, Strategy
+
+
+class _Echo(Strategy):
+    def next(self, time, price):
+        return Hold(time, price)
+
+
+def _echo(ticker: str) -> Strategy:
+    return _Echo()
+
+
+class _QuietStream(DataStream):
+    """
+    Keyed stream returning `ticks` ticks, then waiting for their responses before it is exhausted.
+    """
+
+    keyed = True
+
+    def __init__(self, ticks: list, timeout: float = 10.0) -> None:
+        super().__init__()
+
+        self._ticks = iter(ticks)
+        self._timeout = timeout
+        self.handled = threading.Event()
+        self.waited = None
+
+    def request(self):
+        try:
+            return next(self._ticks)
+        except StopIteration:
+            self.waited = self.handled.wait(self._timeout)
+
+            raise
+
+
+class _RecordingPool(BotPool):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.responses = []
+
+    def handle(self, ticker, strategy_response) -> None:
+        self.responses.append((ticker, strategy_response.time, strategy_response.price))
+
+        if len(self.responses) == len(self.data_stream._expected):
+            self.data_stream.handled.set()
+
+
+_TICKS = [(_ticker, dt.datetime(2024, 1, 2, 9, 0, _second), float(_second))
+          for _second in range(20) for _ticker in ("A", "B", "C")]
+
+
+def _pool(ticks: list, timeout: float = 10.0, **kwargs) -> _RecordingPool:
+    stream = _QuietStream(ticks, timeout)
+    stream._expected = ticks
+
+    return _RecordingPool(_echo, stream, workers=2, **kwargs)
+
+
+def test_responses_in_order():
+    pool = _pool(_TICKS, batch_size=4)
+    pool.run()
+
+    assert pool.data_stream.waited
+
+    for _ticker in ("A", "B", "C"):
+        assert [_r for _r in pool.responses if _r[0] == _ticker] == [_t for _t in _TICKS if _t[0] == _ticker]
+
+
+def test_max_delay():
+    pool = _pool(_TICKS[:3], max_delay=dt.timedelta(milliseconds=5))
+    pool.run()
+
+    # the ticks are handled while the stream is still waiting
+    assert pool.data_stream.waited
+    assert len(pool.responses) == 3
+
+
+def test_full_batches_only():
+    pool = _pool(_TICKS[:3], timeout=0.2, max_delay=None)
+    pool.run()
+
+    # the ticks are only sent when the pool shuts down
+    assert not pool.data_stream.waited
+    assert len(pool.responses) == 3
@@ -0,0 +1,107 @@
+import datetime as dt
+
+from brokers import Bot, FixedLatency, FixedSlippage, Order, SimulatedBroker
+from strategy import Buy, Sell
+
+
+_T0 = dt.datetime(2024, 1, 2, 9)
+
+
+def _at(seconds: float) -> dt.datetime:
+    return _T0 + dt.timedelta(seconds=seconds)
+
+
+def _broker(**kwargs) -> tuple[SimulatedBroker, list]:
+    fills = []
+
+    return SimulatedBroker(Bot(fills.append), **kwargs), fills
+
+
+def _summary(fills: list) -> list:
+    return [(_fill.uid, _fill.side, _fill.quantity, _fill.price, _fill.remaining) for _fill in fills]
+
+
+def test_market_orders_fill_at_the_next_tick():
+    broker, fills = _broker(slippage=FixedSlippage(0.01))
+
+    broker.on_tick("A", _at(0), 100.0)
+    broker.place_order(Buy(ticker="A", uid=1))
+    broker.place_order(Order(2, "SELL", ticker="A"))
+    assert fills == []
+
+    broker.on_tick("B", _at(1), 50.0)
+    assert fills == []
+
+    broker.on_tick("A", _at(2), 101.0)
+    assert _summary(fills) == [(1, "BUY", 1.0, 101.0 * 1.01, 0.0), (2, "SELL", 1.0, 101.0 * 0.99, 0.0)]
+    assert broker.idle
+
+
+def test_limit_orders_price_time_priority():
+    broker, fills = _broker()
+
+    broker.place_order(Order(1, "BUY", 2.0, price=99.0, ticker="A"), time=_at(0))
+    broker.place_order(Order(2, "BUY", 1.0, price=100.0, ticker="A"), time=_at(0))
+    broker.place_order(Order(3, "BUY", 1.0, price=99.0, ticker="A"), time=_at(0))
+    broker.on_tick("A", _at(0), 101.0)
+
+    assert fills == []
+    assert broker.book("A").best_bid == 100.0
+
+    # best price first, then first in first out at the same price, resting orders execute at their limit price
+    broker.on_tick("A", _at(1), 98.0, volume=3.0)
+    assert _summary(fills) == [(2, "BUY", 1.0, 100.0, 0.0), (1, "BUY", 2.0, 99.0, 0.0)]
+
+    broker.on_tick("A", _at(2), 98.0, volume=0.5)
+    broker.on_tick("A", _at(3), 98.0, volume=0.5)
+    assert _summary(fills[2:]) == [(3, "BUY", 0.5, 99.0, 0.5), (3, "BUY", 0.5, 99.0, 0.0)]
+    assert broker.idle
+
+
+def test_orders_entering_the_book_fill_at_the_tick_price():
+    broker, fills = _broker()
+
+    broker.place_order(Order(1, "SELL", price=100.0, ticker="A"), time=_at(0))
+    broker.on_tick("A", _at(0), 102.0)
+
+    assert _summary(fills) == [(1, "SELL", 1.0, 102.0, 0.0)]
+
+
+def test_latency_and_cancel():
+    broker, fills = _broker(latency=FixedLatency(dt.timedelta(seconds=1)))
+
+    broker.place_order(Order(1, "BUY", ticker="A"), time=_at(0))
+    broker.place_order(Order(2, "BUY", ticker="A"), time=_at(0))
+    broker.on_tick("A", _at(0.5), 100.0)
+    assert fills == []
+
+    assert broker.cancel(2)
+    assert not broker.cancel(2)
+
+    broker.on_tick("A", _at(1), 101.0)
+    assert _summary(fills) == [(1, "BUY", 1.0, 101.0, 0.0)]
+    assert broker.idle
+
+
+def test_buy_and_sell_with_the_same_uid():
+    broker, fills = _broker()
+
+    broker.place_order(Buy(ticker="A", uid=5), time=_at(0))
+    broker.place_order(Sell(ticker="A", uid=5), time=_at(0))
+    broker.on_tick("A", _at(1), 100.0)
+
+    assert _summary(fills) == [(5, "BUY", 1.0, 100.0, 0.0), (5, "SELL", 1.0, 100.0, 0.0)]
+    assert broker.idle
+
+
+def test_cancel_by_side():
+    broker, fills = _broker()
+
+    broker.place_order(Order(5, "BUY", price=90.0, ticker="A"), time=_at(0))
+    broker.place_order(Order(5, "SELL", price=110.0, ticker="A"), time=_at(0))
+
+    assert broker.cancel(5, "SELL")
+    assert not broker.cancel(5, "SELL")
+    assert not broker.idle
+    assert broker.cancel(5)
+    assert broker.idle
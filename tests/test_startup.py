@@ -0,0 +1,66 @@
+import importlib
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+from _utils.startup import STARTUP_BUDGET, STARTUP_MODULES, import_time, main, statement_time
+
+
+@pytest.mark.parametrize("package", ["_utils", *STARTUP_MODULES])
+def test_exports(package):
+    module = importlib.import_module(package)
+    namespace = {}
+
+    exec(f"from {package} import *", namespace)
+
+    assert set(module.__all__) <= set(dir(module))
+    assert set(module.__all__) <= set(namespace)
+
+
+def test_startup_budget():
+    assert statistics.median(import_time(STARTUP_MODULES, runs=5)) <= STARTUP_BUDGET
+
+
+@pytest.mark.parametrize("statement", ["from bot import Bot", "from bot import Bot; from strategy import Buy, Strategy"])
+def test_bot_startup_budget(statement):
+    assert statistics.median(statement_time(statement, runs=5)) <= STARTUP_BUDGET
+
+
+_PLAIN_RUN = '''
+import sys
+from bot import Bot, DataStream
+from strategy import Hold, Strategy
+
+class Echo(Strategy):
+    def next(self, time, price):
+        return Hold()
+
+class Stream(DataStream):
+    def __init__(self):
+        self._ticks = iter(range(10))
+
+    def request(self):
+        return next(self._ticks), 1.0
+
+class Plain(Bot):
+    def handle(self, strategy_response):
+        pass
+
+Plain(Echo(), Stream()).run()
+print("numpy" in sys.modules)
+'''
+
+
+def test_plain_run_without_numpy():
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _run = subprocess.run([sys.executable, "-c", _PLAIN_RUN], cwd=_root, check=True, capture_output=True, text=True)
+
+    assert _run.stdout.strip() == "False"
+
+
+def test_budget_exceeded(capsys):
+    assert main(["--budget", "0", "--runs", "1", "strategy"]) == 1
+    assert main(["--budget", "10", "--runs", "1", "strategy"]) == 0
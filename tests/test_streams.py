@@ -0,0 +1,80 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from bot.streams import BarStream, ConflatingStream, SamplingStream
+from tests.conftest import ListStream
+
+
+_UTC = dt.timezone.utc
+_START = dt.datetime(2024, 1, 2, 9, 0, 7, tzinfo=_UTC)
+_TICKS = [(_START + dt.timedelta(seconds=17 * _i), 100.0 + (_i * 7) % 5, 1.0 + _i % 3) for _i in range(50)]
+
+
+def _ns(time: dt.datetime) -> int:
+    return (time - dt.datetime(1970, 1, 1, tzinfo=_UTC)) // dt.timedelta(microseconds=1) * 1000
+
+
+def _drain(stream) -> list:
+    out = []
+
+    while True:
+        try:
+            out.append(stream.request())
+        except StopIteration:
+            return out
+
+
+def test_bars():
+    bars = _drain(BarStream(ListStream(_TICKS), dt.timedelta(minutes=1)))
+
+    assert [bar[0] for bar in bars] == [_START.replace(second=0) + dt.timedelta(minutes=_i) for _i in range(len(bars))]
+    assert sum(bar[5] for bar in bars) == pytest.approx(sum(tick[2] for tick in _TICKS))
+
+    first = [tick for tick in _TICKS if tick[0] < _START.replace(second=0) + dt.timedelta(minutes=1)]
+
+    assert bars[0][1:5] == (first[0][1], max(tick[1] for tick in first), min(tick[1] for tick in first), first[-1][1])
+
+
+def test_int_ns_bars():
+    bars = _drain(BarStream(ListStream(_TICKS), dt.timedelta(minutes=1)))
+    ns_bars = _drain(BarStream(ListStream([(_ns(time), price, volume) for time, price, volume in _TICKS]), dt.timedelta(minutes=1)))
+
+    assert all(type(bar[0]) is int for bar in ns_bars)
+    assert ns_bars == [(_ns(bar[0]), *bar[1:]) for bar in bars]
+
+
+def test_keyed_int_ns_bars():
+    ticks = [(f"S{_i % 2}", _ns(time), price) for _i, (time, price, _) in enumerate(_TICKS)]
+    bars = _drain(BarStream(ListStream(ticks, keyed=True), dt.timedelta(minutes=2), keyed=True))
+
+    for symbol in ("S0", "S1"):
+        starts = [bar[1] for bar in bars if bar[0] == symbol]
+
+        assert starts == sorted(starts)
+        assert all(_start % (120 * 10 ** 9) == 0 for _start in starts)
+        assert sum(bar[6] for bar in bars if bar[0] == symbol) == 0
+
+
+def test_sampling():
+    ticks = [(f"S{_i % 2}", time, price) for _i, (time, price, _) in enumerate(_TICKS)]
+
+    assert _drain(SamplingStream(ListStream(_TICKS), 5)) == _TICKS[4::5]
+    # every fifth tick of each symbol, in stream order
+    assert _drain(SamplingStream(ListStream(ticks, keyed=True), 5, keyed=True)) == sorted(ticks[8::10] + ticks[9::10], key=ticks.index)
+
+
+def test_conflating_keeps_the_latest_datapoint():
+    ticks = [(f"S{_i % 3}", _ns(time), price) for _i, (time, price, _) in enumerate(_TICKS)]
+    stream = ConflatingStream(ListStream(ticks, keyed=True), keyed=True)
+    stream._thread.join()
+
+    chunk = stream.request_many(10)
+
+    assert list(chunk.symbols) == ["S0", "S1", "S2"]
+    assert chunk.times.tolist() == [ticks[_i][1] for _i in (48, 49, 47)]
+    assert stream.conflated == len(ticks) - 3
+
+    with pytest.raises(StopIteration):
+        stream.request()
@@ -0,0 +1,55 @@
+import pytest
+
+from backtest import Backtester, Sweep, grid
+from sample import SampleStrategy
+from tests.conftest import make_ticks
+
+
+def trade_count(result) -> float:
+    return float(len(result.trades))
+
+
+def test_scores_match_backtests(tmp_path):
+    data = make_ticks(5000)
+    params = grid({"window": [5, 20], "hold": [5, 10]})
+
+    with Sweep(SampleStrategy, data, workers=2, cache=tmp_path / "sweep.json") as sweep:
+        results = sweep.run(params)
+
+    assert len(results) == 4
+
+    for result in results:
+        assert result.score == Backtester(SampleStrategy(**result.params), data).run().pnl
+
+
+def test_cache_is_keyed_by_metric(tmp_path):
+    data = make_ticks(5000)
+    params = grid({"window": [5, 20], "hold": [5]})
+
+    with Sweep(SampleStrategy, data, workers=1, cache=tmp_path / "sweep.json") as sweep:
+        pnl = {str(_r.params): _r.score for _r in sweep.run(params)}
+
+    with Sweep(SampleStrategy, data, workers=1, metric=trade_count, cache=tmp_path / "sweep.json") as sweep:
+        counts = {str(_r.params): _r.score for _r in sweep.run(params)}
+
+    for _params in params:
+        assert counts[str(_params)] == len(Backtester(SampleStrategy(**_params), data).run().trades)
+        assert pnl[str(_params)] != counts[str(_params)]
+
+
+@pytest.mark.parametrize("count, n", [(20_000, 9), (20_000, 10), (5_000, 2), (1_000, 30)])
+def test_successive_halving_ends_over_every_tick(count, n):
+    data = make_ticks(count)
+    params = [{"window": 5 + _i, "hold": 5} for _i in range(n)]
+    rounds = []
+
+    with Sweep(SampleStrategy, data, workers=2) as sweep:
+        _run = sweep.run
+        sweep.run = lambda _params, ticks=None: rounds.append((len(_params), ticks)) or _run(_params, ticks)
+        results = sweep.successive_halving(params)
+
+    assert results[0].ticks == count
+    assert rounds[-1][1] == count
+    assert results[0].score == Backtester(SampleStrategy(**results[0].params), data).run().pnl
+    # every round is over more ticks than the previous one, with fewer sets
+    assert all(_a[1] < _b[1] and _a[0] >= _b[0] for _a, _b in zip(rounds, rounds[1:]))
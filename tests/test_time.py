@@ -0,0 +1,70 @@
+import datetime as dt
+
+import pytest
+from dateutil.parser import parse
+
+from _utils import time as time_utils
+from _utils.time import epoch_ns, parse_time, parse_times, set_time_cache
+
+
+_TIMESTAMPS = [
+    "2024-01-02",
+    "2024-01-02T09:30",
+    "2024-01-02 09:30:00",
+    "2024-01-02T09:30:00.123456",
+    "2024-01-02T09:30:00.5Z",
+    "2024-01-02T09:30:00+05:30",
+    "2024-01-02T09:30:00-04:00",
+    "20240102",
+    "20240102 09:30:00",
+    "20240102-09:30:00.123",
+    "20240102T09:30:00Z",
+    "2024/01/02 09:30:00",
+    "2024/01/02 09:30"
+]
+
+
+@pytest.mark.parametrize("timestr", _TIMESTAMPS)
+def test_fast_path_matches_dateutil(timestr):
+    assert time_utils._parse_fast(timestr) == parse(timestr)
+    assert parse_time(timestr).utcoffset() == parse(timestr).utcoffset()
+
+
+def test_nanosecond_fractions_are_truncated():
+    assert parse_time("20240102-09:30:00.123456789") == dt.datetime(2024, 1, 2, 9, 30, 0, 123_456)
+
+
+@pytest.mark.parametrize("timestr", ["Jan 2 2024 9:30", "2 January 2024", "09:30 2024-01-02"])
+def test_dateutil_fallback(timestr):
+    assert time_utils._parse_fast(timestr) is None
+    assert parse_time(timestr) == parse(timestr)
+
+
+def test_kwargs_use_dateutil():
+    assert parse_time("02/01/2024", dayfirst=True) == dt.datetime(2024, 1, 2)
+
+
+def test_cache():
+    set_time_cache(2)
+
+    try:
+        assert parse_time("2024-01-02") is parse_time("2024-01-02")
+        assert time_utils._parse_fast_cached.cache_info().maxsize == 2
+
+        set_time_cache(0)
+
+        assert parse_time("2024-01-02") == dt.datetime(2024, 1, 2)
+        assert not hasattr(time_utils._parse_fast_cached, "cache_info")
+    finally:
+        set_time_cache(time_utils.TIME_CACHE_SIZE)
+
+
+def test_parse_times():
+    timestrs = ["20240102 09:30:00", "2024-01-02T09:31:00Z", "20240102 09:30:00"]
+
+    assert parse_times(timestrs) == [parse_time(_t) for _t in timestrs]
+
+
+def test_epoch_ns():
+    assert epoch_ns(dt.datetime(1970, 1, 1, 0, 0, 1)) == 10 ** 9
+    assert epoch_ns(dt.datetime(1970, 1, 1, 1, tzinfo=dt.timezone(dt.timedelta(hours=1)))) == 0
@@ -0,0 +1,50 @@
+import math
+
+from strategy import Buy, Hold, Sell, Trades
+
+
+def test_fifo_and_uid_pairing():
+    trades = Trades()
+
+    trades.update(Buy(price=10.0, ticker="A"))
+    trades.update(Buy(price=11.0, ticker="A", uid=1))
+    trades.update(Buy(price=12.0, ticker="A"))
+    trades.update(Sell(price=15.0, ticker="A", uid=1))
+    trades.update(Sell(price=13.0, ticker="A"))
+
+    assert trades.open_count == 1
+    assert trades.closed["entry_price"].tolist() == [11.0, 10.0]
+    assert trades.realized("A") == 7.0
+    assert trades.unrealized("A") == 1.0
+
+
+def test_priceless_buy_uses_the_mark():
+    trades = Trades()
+
+    trades.update(Hold(price=20.0, ticker="A"))
+    trade = trades.update(Buy(ticker="A"))
+
+    assert trade.entry_price == 20.0
+    trades.update(Sell(ticker="A", price=21.0))
+    assert trades.realized("A") == 1.0
+
+
+def test_priceless_orders_without_mark_are_ignored():
+    trades = Trades()
+
+    assert trades.update(Buy(ticker="A")) is None
+    assert trades.open_count == 0
+
+    trades.update(Buy(ticker="A", price=5.0))
+    trades.update(Buy(ticker="B", price=7.0, uid=3))
+    assert trades.update(Sell(ticker="C", uid=3)).exit_price == 7.0
+
+    trades.mark("A", float("nan"))
+    assert trades.update(Sell(ticker="A")) is None
+    assert trades.open_count == 1
+
+    trades.mark("A", 6.0)
+    assert trades.update(Sell(ticker="A")).exit_price == 6.0
+    assert trades.open_count == 0
+    assert not math.isnan(trades.realized()) and trades.realized() == 1.0
+    assert trades.unrealized() == 0.0
@@ -0,0 +1,65 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from backtest import Backtester
+from strategy import VectorStrategy
+from strategy.filters import Session
+
+
+class Momentum(VectorStrategy):
+    """
+    BUY when the price rose over the last `lookback` ticks, SELL when it fell, HOLD before `lookback` ticks.
+    """
+
+    lookback = 3
+
+    def generate(self, times, prices):
+        commands = np.zeros(len(prices), dtype=np.uint8)
+        change = prices[self.lookback:] - prices[:-self.lookback]
+        commands[self.lookback:] = np.where(change > 0, 1, np.where(change < 0, 2, 0))
+
+        return commands
+
+
+class SessionMomentum(Momentum):
+    feed_filter = Session(dt.time(9), dt.time(9, 10))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_chunked_backtest_matches_whole_backtest(ticks, chunk_size):
+    whole = Backtester(Momentum(), ticks, keep_holds=True).run()
+    chunked = Backtester(Momentum(), ticks, chunk_size=chunk_size, keep_holds=True).run()
+
+    assert chunked.responses.command.tolist() == whole.responses.command.tolist()
+    assert chunked.responses.command.tolist() == Momentum().generate(ticks.time, ticks.price).tolist()
+
+
+def test_next_many_keeps_lookback_across_chunks(ticks):
+    strategy = Momentum()
+    commands = []
+
+    for start, stop in [(0, 2), (2, 3), (3, 50), (50, len(ticks))]:
+        commands += strategy.next_many(ticks.time[start:stop], ticks.price[start:stop]).command.tolist()
+
+    assert commands == Momentum().generate(ticks.time, ticks.price).tolist()
+
+
+def test_next_matches_next_many(ticks):
+    strategy = Momentum()
+    times = ticks.time[:200].astype("datetime64[us]").tolist()
+    commands = [strategy.next(_time, _price).command for _time, _price in zip(times, ticks.price[:200].tolist())]
+
+    assert commands == [("HOLD", "BUY", "SELL")[_c] for _c in Momentum().next_many(ticks.time[:200], ticks.price[:200]).command]
+
+
+def test_feed_filter(ticks):
+    strategy = SessionMomentum()
+    mask = strategy.feed_mask(ticks.time, ticks.price)
+    result = Backtester(SessionMomentum(), ticks, chunk_size=5, keep_holds=True).run()
+
+    assert 0 < mask.sum() < len(ticks)
+    assert result.fed == mask.sum()
+    assert result.responses.command.tolist() == Momentum().generate(ticks.time[mask], ticks.price[mask]).tolist()
+    assert len(strategy.next_many(ticks.time, ticks.price)) == mask.sum()